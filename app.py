@@ -1,9 +1,27 @@
 import streamlit as st
+import functools
 import time
+import uuid
 from datetime import datetime
-from utils.ai_generator import generate_portfolio_html, test_api_key
-from utils.templates import get_color_schemes, get_font_pairs
-import base64
+from utils.ai_generator import generate_portfolio_html, stream_portfolio_html
+from utils.providers import cancel_scope
+from utils.validation import validate_api_key_async
+from utils.templates import get_color_schemes, get_font_pairs, get_layout_styles
+from utils.cache import get_generation_cache
+from utils.renderer import render_portfolio_html
+from utils.prompts import build_prompt
+from utils.optimizer import optimize_html
+from utils.artifacts import store_artifact, artifact_url, start_artifact_server
+from utils.sections import generate_portfolio_html_parallel, regenerate_changed_sections, fingerprint_sections
+from utils.routing import AUTO_MODEL, get_routing_log, model_tiers, route_model
+from utils.hedging import DEFAULT_HEDGE_DELAY, generate_portfolio_html_hedged, get_hedge_stats
+from utils.jobs import CANCELLED as JOB_CANCELLED, FAILED as JOB_FAILED, QUEUED as JOB_QUEUED, RUNNING as JOB_RUNNING
+from utils.jobs import QueueFullError, get_job_scheduler
+from utils.history import get_history_store, history_key, new_history_id
+from utils.export import build_export_bundle
+from utils.audit import audit_html, suggest_fixes
+from utils.retheme import is_theme_only_change, retheme_html
+from utils.variants import MAX_VARIANTS, VARY_LAYOUT, VARY_SCHEME, generate_variants, plan_variants, variant_designs
 import json
 
 # Page configuration
@@ -13,6 +31,7 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+script_started = time.perf_counter()
 
 # Load custom CSS
 def load_css():
@@ -155,6 +174,193 @@ if 'experience' not in st.session_state:
     st.session_state.experience = []
 if 'certifications' not in st.session_state:
     st.session_state.certifications = []
+if 'refresh_cache' not in st.session_state:
+    st.session_state.refresh_cache = False
+if 'portfolio_fingerprints' not in st.session_state:
+    st.session_state.portfolio_fingerprints = None
+if 'portfolio_stats' not in st.session_state:
+    st.session_state.portfolio_stats = None
+if 'generated_at' not in st.session_state:
+    st.session_state.generated_at = None
+if 'rerun_stats' not in st.session_state:
+    st.session_state.rerun_stats = {}
+if 'user_id' not in st.session_state:
+    # Identifies this session to the job scheduler so queued work is shared fairly between users
+    st.session_state.user_id = uuid.uuid4().hex
+if 'generation_job' not in st.session_state:
+    st.session_state.generation_job = None
+if 'generation_notice' not in st.session_state:
+    st.session_state.generation_notice = None
+if 'portfolio_variants' not in st.session_state:
+    st.session_state.portfolio_variants = None
+if 'history_version' not in st.session_state:
+    st.session_state.history_version = None
+if 'portfolio_source' not in st.session_state:
+    # The portfolio_data the current page was generated from
+    st.session_state.portfolio_source = None
+if 'saved_forms' not in st.session_state:
+    # Form inputs only take effect once submitted, so remember which tabs have been saved
+    st.session_state.saved_forms = set()
+
+# Tab forms whose inputs reach the generator only after their Save button is clicked
+SAVE_BUTTONS = {
+    "personal_form": ("Personal Info", "💾 Save Personal Info"),
+    "background_form": ("Experience & Education", "💾 Save Experience & Education"),
+    "design_form": ("Design & Generate", "💾 Apply Design Options"),
+}
+
+def save_button(form):
+    """Render a form's submit button and remember once it has been clicked"""
+    if st.form_submit_button(SAVE_BUTTONS[form][1], use_container_width=True):
+        st.session_state.saved_forms.add(form)
+
+def history_identity():
+    """Return (history key, history ID or None) for this visitor
+
+    Signed-in users (when the app has auth configured) keep their history under
+    their account. Everyone else gets a history ID in the ?history= URL
+    parameter, so a reload or a bookmark finds it again, and it can be pasted
+    into another browser. Never per API key: keys get rotated and may be shared.
+    """
+    user = getattr(st, "user", None)
+    if user is not None and getattr(user, "is_logged_in", False) and user.get("email"):
+        return history_key(user_email=user.get("email")), None
+    history_id = st.query_params.get("history")
+    if history_key(history_id=history_id) is None:
+        history_id = new_history_id()
+        st.query_params["history"] = history_id
+    return history_key(history_id=history_id), history_id.strip().lower()
+
+def remember_version(data, html_content, note=""):
+    """Save the current page to the persistent history as a child of the version it replaces"""
+    design = data.get("design", {})
+    label = f"{design.get('theme')} · {design.get('layout')}" + (f" ({note})" if note else "")
+    try:
+        st.session_state.history_version = get_history_store().save(
+            st.session_state.history_user, data, html_content, st.session_state.history_version, label
+        )
+    except Exception:
+        # History is a convenience; a read-only or full disk must not break generation
+        pass
+
+def record_run(name, started):
+    """Count one run of the named region and store how long it took"""
+    stats = st.session_state.rerun_stats.setdefault(name, {"runs": 0, "last_ms": 0.0})
+    stats["runs"] += 1
+    stats["last_ms"] = (time.perf_counter() - started) * 1000
+    return stats
+
+def show_run_stats(name, started):
+    stats = record_run(name, started)
+    st.caption(f"🔁 {name}: {stats['runs']} run(s) · last {stats['last_ms']:.1f} ms")
+
+def variant_entry(label, html_content, stats, design):
+    """Package one optimized variant for the picker; its audit is computed once, here"""
+    stats = dict(stats, audit_score=audit_html(html_content)["score"])
+    return {"label": label, "html": html_content, "stats": stats, "design": design}
+
+def run_generation_job(job, data, settings):
+    """Runs on a job worker: generate, optimize and return what the session needs
+
+    Nothing in here may touch st.*; progress goes through job.report() and is
+    picked up by the polling fragment in the Design & Generate tab.
+    """
+    # Provider calls from this job, and from the section, variant and hedge threads it starts, stop on Stop
+    with cancel_scope(job.is_cancelled):
+        return run_generation(job, data, settings)
+
+def run_generation(job, data, settings):
+    provider, key, model = settings["target"]
+    refresh = settings["refresh_cache"]
+    notes = []
+    fingerprints = None
+    job.report(message="✨ AI is crafting your portfolio...", fraction=0.4)
+    
+    def report_sections(stage, done, total):
+        label = "page shell" if stage == "shell" else f"{stage} section"
+        job.report(message=f"✨ Finished the {label} ({done}/{total})...", fraction=0.4 + 0.45 * done / total)
+    
+    def report_hedge():
+        job.report(message=f"✨ {provider} is slow to start, also asking {settings['hedge'][0]}...")
+    
+    def report_variants(label, done, total):
+        job.report(message=f"🎲 Finished the {label} variant ({done}/{total})...", fraction=0.4 + 0.45 * done / total)
+    
+    try:
+        if settings["variants"]:
+            vary, count = settings["variants"]
+            results, plan = generate_variants(
+                data, key, provider, model, vary=vary, count=count, refresh_cache=refresh, on_progress=report_variants
+            )
+            job.report(message="🎨 Applying final touches...", fraction=0.9)
+            variants = []
+            for result in results:
+                if result["html"] is None:
+                    notes.append(f"⚠️ The {result['label']} variant failed: {result['error']}")
+                    continue
+                html_content, stats = optimize_html(result["html"])
+                variants.append(variant_entry(result["label"], html_content, stats, result["design"]))
+            if plan["planned"] < plan["requested"]:
+                notes.append(f"🎲 Generated {plan['planned']} of {plan['requested']} variants to stay within the token budget.")
+            notes.append("🎲 Pick your favourite variant in the Preview & Download tab.")
+            first = variants[0]
+            return {
+                "html": first["html"], "stats": first["stats"], "fingerprints": None, "notes": notes,
+                "variants": variants, "data": dict(data, design=first["design"])
+            }
+        if settings["parallel"]:
+            previous_html, previous_fingerprints = settings["previous"]
+            if previous_html and previous_fingerprints:
+                # Only re-request the sections whose inputs changed since the last generation
+                html_content, fingerprints, regenerated = regenerate_changed_sections(
+                    previous_html, previous_fingerprints, data, key, provider, model, on_progress=report_sections
+                )
+                notes.append(f"♻️ Regenerated only: {', '.join(regenerated)}" if regenerated else "♻️ Nothing changed since the last generation.")
+            else:
+                html_content = generate_portfolio_html_parallel(
+                    data, key, provider, model, refresh_cache=refresh, on_progress=report_sections
+                )
+                fingerprints = fingerprint_sections(data)
+        elif settings["hedge"]:
+            html_content, winner = generate_portfolio_html_hedged(
+                data, settings["target"], settings["hedge"], hedge_delay=settings["hedge_delay"],
+                refresh_cache=refresh, on_hedge=report_hedge
+            )
+            notes.append(f"🏁 Generated by {winner}")
+        elif settings["stream"]:
+            streamed = []
+            streamed_chars = 0
+            last_update = 0.0
+            stream = stream_portfolio_html(data, key, provider, model, refresh_cache=refresh)
+            try:
+                for chunk in stream:
+                    if job.is_cancelled():
+                        # Closing the stream below cancels the upstream request
+                        return None
+                    streamed.append(chunk)
+                    streamed_chars += len(chunk)
+                    now = time.monotonic()
+                    if now - last_update >= 0.25:
+                        job.report(
+                            message=f"✨ AI is crafting your portfolio... ({streamed_chars / 1024:.1f} KB)",
+                            fraction=min(0.4 + streamed_chars / 150000, 0.85),
+                            partial=''.join(streamed)
+                        )
+                        last_update = now
+            finally:
+                stream.close()
+            html_content = ''.join(streamed)
+        else:
+            html_content = generate_portfolio_html(data, key, provider, model, refresh_cache=refresh)
+    except Exception as e:
+        if job.is_cancelled():
+            return None
+        html_content, stats = optimize_html(render_portfolio_html(data))
+        return {"html": html_content, "stats": stats, "fingerprints": None, "notes": notes, "error": str(e), "data": data}
+    
+    job.report(message="🎨 Applying final touches...", fraction=0.9, partial=None)
+    html_content, stats = optimize_html(html_content)
+    return {"html": html_content, "stats": stats, "fingerprints": fingerprints, "notes": notes, "variants": None, "data": data}
 
 # Header
 st.markdown("""
@@ -164,6 +370,11 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+MODEL_OPTIONS = {
+    "OpenAI (GPT-4/3.5)": ["gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo", AUTO_MODEL],
+    "Google Gemini": ["gemini-2.5-flash", "gemini-2.5-pro", "gemini-2.5-flash-lite", AUTO_MODEL],
+}
+
 # Sidebar - API Configuration
 with st.sidebar:
     st.markdown("### 🔑 API Configuration")
@@ -183,8 +394,9 @@ with st.sidebar:
         )
         model_choice = st.selectbox(
             "Model",
-            ["gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo"],
-            help="GPT-4o produces better results but costs more"
+            MODEL_OPTIONS["OpenAI (GPT-4/3.5)"],
+            format_func=lambda m: "Auto (by profile size)" if m == AUTO_MODEL else m,
+            help="GPT-4o produces better results but costs more. Auto sends small profiles to GPT-4o mini and rich ones to GPT-4o."
         )
     else:
         api_key = st.text_input(
@@ -195,36 +407,103 @@ with st.sidebar:
         )
         model_choice = st.selectbox(
             "Model",
-            ["gemini-2.5-flash", "gemini-2.5-pro", "gemini-2.5-flash-lite"],
-            help="Pro model produces better results. Flash is fast and balanced. Lite is fastest and cheapest."
+            MODEL_OPTIONS["Google Gemini"],
+            format_func=lambda m: "Auto (by profile size)" if m == AUTO_MODEL else m,
+            help="Pro model produces better results. Flash is fast and balanced. Lite is fastest and cheapest. Auto picks Lite, Flash or Pro from the size of your profile."
         )
     
-    # Manual API Key Test Button (instead of automatic testing)
+    # Validate in the background as soon as a key is entered; the button forces a fresh check
+    # "auto" is not a real model, so check the key against the model most profiles are routed to
+    check_model = model_tiers(ai_provider)["fast"] if model_choice == AUTO_MODEL else model_choice
     if api_key:
+        validation_target = (ai_provider, api_key, check_model)
         col1, col2 = st.columns([2, 1])
         with col1:
             test_button = st.button("🔍 Test API Key", use_container_width=True)
-        with col2:
-            if 'api_valid' in st.session_state and st.session_state.api_valid:
-                st.success("✅")
-            elif 'api_valid' in st.session_state and not st.session_state.api_valid:
-                st.error("❌")
-        
-        # Only test when button is clicked
-        if test_button:
-            with st.spinner("Testing API key..."):
-                is_valid, message = test_api_key(api_key, ai_provider, model_choice)
-                st.session_state.api_valid = is_valid
+        
+        if test_button or st.session_state.get('validation_target') != validation_target:
+            st.session_state.validation_target = validation_target
+            st.session_state.validation_future = validate_api_key_async(
+                api_key, ai_provider, check_model, force=test_button
+            )
+        
+        validation_future = st.session_state.validation_future
+        if validation_future.done():
+            is_valid, message = validation_future.result()
+            st.session_state.api_valid = is_valid
+            with col2:
                 if is_valid:
-                    st.success("✅ API Key Valid!")
+                    st.success("✅")
                 else:
-                    st.error(f"❌ {message}")
+                    st.error("❌")
+            if not is_valid:
+                st.error(f"❌ {message}")
+            elif test_button:
+                st.success("✅ API Key Valid!")
+        else:
+            with col2:
+                st.markdown("⏳")
+            
+            @st.fragment(run_every=1.0)
+            def poll_key_validation():
+                # Polls only while the check is pending, then reruns the app once to show the result
+                if st.session_state.validation_future.done():
+                    st.rerun()
+                st.caption("Checking API key in the background...")
+            
+            poll_key_validation()
     else:
         st.info("👆 Enter your API key above")
         # Reset validation state when key is cleared
-        if 'api_valid' in st.session_state:
-            del st.session_state.api_valid
+        for key in ('api_valid', 'validation_target', 'validation_future'):
+            if key in st.session_state:
+                del st.session_state[key]
     
+    st.markdown("---")
+    with st.expander("🏁 Hedged Requests"):
+        hedge_provider = "Google Gemini" if "OpenAI" in ai_provider else "OpenAI (GPT-4/3.5)"
+        hedge_enabled = st.checkbox(
+            f"Race {hedge_provider} when {ai_provider} is slow",
+            value=False,
+            help="If the first provider has not started writing within the delay, the same request is sent to the other one. The first complete result wins."
+        )
+        hedge_api_key = st.text_input(f"{hedge_provider} API Key", type="password", key="hedge_key")
+        hedge_model = st.selectbox(
+            "Hedge Model",
+            MODEL_OPTIONS[hedge_provider],
+            format_func=lambda m: "Auto (by profile size)" if m == AUTO_MODEL else m,
+            key=f"hedge_model_{hedge_provider}"
+        )
+        hedge_delay = st.slider("Hedge after (seconds)", 0.5, 15.0, DEFAULT_HEDGE_DELAY, 0.5)
+        hedge_stats = get_hedge_stats().get_stats()
+        if hedge_stats['requests']:
+            st.caption(
+                f"{hedge_stats['requests']} request(s) · hedged {hedge_stats['hedges_fired']} "
+                f"({hedge_stats['hedge_rate']:.0%}) · hedge won {hedge_stats['hedge_wins']} · "
+                f"failed {hedge_stats['failures']}"
+            )
+        use_hedging = hedge_enabled and bool(api_key) and bool(hedge_api_key)
+
+    with st.expander("⚡ Generation Cache"):
+        cache_stats = get_generation_cache().get_stats()
+        st.markdown(f"""
+        - Hits: **{cache_stats['hits']}** (memory {cache_stats['memory_hits']}, disk {cache_stats['disk_hits']})
+        - Misses: **{cache_stats['misses']}**
+        - Evictions: **{cache_stats['evictions']}** (disk {cache_stats['disk_evictions']})
+        - Stored: {cache_stats['memory_entries']} in memory, {cache_stats['disk_bytes'] / 1024:.1f} KB on disk
+        """)
+        if st.button("🗑️ Clear Cache", use_container_width=True):
+            get_generation_cache().clear()
+            st.rerun()
+
+    routing_log = get_routing_log()
+    if routing_log.entries():
+        with st.expander("🧭 Model Routing"):
+            for tier, tier_stats in routing_log.get_stats().items():
+                st.markdown(f"- **{tier}**: {tier_stats['requests']} request(s), avg {tier_stats['mean_seconds']}s, {tier_stats['errors']} error(s)")
+            for entry in reversed(routing_log.entries()[-5:]):
+                st.caption(f"{entry['model']} · ~{entry['input_tokens']:,} in / ~{entry['output_tokens']:,} out tokens · {entry['seconds']}s · {entry['status']}")
+
     st.markdown("---")
     st.markdown("### 📊 Features")
     st.markdown("""
@@ -235,6 +514,12 @@ with st.sidebar:
     - 🔄 Real-time Preview
     - 🎯 SEO Optimized
     """)
+    
+    # Filled in at the end of the script, once this run's timing is known
+    rerun_panel = st.empty()
+
+# Looked up on every run: the history ID in the URL may have been replaced with a pasted one
+st.session_state.history_user, st.session_state.history_id = history_identity()
 
 # Main content tabs
 tab1, tab2, tab3, tab4 = st.tabs(["📝 Personal Info", "💼 Experience & Education", "🎨 Design & Generate", "👀 Preview & Download"])
@@ -242,411 +527,720 @@ tab1, tab2, tab3, tab4 = st.tabs(["📝 Personal Info", "💼 Experience & Educa
 with tab1:
     st.markdown('<div class="step-indicator">Step 1: Personal Information</div>', unsafe_allow_html=True)
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        full_name = st.text_input("Full Name *", placeholder="John Doe")
-        professional_title = st.text_input("Professional Title *", placeholder="Full Stack Developer | AI Engineer")
-        email = st.text_input("Email Address", placeholder="john.doe@example.com")
-        phone = st.text_input("Phone Number", placeholder="+1 (555) 123-4567")
-        location = st.text_input("Location", placeholder="San Francisco, CA")
-    
-    with col2:
-        github = st.text_input("GitHub Username", placeholder="johndoe")
-        linkedin = st.text_input("LinkedIn Username", placeholder="johndoe")
-        twitter = st.text_input("Twitter/X Username", placeholder="@johndoe")
-        website = st.text_input("Personal Website", placeholder="https://johndoe.com")
-        portfolio_url = st.text_input("Behance/Dribbble", placeholder="behance.net/johndoe")
-    
-    st.markdown("### 📖 About Me")
-    bio = st.text_area(
-        "Professional Bio *",
-        placeholder="Write a compelling summary about yourself, your expertise, passion, and what makes you unique...",
-        height=150,
-        help="This will be the first thing visitors see. Make it count!"
-    )
-    
-    st.markdown("### 🛠️ Skills & Technologies")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("**Technical Skills**")
-        technical_skills = st.text_area(
-            "Technical Skills",
-            placeholder="Python, JavaScript, React, Node.js, Docker, AWS",
-            height=100,
-            label_visibility="collapsed"
-        )
-    
-    with col2:
-        st.markdown("**Soft Skills**")
-        soft_skills = st.text_area(
-            "Soft Skills",
-            placeholder="Leadership, Communication, Problem Solving, Team Collaboration",
-            height=100,
-            label_visibility="collapsed"
-        )
-    
-    with col3:
-        st.markdown("**Tools & Platforms**")
-        tools = st.text_area(
-            "Tools",
-            placeholder="Git, VS Code, Figma, Jira, Slack",
-            height=100,
-            label_visibility="collapsed"
+    # Inputs are committed together on submit, so typing does not rerun the whole app
+    with st.form("personal_form", border=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            full_name = st.text_input("Full Name *", placeholder="John Doe")
+            professional_title = st.text_input("Professional Title *", placeholder="Full Stack Developer | AI Engineer")
+            email = st.text_input("Email Address", placeholder="john.doe@example.com")
+            phone = st.text_input("Phone Number", placeholder="+1 (555) 123-4567")
+            location = st.text_input("Location", placeholder="San Francisco, CA")
+        
+        with col2:
+            github = st.text_input("GitHub Username", placeholder="johndoe")
+            linkedin = st.text_input("LinkedIn Username", placeholder="johndoe")
+            twitter = st.text_input("Twitter/X Username", placeholder="@johndoe")
+            website = st.text_input("Personal Website", placeholder="https://johndoe.com")
+            portfolio_url = st.text_input("Behance/Dribbble", placeholder="behance.net/johndoe")
+        
+        st.markdown("### 📖 About Me")
+        bio = st.text_area(
+            "Professional Bio *",
+            placeholder="Write a compelling summary about yourself, your expertise, passion, and what makes you unique...",
+            height=150,
+            help="This will be the first thing visitors see. Make it count!"
         )
+        
+        st.markdown("### 🛠️ Skills & Technologies")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("**Technical Skills**")
+            technical_skills = st.text_area(
+                "Technical Skills",
+                placeholder="Python, JavaScript, React, Node.js, Docker, AWS",
+                height=100,
+                label_visibility="collapsed"
+            )
+        
+        with col2:
+            st.markdown("**Soft Skills**")
+            soft_skills = st.text_area(
+                "Soft Skills",
+                placeholder="Leadership, Communication, Problem Solving, Team Collaboration",
+                height=100,
+                label_visibility="collapsed"
+            )
+        
+        with col3:
+            st.markdown("**Tools & Platforms**")
+            tools = st.text_area(
+                "Tools",
+                placeholder="Git, VS Code, Figma, Jira, Slack",
+                height=100,
+                label_visibility="collapsed"
+            )
+        
+        save_button("personal_form")
 
 with tab2:
     st.markdown('<div class="step-indicator">Step 2: Professional Background</div>', unsafe_allow_html=True)
     
-    # Projects Section
-    st.markdown("### 🚀 Projects")
-    
-    num_projects = st.number_input("Number of Projects", min_value=0, max_value=10, value=2)
-    
-    projects = []
-    for i in range(num_projects):
-        with st.expander(f"Project {i+1}", expanded=(i==0)):
-            pcol1, pcol2 = st.columns(2)
-            with pcol1:
-                project_name = st.text_input(f"Project Name", key=f"pname_{i}", placeholder="AI Chatbot")
-                project_tech = st.text_input(f"Technologies Used", key=f"ptech_{i}", placeholder="Python, OpenAI, Streamlit")
-            with pcol2:
-                project_url = st.text_input(f"Project URL/GitHub", key=f"purl_{i}", placeholder="github.com/user/project")
-                project_date = st.text_input(f"Date", key=f"pdate_{i}", placeholder="Jan 2024 - Present")
+    # The counts stay outside the form so the number of entries updates right away
+    count_col1, count_col2, count_col3 = st.columns(3)
+    with count_col1:
+        num_projects = st.number_input("Number of Projects", min_value=0, max_value=10, value=2)
+    with count_col2:
+        num_experience = st.number_input("Number of Positions", min_value=0, max_value=10, value=2)
+    with count_col3:
+        num_education = st.number_input("Number of Degrees", min_value=0, max_value=5, value=1)
+    
+    with st.form("background_form", border=False):
+        # Projects Section
+        st.markdown("### 🚀 Projects")
+        
+        projects = []
+        for i in range(num_projects):
+            with st.expander(f"Project {i+1}", expanded=(i==0)):
+                pcol1, pcol2 = st.columns(2)
+                with pcol1:
+                    project_name = st.text_input(f"Project Name", key=f"pname_{i}", placeholder="AI Chatbot")
+                    project_tech = st.text_input(f"Technologies Used", key=f"ptech_{i}", placeholder="Python, OpenAI, Streamlit")
+                with pcol2:
+                    project_url = st.text_input(f"Project URL/GitHub", key=f"purl_{i}", placeholder="github.com/user/project")
+                    project_date = st.text_input(f"Date", key=f"pdate_{i}", placeholder="Jan 2024 - Present")
             
-            project_desc = st.text_area(
-                f"Project Description",
-                key=f"pdesc_{i}",
-                placeholder="Describe the project, your role, impact, and key achievements...",
-                height=100
-            )
+                project_desc = st.text_area(
+                    f"Project Description",
+                    key=f"pdesc_{i}",
+                    placeholder="Describe the project, your role, impact, and key achievements...",
+                    height=100
+                )
             
-            if project_name:
-                projects.append({
-                    "name": project_name,
-                    "description": project_desc,
-                    "technologies": project_tech,
-                    "url": project_url,
-                    "date": project_date
-                })
-    
-    st.markdown("---")
-    
-    # Experience Section
-    st.markdown("### 💼 Work Experience")
-    
-    num_experience = st.number_input("Number of Positions", min_value=0, max_value=10, value=2)
-    
-    experiences = []
-    for i in range(num_experience):
-        with st.expander(f"Position {i+1}", expanded=(i==0)):
-            ecol1, ecol2 = st.columns(2)
-            with ecol1:
-                job_title = st.text_input(f"Job Title", key=f"jtitle_{i}", placeholder="Senior Software Engineer")
-                company = st.text_input(f"Company", key=f"company_{i}", placeholder="Tech Corp Inc.")
-            with ecol2:
-                job_location = st.text_input(f"Location", key=f"jloc_{i}", placeholder="Remote")
-                job_duration = st.text_input(f"Duration", key=f"jdur_{i}", placeholder="Jan 2022 - Present")
+                if project_name:
+                    projects.append({
+                        "name": project_name,
+                        "description": project_desc,
+                        "technologies": project_tech,
+                        "url": project_url,
+                        "date": project_date
+                    })
+        
+        st.markdown("---")
+        
+        # Experience Section
+        st.markdown("### 💼 Work Experience")
+        
+        experiences = []
+        for i in range(num_experience):
+            with st.expander(f"Position {i+1}", expanded=(i==0)):
+                ecol1, ecol2 = st.columns(2)
+                with ecol1:
+                    job_title = st.text_input(f"Job Title", key=f"jtitle_{i}", placeholder="Senior Software Engineer")
+                    company = st.text_input(f"Company", key=f"company_{i}", placeholder="Tech Corp Inc.")
+                with ecol2:
+                    job_location = st.text_input(f"Location", key=f"jloc_{i}", placeholder="Remote")
+                    job_duration = st.text_input(f"Duration", key=f"jdur_{i}", placeholder="Jan 2022 - Present")
             
-            job_desc = st.text_area(
-                f"Responsibilities & Achievements",
-                key=f"jdesc_{i}",
-                placeholder="• Led a team of 5 developers\n• Increased performance by 40%\n• Implemented CI/CD pipeline",
-                height=100
-            )
+                job_desc = st.text_area(
+                    f"Responsibilities & Achievements",
+                    key=f"jdesc_{i}",
+                    placeholder="• Led a team of 5 developers\n• Increased performance by 40%\n• Implemented CI/CD pipeline",
+                    height=100
+                )
             
-            if job_title:
-                experiences.append({
-                    "title": job_title,
-                    "company": company,
-                    "location": job_location,
-                    "duration": job_duration,
-                    "description": job_desc
-                })
-    
-    st.markdown("---")
-    
-    # Education Section
-    st.markdown("### 🎓 Education")
-    
-    num_education = st.number_input("Number of Degrees", min_value=0, max_value=5, value=1)
-    
-    education = []
-    for i in range(num_education):
-        with st.expander(f"Education {i+1}", expanded=(i==0)):
-            edcol1, edcol2 = st.columns(2)
-            with edcol1:
-                degree = st.text_input(f"Degree", key=f"degree_{i}", placeholder="Bachelor of Science in Computer Science")
-                institution = st.text_input(f"Institution", key=f"inst_{i}", placeholder="Stanford University")
-            with edcol2:
-                grad_year = st.text_input(f"Graduation Year", key=f"grad_{i}", placeholder="2020")
-                gpa = st.text_input(f"GPA (Optional)", key=f"gpa_{i}", placeholder="3.8/4.0")
+                if job_title:
+                    experiences.append({
+                        "title": job_title,
+                        "company": company,
+                        "location": job_location,
+                        "duration": job_duration,
+                        "description": job_desc
+                    })
+        
+        st.markdown("---")
+        
+        # Education Section
+        st.markdown("### 🎓 Education")
+        
+        education = []
+        for i in range(num_education):
+            with st.expander(f"Education {i+1}", expanded=(i==0)):
+                edcol1, edcol2 = st.columns(2)
+                with edcol1:
+                    degree = st.text_input(f"Degree", key=f"degree_{i}", placeholder="Bachelor of Science in Computer Science")
+                    institution = st.text_input(f"Institution", key=f"inst_{i}", placeholder="Stanford University")
+                with edcol2:
+                    grad_year = st.text_input(f"Graduation Year", key=f"grad_{i}", placeholder="2020")
+                    gpa = st.text_input(f"GPA (Optional)", key=f"gpa_{i}", placeholder="3.8/4.0")
             
-            if degree:
-                education.append({
-                    "degree": degree,
-                    "institution": institution,
-                    "year": grad_year,
-                    "gpa": gpa
-                })
-    
-    st.markdown("---")
-    
-    # Certifications
-    st.markdown("### 🏆 Certifications & Awards")
-    certifications = st.text_area(
-        "List your certifications and awards",
-        placeholder="• AWS Certified Solutions Architect\n• Google Cloud Professional\n• Hackathon Winner 2023",
-        height=100
-    )
+                if degree:
+                    education.append({
+                        "degree": degree,
+                        "institution": institution,
+                        "year": grad_year,
+                        "gpa": gpa
+                    })
+        
+        st.markdown("---")
+        
+        # Certifications
+        st.markdown("### 🏆 Certifications & Awards")
+        certifications = st.text_area(
+            "List your certifications and awards",
+            placeholder="• AWS Certified Solutions Architect\n• Google Cloud Professional\n• Hackathon Winner 2023",
+            height=100
+        )
+        
+        save_button("background_form")
 
 with tab3:
     st.markdown('<div class="step-indicator">Step 3: Design & Generate</div>', unsafe_allow_html=True)
     
-    col1, col2 = st.columns(2)
+    color_schemes = get_color_schemes()
     
-    with col1:
+    @st.fragment
+    def theme_picker():
+        # Changing the theme only reruns this swatch; the rest of the app reads the keyed value
+        started = time.perf_counter()
         st.markdown("### 🎨 Theme Selection")
         theme = st.selectbox(
             "Choose Theme",
             ["Modern Gradient", "Minimalist", "Creative Bold", "Professional Dark", 
              "Elegant Light", "Cyberpunk Neon", "Nature Green", "Sunset Orange"],
+            key="theme",
             help="Select a color scheme for your portfolio"
         )
-        
-        color_schemes = get_color_schemes()
-        selected_scheme = color_schemes.get(theme, color_schemes["Modern Gradient"])
+        scheme = color_schemes.get(theme, color_schemes["Modern Gradient"])
         
         st.markdown(f"""
-        <div style="background: {selected_scheme['primary']}; padding: 20px; border-radius: 10px; color: white;">
+        <div style="background: {scheme['primary']}; padding: 20px; border-radius: 10px; color: white;">
             <strong>Primary Color</strong>
         </div>
         """, unsafe_allow_html=True)
+        show_run_stats("theme swatch", started)
+    
+    theme_picker()
+    theme = st.session_state.theme
+    selected_scheme = color_schemes.get(theme, color_schemes["Modern Gradient"])
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    with st.form("design_form", border=False):
+        col1, col2 = st.columns(2)
         
-        st.markdown("<br>", unsafe_allow_html=True)
+        with col1:
+            layout_style = st.selectbox(
+                "Layout Style",
+                get_layout_styles(),
+                help="Choose how your portfolio is structured"
+            )
         
-        layout_style = st.selectbox(
-            "Layout Style",
-            ["Single Page Scroll", "Multi-Section with Tabs", "Grid Layout", "Side Navigation"],
-            help="Choose how your portfolio is structured"
-        )
-    
-    with col2:
-        st.markdown("### ✍️ Typography")
-        font_pair = st.selectbox(
-            "Font Pairing",
-            ["Poppins & Roboto", "Montserrat & Open Sans", "Playfair & Source Sans", 
-             "Inter & Lora", "Space Grotesk & DM Sans"],
-            help="Select fonts for headings and body text"
-        )
+        with col2:
+            st.markdown("### ✍️ Typography")
+            font_pair = st.selectbox(
+                "Font Pairing",
+                ["Poppins & Roboto", "Montserrat & Open Sans", "Playfair & Source Sans", 
+                 "Inter & Lora", "Space Grotesk & DM Sans"],
+                help="Select fonts for headings and body text"
+            )
+            
+            animations = st.multiselect(
+                "Animations & Effects",
+                ["Fade In", "Slide In", "Parallax Scrolling", "Hover Effects", 
+                 "Typing Animation", "Particle Background"],
+                default=["Fade In", "Hover Effects"],
+                help="Add interactive elements to your portfolio"
+            )
         
-        animations = st.multiselect(
-            "Animations & Effects",
-            ["Fade In", "Slide In", "Parallax Scrolling", "Hover Effects", 
-             "Typing Animation", "Particle Background"],
-            default=["Fade In", "Hover Effects"],
-            help="Add interactive elements to your portfolio"
-        )
+        st.markdown("---")
+        
+        st.markdown("### ⚙️ Additional Options")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            include_contact_form = st.checkbox("Include Contact Form", value=True)
+            include_resume_download = st.checkbox("Resume Download Button", value=True)
+        
+        with col2:
+            include_testimonials = st.checkbox("Testimonials Section", value=False)
+            include_blog = st.checkbox("Blog/Articles Section", value=False)
+        
+        with col3:
+            seo_optimize = st.checkbox("SEO Optimization", value=True)
+            analytics = st.checkbox("Google Analytics Ready", value=True)
+        
+        save_button("design_form")
     
     st.markdown("---")
     
-    st.markdown("### ⚙️ Additional Options")
-    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        include_contact_form = st.checkbox("Include Contact Form", value=True)
-        include_resume_download = st.checkbox("Resume Download Button", value=True)
+        stream_output = st.checkbox(
+            "⚡ Stream output live",
+            value=True,
+            help="Show the HTML and preview as the AI writes it. You can stop the generation at any time."
+        )
     
     with col2:
-        include_testimonials = st.checkbox("Testimonials Section", value=False)
-        include_blog = st.checkbox("Blog/Articles Section", value=False)
+        parallel_sections = st.checkbox(
+            "🧩 Parallel Sections",
+            value=False,
+            help="Generate the page shell first, then every section at the same time. Usually much faster for rich profiles."
+        )
     
     with col3:
-        seo_optimize = st.checkbox("SEO Optimization", value=True)
-        analytics = st.checkbox("Google Analytics Ready", value=True)
+        fast_mode = st.checkbox(
+            "🏎️ Fast Mode (offline, no AI)",
+            value=False,
+            help="Render instantly from a built-in template for your layout, theme and fonts. No API key needed."
+        )
     
-    st.markdown("---")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        variant_count = st.number_input(
+            "🎲 Design Variants",
+            min_value=1,
+            max_value=MAX_VARIANTS,
+            value=1,
+            help="Generate several designs at the same time and pick one side by side in the Preview tab."
+        )
+    
+    with col2:
+        vary_by = st.selectbox(
+            "Vary",
+            [VARY_SCHEME, VARY_LAYOUT],
+            format_func=lambda v: "Color scheme" if v == VARY_SCHEME else "Layout",
+            disabled=variant_count == 1
+        )
+    
+    # Compile all data
+    portfolio_data = {
+        "personal": {
+            "name": full_name,
+            "title": professional_title,
+            "bio": bio,
+            "email": email,
+            "phone": phone,
+            "location": location
+        },
+        "social": {
+            "github": github,
+            "linkedin": linkedin,
+            "twitter": twitter,
+            "website": website,
+            "portfolio": portfolio_url
+        },
+        "skills": {
+            "technical": technical_skills,
+            "soft": soft_skills,
+            "tools": tools
+        },
+        "projects": projects,
+        "experience": experiences,
+        "education": education,
+        "certifications": certifications,
+        "design": {
+            "theme": theme,
+            "layout": layout_style,
+            "fonts": font_pair,
+            "animations": animations,
+            "color_scheme": selected_scheme
+        },
+        "options": {
+            "contact_form": include_contact_form,
+            "resume_button": include_resume_download,
+            "testimonials": include_testimonials,
+            "blog": include_blog,
+            "seo": seo_optimize,
+            "analytics": analytics
+        }
+    }
+    
+    if not fast_mode:
+        _, _, prompt_report = build_prompt(portfolio_data)
+        trimmed_note = f" · trimmed to fit: {', '.join(prompt_report['trimmed'])}" if prompt_report['trimmed'] else ""
+        st.caption(f"📏 Estimated prompt size: ~{prompt_report['input_tokens']:,} tokens ({prompt_report['payload_tokens']:,} for your details){trimmed_note}")
+        if model_choice == AUTO_MODEL:
+            route = route_model(portfolio_data, ai_provider)
+            st.caption(f"🧭 Auto routing: **{route['model']}** ({route['tier']} tier, ~{route['output_tokens']:,} output tokens expected)")
+        if variant_count > 1:
+            planned_variants, variant_plan = plan_variants(portfolio_data, vary_by, variant_count)
+            capped_note = f" · capped at {variant_plan['planned']} to stay within budget" if variant_plan['planned'] < variant_plan['requested'] else ""
+            st.caption(f"🎲 Variants: {', '.join(label for label, _ in planned_variants)} (~{variant_plan['estimated_tokens']:,} of {variant_plan['budget']:,} tokens){capped_note}")
     
     # Generate Button
-    if not api_key:
+    if not api_key and not fast_mode:
         st.warning("⚠️ Please enter your API key in the sidebar to generate your portfolio.")
     else:
-        if st.button("🚀 Generate My Portfolio", use_container_width=True, type="primary"):
+        unsaved = [
+            f"**{label}** (\"{button}\")" for form, (label, button) in SAVE_BUTTONS.items()
+            if form not in st.session_state.saved_forms
+        ]
+        if unsaved:
+            st.warning(
+                f"💾 Unsaved changes are not used: {', '.join(unsaved)} "
+                f"{'has' if len(unsaved) == 1 else 'have'} never been saved, so anything typed there is ignored. "
+                "Click Save in each tab before generating."
+            )
+        else:
+            st.caption("💾 Edits made after your last Save in a tab are only used once you click Save again.")
+        if st.button("🚀 Generate My Portfolio", use_container_width=True, type="primary", disabled=bool(st.session_state.generation_job)):
+            rethemed = None
+            if (not fast_mode and variant_count == 1 and not st.session_state.refresh_cache
+                    and st.session_state.portfolio_html
+                    and is_theme_only_change(st.session_state.portfolio_source, portfolio_data)):
+                # Only the theme or fonts changed: rewrite the page's CSS instead of calling the AI, if it is themable
+                rethemed, retheme_report = retheme_html(
+                    st.session_state.portfolio_html, st.session_state.portfolio_source["design"], theme, font_pair
+                )
+                if not retheme_report["themable"]:
+                    rethemed = None
             # Validation
             if not full_name or not professional_title or not bio:
-                st.error("❌ Please fill in all required fields (Name, Title, Bio) in Step 1")
+                st.error("❌ Please fill in all required fields (Name, Title, Bio) in Step 1 and click \"Save Personal Info\"")
+            elif fast_mode:
+                # The first variant is always the current design, so one variant is a plain render
+                variants = []
+                for label, design in variant_designs(portfolio_data, vary_by, variant_count):
+                    html_content, stats = optimize_html(render_portfolio_html(dict(portfolio_data, design=design)))
+                    variants.append(variant_entry(label, html_content, stats, design))
+                st.session_state.portfolio_html = variants[0]["html"]
+                st.session_state.portfolio_stats = variants[0]["stats"]
+                st.session_state.portfolio_fingerprints = None
+                st.session_state.portfolio_variants = variants if len(variants) > 1 else None
+                st.session_state.portfolio_source = portfolio_data
+                st.session_state.generated_at = datetime.now()
+                st.session_state.generation_notice = {"notes": []}
+                remember_version(portfolio_data, st.session_state.portfolio_html, "offline")
+            elif rethemed:
+                st.session_state.portfolio_html, st.session_state.portfolio_stats = optimize_html(rethemed)
+                if st.session_state.portfolio_fingerprints:
+                    st.session_state.portfolio_fingerprints = fingerprint_sections(portfolio_data)
+                st.session_state.portfolio_variants = None
+                st.session_state.portfolio_source = portfolio_data
+                st.session_state.generated_at = datetime.now()
+                st.session_state.generation_notice = {"notes": [f"🎨 Re-themed to {theme} · {font_pair} instantly, without another AI call."]}
+                remember_version(portfolio_data, st.session_state.portfolio_html, "re-themed")
             else:
-                # Progress tracking
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                # Step 1: Preparing data
-                status_text.markdown("### 🔄 Preparing your information...")
-                progress_bar.progress(20)
-                time.sleep(0.5)
-                
-                # Compile all data
-                portfolio_data = {
-                    "personal": {
-                        "name": full_name,
-                        "title": professional_title,
-                        "bio": bio,
-                        "email": email,
-                        "phone": phone,
-                        "location": location
-                    },
-                    "social": {
-                        "github": github,
-                        "linkedin": linkedin,
-                        "twitter": twitter,
-                        "website": website,
-                        "portfolio": portfolio_url
-                    },
-                    "skills": {
-                        "technical": technical_skills,
-                        "soft": soft_skills,
-                        "tools": tools
-                    },
-                    "projects": projects,
-                    "experience": experiences,
-                    "education": education,
-                    "certifications": certifications,
-                    "design": {
-                        "theme": theme,
-                        "layout": layout_style,
-                        "fonts": font_pair,
-                        "animations": animations,
-                        "color_scheme": selected_scheme
-                    },
-                    "options": {
-                        "contact_form": include_contact_form,
-                        "resume_button": include_resume_download,
-                        "testimonials": include_testimonials,
-                        "blog": include_blog,
-                        "seo": seo_optimize,
-                        "analytics": analytics
-                    }
+                # The job runs on a worker thread without access to st.session_state, so capture everything now
+                settings = {
+                    "target": (ai_provider, api_key, model_choice),
+                    "hedge": (hedge_provider, hedge_api_key, hedge_model) if use_hedging else None,
+                    "hedge_delay": hedge_delay,
+                    "parallel": parallel_sections,
+                    "variants": (vary_by, variant_count) if variant_count > 1 else None,
+                    "stream": stream_output,
+                    "refresh_cache": st.session_state.refresh_cache,
+                    "previous": (st.session_state.portfolio_html, st.session_state.portfolio_fingerprints),
                 }
-                
-                # Step 2: Connecting to AI
-                status_text.markdown("### 🤖 Connecting to AI service...")
-                progress_bar.progress(40)
-                time.sleep(0.5)
-                
-                # Step 3: Generating HTML
-                status_text.markdown("### ✨ AI is crafting your portfolio...")
-                progress_bar.progress(60)
-                
                 try:
-                    html_content = generate_portfolio_html(
-                        portfolio_data, 
-                        api_key, 
-                        ai_provider, 
-                        model_choice
+                    st.session_state.generation_job = get_job_scheduler().submit(
+                        st.session_state.user_id,
+                        functools.partial(run_generation_job, data=portfolio_data, settings=settings),
+                        label=full_name
                     )
-                    
-                    # Step 4: Optimizing
-                    status_text.markdown("### 🎨 Applying final touches...")
-                    progress_bar.progress(85)
-                    time.sleep(0.5)
-                    
-                    # Step 5: Complete
-                    progress_bar.progress(100)
-                    status_text.markdown("### ✅ Your portfolio is ready!")
-                    time.sleep(0.5)
-                    
-                    st.session_state.portfolio_html = html_content
-                    
-                    st.markdown("""
-                    <div class="success-message">
-                        🎉 Portfolio Generated Successfully! Check the Preview & Download tab.
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.balloons()
-                    
-                except Exception as e:
-                    st.error(f"❌ Error generating portfolio: {str(e)}")
-                    status_text.empty()
-                    progress_bar.empty()
-
-with tab4:
-    st.markdown('<div class="step-indicator">Step 4: Preview & Download</div>', unsafe_allow_html=True)
+                    st.session_state.refresh_cache = False
+                except QueueFullError as e:
+                    st.warning(f"⏳ {e}")
     
-    if st.session_state.portfolio_html:
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            # Download HTML
-            b64 = base64.b64encode(st.session_state.portfolio_html.encode()).decode()
-            href = f'<a href="data:text/html;base64,{b64}" download="portfolio.html" style="text-decoration: none;"><button style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border: none; padding: 12px 30px; border-radius: 10px; font-size: 16px; font-weight: 600; cursor: pointer; width: 100%;">💾 Download HTML</button></a>'
-            st.markdown(href, unsafe_allow_html=True)
-        
-        with col2:
-            # Copy to clipboard button
-            if st.button("📋 Copy HTML Code", use_container_width=True):
-                st.code(st.session_state.portfolio_html[:500] + "...", language="html")
-                st.success("Code preview shown above!")
-        
-        with col3:
-            # Generate new version
-            if st.button("🔄 Generate New Version", use_container_width=True):
-                st.session_state.portfolio_html = None
-                st.rerun()
-        
-        st.markdown("---")
-        
-        # Preview
-        st.markdown("### 👀 Live Preview")
-        st.markdown('<div class="preview-container">', unsafe_allow_html=True)
-        st.components.v1.html(st.session_state.portfolio_html, height=600, scrolling=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Show file info
-        st.markdown("---")
-        col1, col2, col3 = st.columns(3)
+    if st.session_state.generation_job:
+        @st.fragment(run_every=1.0)
+        def generation_status():
+            # Polls the job while it is queued or running, then reruns the app once to pick up the result
+            scheduler = get_job_scheduler()
+            job = scheduler.get(st.session_state.generation_job)
+            if job and job["status"] in (JOB_QUEUED, JOB_RUNNING):
+                progress = job["progress"]
+                if job["status"] == JOB_QUEUED:
+                    st.progress(0)
+                    st.markdown(f"### ⏳ Waiting for a free slot (position {job['position']} in the queue)...")
+                else:
+                    st.progress(progress.get("fraction", 0.4))
+                    st.markdown(f"### {progress.get('message', '✨ AI is crafting your portfolio...')}")
+                stats = scheduler.get_stats()
+                st.caption(f"{stats['running']} generation(s) running, {stats['queued']} queued across all users")
+                if st.button("⏹️ Stop Generation", help="Cancel the generation in progress"):
+                    scheduler.cancel(job["id"])
+                if progress.get("partial"):
+                    # Only the tail keeps each update small while the document grows
+                    st.code(progress["partial"][-3000:], language="html")
+                    st.components.v1.html(progress["partial"], height=400, scrolling=True)
+                return
+            
+            st.session_state.generation_job = None
+            if job is None or job["status"] == JOB_CANCELLED:
+                st.session_state.generation_notice = {"cancelled": True}
+            elif job["status"] == JOB_FAILED:
+                st.session_state.generation_notice = {"error": job["error"]}
+            else:
+                result = job["result"]
+                st.session_state.portfolio_html = result["html"]
+                st.session_state.portfolio_stats = result["stats"]
+                st.session_state.portfolio_fingerprints = result["fingerprints"]
+                st.session_state.portfolio_variants = result.get("variants")
+                st.session_state.portfolio_source = result["data"]
+                st.session_state.generated_at = datetime.now()
+                st.session_state.generation_notice = result
+                remember_version(result["data"], result["html"], "offline" if "error" in result else "")
+            st.rerun()
         
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>File Size</h3>
-                <h2>{len(st.session_state.portfolio_html) / 1024:.1f} KB</h2>
+        generation_status()
+    
+    notice = st.session_state.generation_notice
+    if notice:
+        # Shown once, on the rerun that follows the generation
+        st.session_state.generation_notice = None
+        if notice.get("cancelled"):
+            st.info("⏹️ Generation stopped.")
+        elif "error" in notice:
+            st.error(f"❌ Error generating portfolio: {notice['error']}")
+            if "html" in notice:
+                st.info("⚡ The AI service is unavailable, so an instant offline version is ready in the Preview & Download tab.")
+        else:
+            for note in notice["notes"]:
+                st.info(note)
+            st.markdown("""
+            <div class="success-message">
+                🎉 Portfolio Generated Successfully! Check the Preview & Download tab.
             </div>
             """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>Generated</h3>
-                <h2>{datetime.now().strftime('%H:%M')}</h2>
+            st.balloons()
+
+
+with tab4:
+    st.markdown('<div class="step-indicator">Step 4: Preview & Download</div>', unsafe_allow_html=True)
+    
+    @st.fragment
+    def preview_panel():
+        # Buttons in here (e.g. copy) rerun only the preview, not the whole app
+        started = time.perf_counter()
+        if st.session_state.portfolio_html:
+            # Store the document once under its content hash; later reruns reuse the digest
+            serve_artifacts = start_artifact_server()
+            if serve_artifacts and st.session_state.get('artifact_source') is not st.session_state.portfolio_html:
+                st.session_state.artifact_digest = store_artifact(st.session_state.portfolio_html)
+                st.session_state.artifact_source = st.session_state.portfolio_html
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                # Served through Streamlit's media endpoint, so only a URL goes over the websocket
+                st.download_button(
+                    "💾 Download HTML",
+                    data=st.session_state.portfolio_html,
+                    file_name="portfolio.html",
+                    mime="text/html",
+                    use_container_width=True
+                )
+            
+            with col2:
+                # Built once per document, like the artifact above
+                if st.session_state.get('export_source') is not st.session_state.portfolio_html:
+                    st.session_state.export_bundle, _ = build_export_bundle(st.session_state.portfolio_html)
+                    st.session_state.export_source = st.session_state.portfolio_html
+                st.download_button(
+                    "📦 Download Static Site",
+                    data=st.session_state.export_bundle,
+                    file_name="portfolio-site.zip",
+                    mime="application/zip",
+                    help="index.html plus content-hashed, precompressed CSS and JS files and cache headers, ready for static hosting",
+                    use_container_width=True
+                )
+            
+            with col3:
+                # Copy to clipboard button
+                if st.button("📋 Copy HTML Code", use_container_width=True):
+                    st.code(st.session_state.portfolio_html[:500] + "...", language="html")
+                    st.success("Code preview shown above!")
+            
+            with col4:
+                # Generate new version
+                if st.button("🔄 Generate New Version", use_container_width=True):
+                    st.session_state.portfolio_html = None
+                    st.session_state.portfolio_fingerprints = None
+                    st.session_state.portfolio_variants = None
+                    st.session_state.refresh_cache = True  # Ask the AI for a fresh design instead of the cached one
+                    st.rerun()
+            
+            st.markdown("---")
+            
+            variants = st.session_state.portfolio_variants
+            if variants:
+                st.markdown("### 🎲 Pick a Variant")
+                for column, (index, variant) in zip(st.columns(len(variants)), enumerate(variants)):
+                    with column:
+                        chosen = variant["html"] is st.session_state.portfolio_html
+                        st.markdown(f"**{variant['label']}**" + (" ✅" if chosen else ""))
+                        if serve_artifacts:
+                            # Stored once per variant; reruns only send the URL
+                            if "digest" not in variant:
+                                variant["digest"] = store_artifact(variant["html"])
+                            st.components.v1.iframe(artifact_url(variant["digest"]), height=360, scrolling=True)
+                        else:
+                            st.components.v1.html(variant["html"], height=360, scrolling=True)
+                        st.caption(f"{variant['stats']['optimized_bytes'] / 1024:.1f} KB · ⚡ {variant['stats']['audit_score']}/100")
+                        if st.button("Use this design", key=f"pick_variant_{index}", use_container_width=True, disabled=chosen):
+                            st.session_state.portfolio_html = variant["html"]
+                            st.session_state.portfolio_stats = variant["stats"]
+                            st.session_state.portfolio_source = dict(st.session_state.portfolio_source, design=variant["design"])
+                            remember_version(st.session_state.portfolio_source, variant["html"], "variant")
+                            st.rerun(scope="fragment")
+                if st.button("✅ Keep the selected variant", help="Hide the other variants"):
+                    st.session_state.portfolio_variants = None
+                    st.rerun(scope="fragment")
+                st.markdown("---")
+            
+            # Preview
+            st.markdown("### 👀 Live Preview")
+            st.markdown('<div class="preview-container">', unsafe_allow_html=True)
+            if serve_artifacts:
+                st.components.v1.iframe(artifact_url(st.session_state.artifact_digest), height=600, scrolling=True)
+            else:
+                st.components.v1.html(st.session_state.portfolio_html, height=600, scrolling=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            # Show file info
+            st.markdown("---")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                portfolio_stats = st.session_state.portfolio_stats
+                if portfolio_stats:
+                    size_detail = f"<p>was {portfolio_stats['original_bytes'] / 1024:.1f} KB · {portfolio_stats['gzip_bytes'] / 1024:.1f} KB gzipped</p>"
+                    size_kb = portfolio_stats['optimized_bytes'] / 1024
+                else:
+                    size_detail = ""
+                    size_kb = len(st.session_state.portfolio_html.encode()) / 1024
+                st.markdown(f"""
+                <div class="metric-card">
+                    <h3>File Size</h3>
+                    <h2>{size_kb:.1f} KB</h2>
+                    {size_detail}
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <h3>Generated</h3>
+                    <h2>{st.session_state.generated_at.strftime('%H:%M')}</h2>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <h3>Status</h3>
+                    <h2>✅ Ready</h2>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            if st.session_state.get('audit_source') is not st.session_state.portfolio_html:
+                st.session_state.audit_report = audit_html(st.session_state.portfolio_html)
+                st.session_state.audit_fixes = suggest_fixes(st.session_state.portfolio_html, st.session_state.audit_report)
+                st.session_state.audit_source = st.session_state.portfolio_html
+            audit_report = st.session_state.audit_report
+            audit_fixes = st.session_state.audit_fixes
+            grade_icon = {"good": "🟢", "needs work": "🟠", "poor": "🔴"}[audit_report["grade"]]
+            with st.expander(f"⚡ Performance Audit: {grade_icon} {audit_report['score']}/100 ({audit_report['grade']})"):
+                metrics = audit_report["metrics"]
+                st.caption(
+                    f"{metrics['dom_nodes']} elements, {metrics['dom_depth']} levels deep · "
+                    f"{metrics['blocking_stylesheets'] + metrics['blocking_scripts']} render-blocking request(s) · "
+                    f"{metrics['inline_style_bytes'] / 1024:.1f} KB inline CSS · {metrics['inline_script_bytes'] / 1024:.1f} KB inline JS"
+                )
+                severity_icon = {"high": "🔴", "medium": "🟠", "low": "🟡"}
+                for finding in audit_report["findings"]:
+                    fixable = " · 🔧 fixable" if audit_fixes and finding["fixable"] else ""
+                    st.markdown(f"{severity_icon[finding['severity']]} {finding['message']} (−{finding['penalty']}){fixable}")
+                if not audit_report["findings"]:
+                    st.success("No performance issues found.")
+                if audit_fixes and st.button(
+                    f"🔧 Apply fixes ({audit_report['score']} → {audit_fixes['report']['score']})", key="apply_audit_fixes"
+                ):
+                    st.session_state.portfolio_html = audit_fixes["html"]
+                    st.session_state.portfolio_stats = audit_fixes["stats"]
+                    remember_version(st.session_state.portfolio_source, audit_fixes["html"], "audit fixes")
+                    st.rerun(scope="fragment")
+        else:
+            st.info("👈 Generate your portfolio in the 'Design & Generate' tab to see the preview here!")
+            
+            st.markdown("""
+            <div class="feature-card">
+                <h3>🎯 Next Steps After Generation:</h3>
+                <ul>
+                    <li>✅ Preview your portfolio in real-time</li>
+                    <li>💾 Download as a single HTML file</li>
+                    <li>🚀 Deploy to GitHub Pages, Netlify, or Vercel</li>
+                    <li>✏️ Customize further if needed</li>
+                    <li>📱 Test on different devices</li>
+                </ul>
             </div>
             """, unsafe_allow_html=True)
         
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>Status</h3>
-                <h2>✅ Ready</h2>
-            </div>
-            """, unsafe_allow_html=True)
-    else:
-        st.info("👈 Generate your portfolio in the 'Design & Generate' tab to see the preview here!")
-        
-        st.markdown("""
-        <div class="feature-card">
-            <h3>🎯 Next Steps After Generation:</h3>
-            <ul>
-                <li>✅ Preview your portfolio in real-time</li>
-                <li>💾 Download as a single HTML file</li>
-                <li>🚀 Deploy to GitHub Pages, Netlify, or Vercel</li>
-                <li>✏️ Customize further if needed</li>
-                <li>📱 Test on different devices</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        with st.expander("🕘 Version History"):
+            history = get_history_store()
+            history_user = st.session_state.history_user
+            try:
+                versions = history.list_versions(history_user)
+                history_stats = history.get_stats(history_user)
+            except Exception as e:
+                versions = []
+                st.caption(f"History is unavailable: {e}")
+            if versions:
+                st.caption(
+                    f"{history_stats['versions']} version(s) · {history_stats['html_bytes'] / 1024:.1f} KB of HTML "
+                    f"stored in {history_stats['stored_bytes'] / 1024:.1f} KB"
+                )
+            for version in versions:
+                current = version["id"] == st.session_state.history_version
+                col1, col2 = st.columns([4, 1])
+                with col1:
+                    st.markdown(
+                        f"**{datetime.fromtimestamp(version['created_at']).strftime('%b %d, %H:%M')}** · "
+                        f"{version['label']} · {version['html_bytes'] / 1024:.1f} KB" + (" · ✅ current" if current else "")
+                    )
+                with col2:
+                    if st.button("Restore", key=f"restore_{version['id']}", use_container_width=True, disabled=current):
+                        restored = history.load(history_user, version["id"])
+                        if restored:
+                            st.session_state.portfolio_source, st.session_state.portfolio_html = restored
+                            st.session_state.portfolio_stats = None
+                            st.session_state.portfolio_fingerprints = None
+                            st.session_state.portfolio_variants = None
+                            st.session_state.history_version = version["id"]
+                            st.session_state.generated_at = datetime.fromtimestamp(version["created_at"])
+                            st.rerun(scope="fragment")
+            if st.session_state.history_id:
+                st.caption("Your history ID keeps these versions across sessions. Bookmark this page, or paste the ID into another browser.")
+                pasted_id = st.text_input("History ID", value=st.session_state.history_id, key="history_id_input")
+                if pasted_id.strip().lower() != st.session_state.history_id:
+                    if history_key(history_id=pasted_id) is None:
+                        st.error("That is not a valid history ID.")
+                    else:
+                        st.query_params["history"] = pasted_id.strip().lower()
+                        st.session_state.history_version = None
+                        st.rerun()
+            if versions:
+                if st.button("🗑️ Clear history", key="clear_history"):
+                    history.delete_user(history_user)
+                    st.session_state.history_version = None
+                    st.rerun(scope="fragment")
+            else:
+                st.caption(
+                    "Generated portfolios are saved here so you can restore them later. "
+                    "Older versions are removed automatically."
+                )
+        show_run_stats("preview", started)
+    
+    preview_panel()
 
 # Footer
 st.markdown("---")
@@ -654,3 +1248,10 @@ st.markdown("""
 <div style="text-align: center; padding: 2rem; opacity: 0.7;">
     <p>Made with ❤️ by Disha</p>
 """, unsafe_allow_html=True)
+
+record_run("full app", script_started)
+with rerun_panel.container():
+    st.markdown("---")
+    st.markdown("### 🔁 Reruns")
+    for name, stats in st.session_state.rerun_stats.items():
+        st.caption(f"{name}: {stats['runs']} run(s) · last {stats['last_ms']:.1f} ms")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The app is not an installed package; make `import utils` work from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,66 @@
+from utils.audit import audit_html, suggest_fixes
+from utils.fake_provider import recorded_response
+
+FONT_AWESOME = "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css"
+GOOGLE_FONTS = "https://fonts.googleapis.com/css2?family=Poppins:wght@400;700"
+
+
+def finding_ids(report):
+    return [finding["id"] for finding in report["findings"]]
+
+
+def test_clean_page_scores_full_marks():
+    report = audit_html("<!DOCTYPE html><html><head><title>t</title></head><body><p>Hi</p></body></html>")
+    assert report["score"] == 100
+    assert report["grade"] == "good"
+    assert report["findings"] == []
+
+
+def test_head_resources_are_render_blocking():
+    html = (
+        f'<html><head><link rel="stylesheet" href="{FONT_AWESOME}"><link rel="stylesheet" href="{GOOGLE_FONTS}">'
+        '<script src="app.js"></script><script src="later.js" defer></script></head><body></body></html>'
+    )
+    report = audit_html(html)
+    assert report["metrics"]["blocking_stylesheets"] == 2
+    assert report["metrics"]["blocking_scripts"] == 1
+    assert report["metrics"]["blocking_origins"] == ["Font Awesome", "Google Fonts", "same origin"]
+    assert {"render-blocking-css", "render-blocking-js", "font-display", "font-preconnect", "icon-font"} <= set(finding_ids(report))
+    assert report["findings"][0]["severity"] == "high"
+
+
+def test_body_resources_are_not_render_blocking():
+    html = '<html><head></head><body><link rel="stylesheet" href="late.css"><script src="app.js"></script></body></html>'
+    report = audit_html(html)
+    assert report["metrics"]["blocking_stylesheets"] == 0
+    assert report["metrics"]["blocking_scripts"] == 0
+
+
+def test_images_and_animations_are_flagged():
+    html = (
+        "<html><head><style>.a{animation:spin 1s infinite}.b{animation:spin 1s infinite}"
+        ".c{animation:spin 1s infinite}.d{animation:spin 1s infinite}.e{filter:blur(4px)}</style></head><body>"
+        '<img src="hero.jpg"><img src="a.jpg" width="10" height="10"><canvas id="particles"></canvas>'
+        "<script>requestAnimationFrame(draw); window.addEventListener('scroll', onScroll);</script></body></html>"
+    )
+    ids = finding_ids(audit_html(html))
+    for expected in ("image-dimensions", "image-lazy-loading", "particle-animation",
+                     "infinite-animations", "blur-filters", "scroll-listeners"):
+        assert expected in ids
+
+
+def test_fixable_findings_are_fixed_by_the_optimizer():
+    html = recorded_response()
+    report = audit_html(html)
+    assert any(finding["id"] == "icon-font" and finding["fixable"] for finding in report["findings"])
+
+    fixes = suggest_fixes(html, report)
+    assert fixes["report"]["score"] > report["score"]
+    assert "icon-font" in fixes["fixed"]
+    assert not any(finding["fixable"] for finding in fixes["report"]["findings"])
+    assert suggest_fixes(fixes["html"]) is None
+
+
+def test_nothing_is_suggested_without_fixable_findings():
+    html = '<html><head></head><body><img src="a.jpg"><img src="b.jpg"></body></html>'
+    assert suggest_fixes(html) is None
@@ -0,0 +1,60 @@
+import os
+import time
+
+from utils.cache import GenerationCache, make_cache_key
+
+
+def test_cache_key_ignores_whitespace_and_key_order():
+    first = make_cache_key({"name": "Ada ", "bio": "a\r\nb"}, "openai", "gpt-4")
+    second = make_cache_key({"bio": "a\nb", "name": "Ada"}, "openai", "gpt-4")
+    assert first == second
+    assert first != make_cache_key({"name": "Ada", "bio": "a\nb"}, "openai", "gpt-4o")
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = GenerationCache(max_entries=2, cache_dir=None)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["memory_entries"] == 2
+    assert stats["misses"] == 1
+
+
+def test_disk_tier_serves_entries_evicted_from_memory(tmp_path):
+    cache = GenerationCache(max_entries=1, cache_dir=str(tmp_path))
+    cache.set("a", "A")
+    cache.set("b", "B")
+
+    assert cache.get("a") == "A"
+    assert cache.get_stats()["disk_hits"] == 1
+
+
+def test_disk_tier_drops_oldest_files_over_the_cap(tmp_path):
+    cache = GenerationCache(max_entries=1, cache_dir=str(tmp_path), max_disk_bytes=250)
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.set(key, key * 100)
+        # Give each file a distinct mtime so the eviction order is deterministic
+        past = time.time() - 100 + index
+        os.utime(tmp_path / f"{key}.html", (past, past))
+    cache.set("d", "d" * 100)
+
+    assert sorted(os.listdir(tmp_path)) == ["c.html", "d.html"]
+    stats = cache.get_stats()
+    assert stats["disk_evictions"] == 2
+    assert stats["disk_bytes"] <= 250
+
+
+def test_clear_empties_both_tiers(tmp_path):
+    cache = GenerationCache(cache_dir=str(tmp_path))
+    cache.set("a", "A")
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert os.listdir(tmp_path) == []
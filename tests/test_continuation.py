@@ -0,0 +1,42 @@
+import pytest
+
+from utils import ai_generator
+from utils.ai_generator import clean_html_response, continue_html, generate_portfolio_html, stream_portfolio_html
+from utils.fake_provider import FAKE_PROVIDER, FakeOpenAIClient, install_fake_openai, recorded_response, sample_profile
+
+
+@pytest.fixture
+def short_replies(monkeypatch):
+    """Cap replies at a tenth of the recorded page so it takes several rounds"""
+    monkeypatch.setitem(ai_generator.GENERATION_CONFIG, "max_tokens", 1000)
+    install_fake_openai(FakeOpenAIClient(latency=0), "continuation-key")
+    return clean_html_response(recorded_response())
+
+
+def test_continuations_build_the_whole_document(short_replies):
+    html = generate_portfolio_html(sample_profile(), "continuation-key", FAKE_PROVIDER, "fake",
+                                   use_cache=False, max_continuations=5)
+
+    assert html == short_replies
+
+
+def test_streamed_continuations_build_the_whole_document(short_replies):
+    chunks = stream_portfolio_html(sample_profile(), "continuation-key", FAKE_PROVIDER, "fake",
+                                   use_cache=False, max_continuations=5)
+
+    assert "".join(chunks) == short_replies
+
+
+def test_rounds_stop_once_one_adds_nothing(monkeypatch):
+    calls = []
+
+    def stalled(*args):
+        calls.append(args)
+        return "", True
+
+    monkeypatch.setattr(ai_generator, "request_continuation", stalled)
+    html, rounds = continue_html("<html><body><p>cut off", "system", "prompt", "key", FAKE_PROVIDER, "fake",
+                                 max_continuations=5)
+
+    assert rounds == 1 and len(calls) == 1
+    assert html.endswith("</html>")
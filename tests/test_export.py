@@ -0,0 +1,71 @@
+import gzip
+import io
+import json
+import zipfile
+
+import pytest
+
+from utils import export
+from utils.export import IMMUTABLE_CACHE, REVALIDATE_CACHE, build_export_bundle
+
+STYLE = "body { color: #222; }\n" * 40
+SCRIPT = "console.log('ready');\n" * 40
+DOCUMENT = (
+    f"<!DOCTYPE html><html><head><style>{STYLE}</style>"
+    '<script type="application/ld+json">{"@type": "Person"}</script></head>'
+    f"<body>{'<p>Projects and experience</p>' * 40}<script>{SCRIPT}</script></body></html>"
+)
+
+
+def open_bundle(bundle):
+    with zipfile.ZipFile(io.BytesIO(bundle)) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def test_bundle_splits_assets_and_precompresses_them(monkeypatch):
+    monkeypatch.setattr(export, "brotli", None)
+    bundle, manifest = build_export_bundle(DOCUMENT)
+    members = open_bundle(bundle)
+
+    files = {entry["path"]: entry for entry in manifest["files"]}
+    css = next(path for path in files if path.endswith(".css"))
+    js = next(path for path in files if path.endswith(".js"))
+    assert set(members) == {
+        "index.html", css, js, "index.html.gz", f"{css}.gz", f"{js}.gz", "_headers", "manifest.json"
+    }
+    assert members[css].decode() == STYLE.strip()
+    assert members[js].decode() == SCRIPT.strip()
+    index = members["index.html"].decode()
+    assert f'href="{css}"' in index and f'src="{js}"' in index
+    assert "application/ld+json" in index
+
+    for path in files:
+        assert gzip.decompress(members[f"{path}.gz"]) == members[path]
+    assert files["index.html"]["cache_control"] == REVALIDATE_CACHE
+    assert files[css]["cache_control"] == IMMUTABLE_CACHE
+    # zip_bytes is only known once the zip is written, so only the returned manifest has it
+    assert json.loads(members["manifest.json"]) == {key: value for key, value in manifest.items() if key != "zip_bytes"}
+
+
+def test_without_brotli_no_br_files_are_written(monkeypatch):
+    monkeypatch.setattr(export, "brotli", None)
+    bundle, manifest = build_export_bundle(DOCUMENT)
+
+    assert not any(name.endswith(".br") for name in open_bundle(bundle))
+    assert manifest["brotli"] is False
+    assert all("brotli_bytes" not in entry for entry in manifest["files"])
+
+
+def test_brotli_siblings_decompress_to_the_originals():
+    brotli = pytest.importorskip("brotli")
+    bundle, manifest = build_export_bundle(DOCUMENT)
+    members = open_bundle(bundle)
+
+    assert manifest["brotli"] is True
+    for entry in manifest["files"]:
+        assert brotli.decompress(members[f"{entry['path']}.br"]) == members[entry["path"]]
+
+
+def test_same_document_gives_the_same_zip(monkeypatch):
+    monkeypatch.setattr(export, "brotli", None)
+    assert build_export_bundle(DOCUMENT)[0] == build_export_bundle(DOCUMENT)[0]
@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from utils import providers
+from utils.fake_provider import FAKE_PROVIDER, FakeOpenAIClient, install_fake_openai, sample_profile
+from utils.hedging import generate_portfolio_html_hedged, get_hedge_stats
+from utils.providers import UpstreamSlots
+
+
+def recording(client):
+    """Keep every stream client opens, so a test can check it was closed"""
+    streams = []
+    create = client.chat.completions.create
+
+    def record(*args, **kwargs):
+        response = create(*args, **kwargs)
+        streams.append(response)
+        return response
+
+    client.chat.completions.create = record
+    return streams
+
+
+def counts(before):
+    after = get_hedge_stats().get_stats()
+    return {name: after[name] - before[name] for name in ("hedges_fired", "hedge_wins", "primary_wins", "cancelled")}
+
+
+def test_slow_primary_is_hedged_and_its_stream_closed():
+    slow = install_fake_openai(FakeOpenAIClient(latency=5.0), "hedge-slow-key")
+    install_fake_openai(FakeOpenAIClient(latency=0.05), "hedge-fast-key")
+    slow_streams = recording(slow)
+    before = get_hedge_stats().get_stats()
+
+    started = time.monotonic()
+    html, winner = generate_portfolio_html_hedged(
+        sample_profile(), (FAKE_PROVIDER, "hedge-slow-key", "fake"), (FAKE_PROVIDER, "hedge-fast-key", "fake"),
+        hedge_delay=0.2, use_cache=False
+    )
+
+    assert time.monotonic() - started < 3
+    assert html.rstrip().endswith("</html>")
+    assert [stream.closed for stream in slow_streams] == [True]
+    assert counts(before) == {"hedges_fired": 1, "hedge_wins": 1, "primary_wins": 0, "cancelled": 1}
+
+
+def test_loser_waiting_for_an_upstream_slot_gives_up(monkeypatch):
+    slots = UpstreamSlots(1)
+    monkeypatch.setattr(providers, "_upstream_slots", slots)
+    monkeypatch.setattr(providers, "SLOT_POLL_SECONDS", 0.01)
+    install_fake_openai(FakeOpenAIClient(latency=0.3), "hedge-holder-key")
+    queued = install_fake_openai(FakeOpenAIClient(latency=0.01), "hedge-queued-key")
+    queued_streams = recording(queued)
+
+    # The primary holds the only slot, so the hedge is still queued when it loses
+    html, winner = generate_portfolio_html_hedged(
+        sample_profile(), (FAKE_PROVIDER, "hedge-holder-key", "fake"), (FAKE_PROVIDER, "hedge-queued-key", "fake"),
+        hedge_delay=0.1, use_cache=False
+    )
+    time.sleep(0.2)
+
+    assert html.rstrip().endswith("</html>")
+    assert queued_streams == []
+    assert slots.in_use == 0
+
+
+def test_fast_primary_does_not_fire_the_hedge():
+    install_fake_openai(FakeOpenAIClient(latency=0.01), "hedge-primary-key")
+    secondary = install_fake_openai(FakeOpenAIClient(latency=0.01), "hedge-unused-key")
+    secondary_streams = recording(secondary)
+    before = get_hedge_stats().get_stats()
+
+    generate_portfolio_html_hedged(
+        sample_profile(), (FAKE_PROVIDER, "hedge-primary-key", "fake"), (FAKE_PROVIDER, "hedge-unused-key", "fake"),
+        hedge_delay=2.0, use_cache=False
+    )
+
+    assert secondary_streams == []
+    assert counts(before)["primary_wins"] == 1
+
+
+def test_both_failing_raises():
+    install_fake_openai(FakeOpenAIClient(latency=0.01, failure_rate=1.0), "hedge-broken-key")
+    with pytest.raises(Exception, match="Error generating portfolio"):
+        generate_portfolio_html_hedged(
+            sample_profile(), (FAKE_PROVIDER, "hedge-broken-key", "fake"), (FAKE_PROVIDER, "hedge-broken-key", "fake"),
+            hedge_delay=0.1, use_cache=False
+        )
@@ -0,0 +1,123 @@
+import threading
+import time
+
+import pytest
+
+from utils.fake_provider import sample_profile
+from utils.history import HistoryStore, apply_delta, history_key, make_delta, new_history_id
+from utils.renderer import render_portfolio_html
+
+
+@pytest.mark.parametrize("parent, child", [
+    ("", "<p>new</p>"),
+    ("<p>old</p>", ""),
+    ("<html><body><p>Hello</p></body></html>", "<html><body><p>Hello, world</p><p>More</p></body></html>"),
+    ("a b c d e", "e d c b a"),
+])
+def test_apply_delta_reverses_make_delta(parent, child):
+    assert apply_delta(parent, make_delta(parent, child)) == child
+
+
+def test_delta_copies_unchanged_runs_from_the_parent():
+    parent = render_portfolio_html(sample_profile())
+    child = parent.replace("</body>", "<footer>Updated</footer></body>")
+    delta = make_delta(parent, child)
+    assert apply_delta(parent, delta) == child
+    assert sum(len(part) for part in delta if isinstance(part, str)) < 100
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HistoryStore(str(tmp_path / "history.sqlite3"), max_versions=3)
+
+
+def page(number):
+    return render_portfolio_html(sample_profile()).replace("</body>", f"<p>Revision {number}</p></body>")
+
+
+def test_versions_are_stored_as_deltas_and_restored(store):
+    first = store.save("alice", {"n": 1}, page(1))
+    second = store.save("alice", {"n": 2}, page(2), parent_id=first)
+
+    assert store.load("alice", second) == ({"n": 2}, page(2))
+    assert store.load("alice", first) == ({"n": 1}, page(1))
+    assert store.get_stats("alice")["stored_bytes"] < store.get_stats("alice")["html_bytes"]
+    assert store.load("bob", second) is None
+
+
+def test_same_input_and_output_is_not_stored_twice(store):
+    first = store.save("alice", {"n": 1}, page(1))
+    assert store.save("alice", {"n": 1}, page(1), parent_id=first) == first
+    assert store.find("alice", {"n": 1}) == first
+    assert store.get_stats("alice")["versions"] == 1
+
+
+def test_old_versions_are_pruned_and_their_children_kept_restorable(store):
+    parent = None
+    ids = []
+    for number in range(5):
+        parent = store.save("alice", {"n": number}, page(number), parent_id=parent)
+        ids.append(parent)
+
+    assert [version["id"] for version in store.list_versions("alice")] == ids[:-4:-1]
+    assert store.load("alice", ids[0]) is None
+    for number, version_id in list(enumerate(ids))[2:]:
+        assert store.load("alice", version_id)[1] == page(number)
+
+
+def test_versions_older_than_the_age_limit_are_pruned(tmp_path):
+    path = str(tmp_path / "history.sqlite3")
+    old = HistoryStore(path).save("alice", {"n": 1}, page(1))
+    expiring = HistoryStore(path, max_age_days=0)
+    time.sleep(0.01)
+    expiring.save("bob", {"n": 2}, page(2))
+    assert expiring.load("alice", old) is None
+
+
+def test_delete_user_removes_only_that_users_history(store):
+    store.save("alice", {"n": 1}, page(1))
+    kept = store.save("bob", {"n": 1}, page(1))
+    assert store.delete_user("alice") == 1
+    assert store.list_versions("alice") == []
+    assert store.load("bob", kept) is not None
+
+
+def test_concurrent_saves_do_not_conflict(store):
+    errors = []
+
+    def save_many(user):
+        parent = None
+        try:
+            for number in range(10):
+                parent = store.save(user, {"n": number}, page(number), parent_id=parent)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save_many, args=(f"user{i}",)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert all(store.get_stats(f"user{i}")["versions"] == 3 for i in range(6))
+
+
+def test_history_key_is_durable_and_validated():
+    history_id = new_history_id()
+    assert history_key(history_id=history_id) == history_key(history_id=f" {history_id.upper()} ")
+    assert history_key(history_id="not-an-id") is None
+    assert history_key() is None
+    assert history_key(user_email="Ada@Example.com", history_id=history_id) == history_key(user_email="ada@example.com")
+
+
+def test_versions_are_restored_in_a_later_session(tmp_path):
+    path = str(tmp_path / "history.sqlite3")
+    history_id = new_history_id()
+    first = HistoryStore(path).save(history_key(history_id=history_id), {"n": 1}, page(1))
+
+    # A new process and a new session that only has the history ID from the URL
+    later = HistoryStore(path)
+    user_key = history_key(history_id=history_id)
+    assert [version["id"] for version in later.list_versions(user_key)] == [first]
+    assert later.load(user_key, first) == ({"n": 1}, page(1))
+    assert later.list_versions(history_key(history_id=new_history_id())) == []
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from utils.jobs import CANCELLED, DONE, FAILED, QUEUED, RUNNING, JobScheduler, QueueFullError
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def busy_scheduler():
+    """A single-worker scheduler whose worker is held by a blocking job until release is set"""
+    scheduler = JobScheduler(max_workers=1, max_queued_per_user=3, max_queue_depth=4)
+    release = threading.Event()
+    blocker = scheduler.submit("blocker", lambda job: release.wait(5))
+    wait_for(lambda: scheduler.get(blocker)["status"] == RUNNING)
+    yield scheduler, release
+    release.set()
+
+
+def test_queued_jobs_are_dispatched_round_robin_across_users(busy_scheduler):
+    scheduler, release = busy_scheduler
+    order = []
+
+    def record(name):
+        return lambda job: order.append(name) or name
+
+    a1 = scheduler.submit("alice", record("a1"))
+    a2 = scheduler.submit("alice", record("a2"))
+    b1 = scheduler.submit("bob", record("b1"))
+    assert [scheduler.get(job_id)["position"] for job_id in (a1, b1, a2)] == [1, 2, 3]
+
+    release.set()
+    wait_for(lambda: scheduler.get(a2)["status"] == DONE)
+    assert order == ["a1", "b1", "a2"]
+    assert scheduler.get(b1)["result"] == "b1"
+
+
+def test_cancelled_queued_job_never_runs(busy_scheduler):
+    scheduler, release = busy_scheduler
+    ran = []
+    job_id = scheduler.submit("alice", lambda job: ran.append(job.id))
+    later = scheduler.submit("alice", lambda job: "later")
+
+    assert scheduler.cancel(job_id)
+    assert scheduler.get(job_id)["status"] == CANCELLED
+    assert scheduler.get(later)["position"] == 1
+    release.set()
+    wait_for(lambda: scheduler.get(later)["status"] == DONE)
+    assert ran == []
+    assert not scheduler.cancel(job_id)
+
+
+def test_cancelled_running_job_is_reported_at_once_and_its_result_dropped():
+    scheduler = JobScheduler(max_workers=1)
+    started, stopped = threading.Event(), threading.Event()
+
+    def work(job):
+        started.set()
+        wait_for(job.is_cancelled)
+        stopped.set()
+        return "too late"
+
+    job_id = scheduler.submit("alice", work)
+    started.wait(5)
+    assert scheduler.cancel(job_id)
+    assert scheduler.get(job_id)["status"] == CANCELLED
+    stopped.wait(5)
+    wait_for(lambda: scheduler.get_stats()["running"] == 0)
+    snapshot = scheduler.get(job_id)
+    assert snapshot["status"] == CANCELLED
+    assert snapshot["result"] is None
+    assert scheduler.get_stats()["cancelled"] == 1
+
+
+def test_failures_are_reported_with_their_message():
+    scheduler = JobScheduler(max_workers=1)
+
+    def fail(job):
+        raise Exception("upstream down")
+
+    job_id = scheduler.submit("alice", fail)
+    wait_for(lambda: scheduler.get(job_id)["status"] not in (QUEUED, RUNNING))
+    assert scheduler.get(job_id)["status"] == FAILED
+    assert scheduler.get(job_id)["error"] == "upstream down"
+
+
+def test_queue_limits_reject_new_jobs(busy_scheduler):
+    scheduler, _ = busy_scheduler
+    for _ in range(3):
+        scheduler.submit("alice", lambda job: None)
+    with pytest.raises(QueueFullError):
+        scheduler.submit("alice", lambda job: None)
+
+    scheduler.submit("bob", lambda job: None)
+    with pytest.raises(QueueFullError):
+        scheduler.submit("carol", lambda job: None)
+    assert scheduler.get_stats()["rejected"] == 2
@@ -0,0 +1,80 @@
+from utils.optimizer import minify_js, optimize_css, optimize_html, selector_may_match
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <style>
+    .card { color: red; }
+    .unused { color: blue; }
+    .card { color: red; }
+    a[href^="http"] { color: green; }
+    @media (max-width: 600px) { .gone { display: none; } .card { padding: 0; } }
+  </style>
+</head>
+<body>
+  <!-- section:about -->
+  <div class="card">  Hello   <b>world</b>  </div>
+  <a href="https://example.com">link</a>
+  <!-- a note -->
+  <pre>  keep
+    this  </pre>
+  <script>
+    // greet
+    var message = "two  spaces";
+    document.body.classList.add("dynamic");
+  </script>
+</body>
+</html>"""
+
+
+def test_optimize_html_drops_unused_and_duplicate_rules():
+    html, stats = optimize_html(PAGE)
+
+    assert ".unused" not in html
+    assert ".gone" not in html
+    assert html.count(".card{color:red}") == 1
+    assert 'a[href^="http"]' in html
+    assert stats["removed_rules"] == 2
+    assert stats["duplicate_rules"] == 1
+    assert stats["optimized_bytes"] < stats["original_bytes"]
+
+
+def test_optimize_html_keeps_significant_content():
+    html, _ = optimize_html(PAGE)
+
+    assert "<!-- section:about -->" in html
+    assert "a note" not in html
+    assert "<pre>  keep\n    this  </pre>" in html
+    assert '"two  spaces"' in html
+    assert "// greet" not in html
+    assert "Hello <b>world</b>" in html
+
+
+def test_optimize_html_is_idempotent():
+    once, _ = optimize_html(PAGE)
+    twice, _ = optimize_html(once)
+    assert twice == once
+
+
+def test_selector_may_match_is_conservative():
+    used = {"tags": {"div", "a"}, "classes": {"card"}, "ids": {"top"}}
+    assert selector_may_match("div.card > a:hover", used)
+    assert selector_may_match("#top .card::before", used)
+    assert selector_may_match(".esc\\:aped", used)
+    assert not selector_may_match(".card .missing", used)
+    assert not selector_may_match("section", used)
+
+
+def test_classes_named_in_scripts_are_kept():
+    stats = {"removed_rules": 0, "duplicate_rules": 0}
+    used = {"tags": {"div"}, "classes": {"card", "dynamic"}, "ids": set()}
+    css = optimize_css(".dynamic { color: red } .other { color: blue }", used, stats)
+    assert css == ".dynamic{color:red}"
+
+
+def test_minify_js_keeps_strings_and_regexes():
+    js = 'var re = /a  b/g; // comment\nvar s = "x // y";\nreturn a / b;'
+    minified = minify_js(js)
+    assert "/a  b/g" in minified
+    assert '"x // y"' in minified
+    assert "comment" not in minified
@@ -0,0 +1,109 @@
+import contextvars
+import threading
+
+import pytest
+
+from utils import providers
+from utils.providers import (
+    GenerationCancelled, UpstreamSlots, UpstreamStream, cancel_scope, is_cancelled, upstream_limit, upstream_slot
+)
+
+
+@pytest.fixture
+def one_slot(monkeypatch):
+    slots = UpstreamSlots(1)
+    monkeypatch.setattr(providers, "_upstream_slots", slots)
+    monkeypatch.setattr(providers, "SLOT_POLL_SECONDS", 0.01)
+    return slots
+
+
+def test_cancel_scope_is_seen_by_threads_started_with_its_context():
+    stop = threading.Event()
+    seen = []
+    with cancel_scope(stop.is_set):
+        stop.set()
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(lambda: seen.append(is_cancelled()),))
+        thread.start()
+        thread.join()
+    assert seen == [True]
+    assert not is_cancelled()
+
+
+def test_nested_cancel_scope_also_honours_the_outer_one():
+    outer, inner = threading.Event(), threading.Event()
+    with cancel_scope(outer.is_set), cancel_scope(inner.is_set):
+        assert not is_cancelled()
+        outer.set()
+        assert is_cancelled()
+    inner.set()
+    with cancel_scope(threading.Event().is_set), cancel_scope(inner.is_set):
+        assert is_cancelled()
+
+
+def test_waiting_for_a_slot_stops_when_cancelled(one_slot):
+    one_slot.acquire()
+    stop = threading.Event()
+    stop.set()
+    with cancel_scope(stop.is_set), pytest.raises(GenerationCancelled):
+        with upstream_slot():
+            pass
+    one_slot.release()
+    with upstream_slot():
+        assert not one_slot.acquire(timeout=0)
+    assert one_slot.in_use == 0
+
+
+class ClosableResponse:
+    def __init__(self):
+        self.closed = False
+
+    def __iter__(self):
+        return iter(["a", "b"])
+
+    def close(self):
+        self.closed = True
+
+
+def test_upstream_stream_releases_its_slot_once(one_slot):
+    one_slot.acquire()
+    response = ClosableResponse()
+    stream = UpstreamStream(response, iter(response))
+    assert stream.cancellable
+    stream.close()
+    stream.close()
+    assert response.closed
+    assert one_slot.in_use == 0
+
+
+def test_stream_without_close_is_not_cancellable(one_slot):
+    one_slot.acquire()
+    stream = UpstreamStream(object(), iter(["a"]))
+    assert not stream.cancellable
+    assert list(stream) == ["a"]
+    assert one_slot.in_use == 0
+
+
+def test_upstream_limit_raises_the_cap_inside_its_block(one_slot):
+    one_slot.acquire()
+    with upstream_limit(3):
+        assert one_slot.acquire(timeout=0)
+        assert one_slot.acquire(timeout=0)
+        assert not one_slot.acquire(timeout=0)
+        one_slot.release()
+        one_slot.release()
+    assert one_slot.limit == 1
+    assert not one_slot.acquire(timeout=0)
+
+
+def test_raising_the_limit_wakes_waiting_calls(one_slot):
+    one_slot.acquire()
+    acquired = threading.Event()
+    waiter = threading.Thread(target=lambda: one_slot.acquire(timeout=5) and acquired.set())
+    waiter.start()
+    assert not acquired.wait(0.05)
+    one_slot.resize(2)
+    waiter.join(5)
+    assert acquired.is_set()
+    with pytest.raises(ValueError):
+        for _ in range(3):
+            one_slot.release()
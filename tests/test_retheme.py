@@ -0,0 +1,62 @@
+import pytest
+
+from utils.fake_provider import sample_profile
+from utils.renderer import render_portfolio_html
+from utils.retheme import is_theme_only_change, retheme_html
+from utils.templates import get_color_schemes, get_font_pairs
+
+
+@pytest.fixture
+def profile():
+    return sample_profile()
+
+
+def test_retheme_rewrites_colors_and_fonts(profile):
+    html = render_portfolio_html(profile)
+    new_scheme = get_color_schemes()["Cyberpunk Neon"]
+    new_pair = get_font_pairs()["Inter & Lora"]
+
+    rethemed, report = retheme_html(html, profile["design"], "Cyberpunk Neon", "Inter & Lora")
+
+    assert report["themable"]
+    assert report["changes"]["colors"] > 0 and report["changes"]["font_families"] > 0
+    assert "#667eea" not in rethemed.lower()
+    assert new_scheme["secondary"].lower() in rethemed.lower()
+    assert new_pair["heading"] in rethemed
+    assert "Poppins" not in rethemed
+
+
+def test_retheme_round_trip_restores_the_page(profile):
+    html = render_portfolio_html(profile)
+    design = profile["design"]
+    rethemed, _ = retheme_html(html, design, "Nature Green", "Inter & Lora")
+    restored, report = retheme_html(
+        rethemed, dict(design, theme="Nature Green", fonts="Inter & Lora"), design["theme"], design["fonts"]
+    )
+    assert report["themable"]
+    assert restored == html
+
+
+def test_page_without_scheme_colors_is_not_themable(profile):
+    html = "<html><head><style>body { color: #123456; }</style></head><body></body></html>"
+    rethemed, report = retheme_html(html, profile["design"], "Cyberpunk Neon")
+    assert not report["themable"]
+    assert rethemed == html
+
+
+def test_unknown_theme_is_not_themable(profile):
+    html = render_portfolio_html(profile)
+    _, report = retheme_html(html, profile["design"], "No Such Theme")
+    assert not report["themable"]
+
+
+def test_theme_only_change_detection(profile):
+    retheme = dict(profile, design=dict(profile["design"], theme="Minimalist", fonts="Inter & Lora"))
+    relayout = dict(profile, design=dict(profile["design"], layout="Grid"))
+    edited = dict(profile, name="Someone Else")
+
+    assert is_theme_only_change(profile, retheme)
+    assert not is_theme_only_change(profile, dict(profile))
+    assert not is_theme_only_change(profile, relayout)
+    assert not is_theme_only_change(profile, edited)
+    assert not is_theme_only_change(None, profile)
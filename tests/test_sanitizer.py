@@ -0,0 +1,104 @@
+import pytest
+
+from utils.sanitizer import StreamingSanitizer, sanitize_html, sanitize_stream
+
+DOCUMENT = "<!DOCTYPE html>\n<html><head><title>a < b</title></head><body><p>Hi</p></body></html>"
+RAW = f"Sure! Here is your portfolio:\n```html\n{DOCUMENT}\n```\nLet me know if you want changes."
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(RAW)])
+def test_stream_output_matches_whole_string_cleanup(size):
+    assert "".join(sanitize_stream(chunked(RAW, size))) == DOCUMENT
+    assert sanitize_html(RAW) == DOCUMENT
+
+
+def test_preamble_and_trailing_note_are_dropped():
+    sanitizer = StreamingSanitizer()
+    emitted = "".join(sanitizer.feed(chunk) for chunk in chunked(RAW, 5)) + sanitizer.close()
+
+    assert emitted == DOCUMENT
+    assert sanitizer.complete
+    assert sanitizer.stats["output_chars"] == len(DOCUMENT)
+    assert sanitizer.stats["dropped_chars"] == len(RAW) - len(DOCUMENT)
+
+
+@pytest.mark.parametrize("size", [1, 4, 100])
+def test_closing_fence_without_end_tag_is_removed(size):
+    sanitizer = StreamingSanitizer()
+    raw = "```html\n<html><body>x</body>\n```\n"
+    emitted = "".join(sanitizer.feed(chunk) for chunk in chunked(raw, size)) + sanitizer.close()
+    assert emitted == "<html><body>x</body>"
+    assert sanitizer.stats["fence_lines"] == 1
+
+
+def test_nothing_is_emitted_before_the_document_starts():
+    sanitizer = StreamingSanitizer()
+    assert sanitizer.feed("Here you go:\n```html\n") == ""
+    assert not sanitizer.started
+    assert sanitizer.feed("<!DOCTYPE html><html>").startswith("<!DOCTYPE html>")
+    assert sanitizer.started
+
+
+def test_split_end_tag_is_held_back():
+    sanitizer = StreamingSanitizer()
+    emitted = sanitizer.feed("<html><body>x</body></ht")
+    assert emitted == "<html><body>x</body>"
+    assert sanitizer.pending == "</ht"
+    assert sanitizer.open_tags == ["html"]
+    assert sanitizer.feed("ml>\nThanks!") == "</html>"
+    assert sanitizer.complete
+
+
+def test_close_with_repair_closes_open_elements():
+    sanitizer = StreamingSanitizer()
+    emitted = sanitizer.feed("<!DOCTYPE html><html><body><div><p>cut off")
+    emitted += sanitizer.close(repair=True)
+    assert emitted.endswith("cut off</p></div></body></html>")
+
+
+def test_repair_finishes_a_truncated_tag():
+    sanitizer = StreamingSanitizer()
+    emitted = sanitizer.feed("<html><body><a href=\"x\"") + sanitizer.close(repair=True)
+    assert emitted == "<html><body><a href=\"x\"></a></body></html>"
+
+
+def test_fragment_without_document_start_is_returned_on_close():
+    assert sanitize_html("```html\n<section>Only a fragment</section>\n```") == "<section>Only a fragment</section>"
+
+
+def test_text_after_the_document_is_ignored():
+    sanitizer = StreamingSanitizer()
+    sanitizer.feed(DOCUMENT)
+    assert sanitizer.feed("<p>more</p>") == ""
+    assert sanitizer.stats["dropped_chars"] == len("<p>more</p>")
+
+
+@pytest.mark.parametrize("size", [1, 3, 16, 1000])
+def test_end_tag_inside_a_script_does_not_end_the_document(size):
+    document = (
+        "<!DOCTYPE html>\n<html><body><script>const page = '<p>x</p></html>';</script>"
+        "<p title=\"</html>\">kept</p></body></html>"
+    )
+    sanitizer = StreamingSanitizer()
+    emitted = "".join(sanitizer.feed(chunk) for chunk in chunked(document + "\nDone!", size)) + sanitizer.close()
+
+    assert emitted == document
+    assert sanitizer.complete
+
+
+@pytest.mark.parametrize("size", [1, 5, 1000])
+def test_fence_lines_inside_pre_and_script_are_kept(size):
+    document = (
+        "<!DOCTYPE html>\n<html><body><pre><code>\n```python\nprint(1)\n```\n</code></pre>\n"
+        "<script>\nconst md = `\n```\n`;\n</script>\n</body>"
+    )
+    raw = f"```html\n{document}\n```\n"
+    sanitizer = StreamingSanitizer()
+    emitted = "".join(sanitizer.feed(chunk) for chunk in chunked(raw, size)) + sanitizer.close()
+
+    assert emitted == document
+    assert sanitizer.stats["fence_lines"] == 1
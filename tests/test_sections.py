@@ -0,0 +1,102 @@
+import copy
+
+import pytest
+
+from utils import sections
+from utils.fake_provider import sample_profile
+from utils.optimizer import optimize_html
+from utils.sections import (
+    SECTION_MARKER_RE, dirty_sections, fingerprint_sections, regenerate_changed_sections, splice_sections
+)
+
+SKELETON = """<!DOCTYPE html><html><head>
+<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css">
+<style>section { padding: 1rem; } .card { color: red; }</style>
+</head><body><main>
+<!-- SECTION:hero -->
+<!-- SECTION:skills -->
+<!-- SECTION:projects -->
+<!-- SECTION:experience -->
+<!-- SECTION:education -->
+<!-- SECTION:contact -->
+</main></body></html>"""
+ICONS = {"hero": "github", "projects": "code", "contact": "envelope"}
+
+
+@pytest.fixture
+def fake_sections(monkeypatch):
+    """Stand in for the model: a fixed shell, and sections that show which data they were built from"""
+    requested = []
+
+    def generate_section(section_id, fields, class_names, api_key, provider, model):
+        requested.append(section_id)
+        titles = ", ".join(project.get("name", "") for project in fields.get("projects", []))
+        icon = "rocket" if "Rocket" in titles else ICONS.get(section_id, "star")
+        return f'<section id="{section_id}"><i class="fas fa-{icon}"></i><div class="card">{section_id} {titles}</div></section>'
+
+    monkeypatch.setattr(sections, "request_completion", lambda *args, **kwargs: SKELETON)
+    monkeypatch.setattr(sections, "generate_section", generate_section)
+    return requested
+
+
+def marked_sections(html_content):
+    return {match.group(1): match.group(0) for match in SECTION_MARKER_RE.finditer(html_content)}
+
+
+def regenerate(html_content, fingerprints, data):
+    return regenerate_changed_sections(html_content, fingerprints, data, "key", "OpenAI", "fake-model", use_cache=False)
+
+
+def test_dirty_sections_follow_the_changed_fields():
+    data = sample_profile()
+    fingerprints = fingerprint_sections(data)
+    edited = copy.deepcopy(data)
+    edited["personal"]["email"] = "new@example.com"
+    assert dirty_sections(fingerprints, fingerprint_sections(edited)) == ["hero", "contact"]
+
+    edited["design"]["theme"] = "Minimalist"
+    assert dirty_sections(fingerprints, fingerprint_sections(edited)) is None
+    assert dirty_sections(None, fingerprints) is None
+
+
+def test_only_changed_sections_are_regenerated_and_spliced(fake_sections):
+    data = sample_profile()
+    html_content, fingerprints, built = regenerate(None, None, data)
+    page, _ = optimize_html(html_content)
+    before = marked_sections(page)
+    assert "font-awesome" not in page
+
+    edited = copy.deepcopy(data)
+    edited["projects"].append({"name": "Rocket Launcher", "description": "Launches rockets"})
+    fake_sections.clear()
+    spliced, new_fingerprints, regenerated = regenerate(page, fingerprints, edited)
+    after_page, _ = optimize_html(spliced)
+    after = marked_sections(after_page)
+
+    assert regenerated == ["projects"] and fake_sections == ["projects"]
+    assert new_fingerprints == fingerprint_sections(edited)
+    assert set(after) == set(before)
+    for section_id in before:
+        if section_id != "projects":
+            assert after[section_id] == before[section_id]
+    assert "Rocket Launcher" in after["projects"] and "Rocket Launcher" not in before["projects"]
+    # The new section's icon still renders once the spliced page is optimized again
+    assert "font-awesome" not in after_page
+    assert after_page.count('<symbol id="fa-icon-rocket"') == 1
+
+
+def test_removed_section_is_dropped(fake_sections):
+    data = sample_profile()
+    html_content, fingerprints, _ = regenerate(None, None, data)
+    edited = dict(data, education=[])
+    spliced, _, regenerated = regenerate(html_content, fingerprints, edited)
+    assert regenerated == ["education"]
+    assert "education" not in marked_sections(spliced)
+    assert fake_sections.count("education") == 1
+
+
+def test_splice_inserts_sections_without_a_marker():
+    page = "<html><body><main><!-- section:hero -->\n<section>old</section>\n<!-- /section:hero --></main></body></html>"
+    spliced = splice_sections(page, {"hero": "<section>new</section>", "contact": "<section>mail</section>"})
+    assert "old" not in spliced
+    assert spliced.index("section:hero") < spliced.index("section:contact") < spliced.index("</main>")
@@ -0,0 +1,84 @@
+from utils.optimizer import optimize_html
+from utils.sections import splice_sections, wrap_section
+from utils.trim import rewrite_font_url, trim_assets, trim_icons, used_font_weights
+
+FA_LINK = '<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">'
+FONTS_URL = "https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&amp;family=Roboto:wght@300;400;500"
+
+
+def icon_page(body, style=""):
+    return f"<html><head>{FA_LINK}<style>{style}</style></head><body>{body}</body></html>"
+
+
+def test_used_icons_are_inlined_as_a_sprite():
+    html, icons = trim_icons(icon_page('<i class="fab fa-github"></i><i class="fas fa-arrow-up fa-lg"></i>'))
+
+    assert icons == ["github", "arrow-up"]
+    assert "font-awesome" not in html
+    assert html.count("<symbol ") == 2
+    assert '<i class="fab fa-github" aria-hidden="true"><svg class="fa-svg"><use href="#fa-icon-github"></use></svg></i>' in html
+    assert ".fa-svg{" in html
+
+
+def test_stylesheet_is_kept_when_the_sprite_cannot_serve_the_page():
+    unknown = icon_page('<i class="fas fa-not-in-the-set"></i>')
+    css_icons = icon_page('<i class="fas fa-github"></i>', style='.x::before { content: "\\f09b"; }')
+    scripted = icon_page('<i class="fas fa-sun"></i><script>el.classList.replace("fa-sun", "fa-moon")</script>')
+
+    for html in (unknown, css_icons, scripted):
+        assert trim_icons(html) == (html, [])
+
+
+def test_used_font_weights():
+    css = "<style>body{font-weight:300} .b{font:bold 1rem Roboto}</style><h1>x</h1>"
+    assert used_font_weights(css) == {300, 400, 700}
+    assert used_font_weights("<style>p{font-weight:var(--w)}</style>") is None
+
+
+def test_font_url_requests_only_used_weights_with_swap():
+    url, removed = rewrite_font_url(FONTS_URL, {400, 700})
+    assert url == (
+        "https://fonts.googleapis.com/css2?family=Poppins:wght@400;700"
+        "&amp;family=Roboto:wght@400;500&amp;display=swap"
+    )
+    assert removed == 4
+
+    url, removed = rewrite_font_url(FONTS_URL, None)
+    assert url == FONTS_URL + "&amp;display=swap"
+    assert removed == 0
+
+
+def test_trim_assets_adds_preconnects_before_the_font_request():
+    html = f'<html><head><link href="{FONTS_URL}" rel="stylesheet"></head><body><p>x</p></body></html>'
+    trimmed, stats = trim_assets(html)
+
+    assert stats == {"icons_inlined": 0, "font_weights_removed": 6}
+    assert trimmed.index('rel="preconnect" href="https://fonts.gstatic.com"') < trimmed.index("css2?family")
+    assert "display=swap" in trimmed
+    assert trim_assets(trimmed) == (trimmed, {"icons_inlined": 0, "font_weights_removed": 0})
+
+
+def test_icons_added_after_trimming_extend_the_sprite():
+    page = icon_page(wrap_section("hero", '<section id="hero"><i class="fab fa-github"></i></section>'))
+    optimized, _ = optimize_html(page)
+    spliced = splice_sections(optimized, {"projects": '<section id="projects"><i class="fas fa-rocket fa-lg"></i></section>'})
+    reoptimized, stats = optimize_html(spliced)
+
+    assert "font-awesome" not in reoptimized
+    assert stats["icons_inlined"] == 1
+    assert reoptimized.count('<symbol id="fa-icon-github"') == 1
+    assert reoptimized.count('<symbol id="fa-icon-rocket"') == 1
+    assert '<use href="#fa-icon-rocket"></use>' in reoptimized
+    assert ".fa-lg{" in reoptimized
+    assert reoptimized.count(".fa-svg{") == 1
+    assert optimize_html(reoptimized)[0] == reoptimized
+
+
+def test_stylesheet_is_restored_for_new_icons_the_sprite_cannot_serve():
+    trimmed, _ = trim_icons(icon_page('<i class="fab fa-github"></i>'))
+    added = trimmed.replace("</body>", '<i class="fas fa-not-in-the-set"></i></body>')
+    restored, icons = trim_icons(added)
+
+    assert icons == []
+    assert restored.count("font-awesome") == 1
+    assert '<use href="#fa-icon-github"></use>' in restored
@@ -1,163 +1,274 @@
-from openai import OpenAI
-import google.generativeai as genai
-import streamlit as st
+import os
+import re
+import time
 
-def test_api_key(api_key, provider, model):
-    """Test if API key is valid"""
-    try:
-        if "OpenAI" in provider:
-            client = OpenAI(api_key=api_key)
-            client.models.list()  # Test OpenAI API
-            return True, "API key is valid"
-        else:
-            genai.configure(api_key=api_key)
-            test_model = genai.GenerativeModel(model)  # Use the provided model
-            response = test_model.generate_content("Hello")  # Simple test prompt
-            return True, "API key is valid"
-    except Exception as e:
-        return False, f"API key validation failed: {str(e)}"
-
-def generate_portfolio_html(data, api_key, provider, model):
-    """Generate complete portfolio HTML using AI"""
-
-    # Create comprehensive prompt
-    prompt = f"""
-    Create a STUNNING, PROFESSIONAL, and FULLY RESPONSIVE portfolio website as a single HTML file with inline CSS and JavaScript.
-
-    ## Personal Information:
-    - Name: {data['personal']['name']}
-    - Title: {data['personal']['title']}
-    - Bio: {data['personal']['bio']}
-    - Email: {data['personal']['email']}
-    - Phone: {data['personal']['phone']}
-    - Location: {data['personal']['location']}
-
-    ## Social Links:
-    - GitHub: {data['social']['github']}
-    - LinkedIn: {data['social']['linkedin']}
-    - Twitter: {data['social']['twitter']}
-    - Website: {data['social']['website']}
-
-    ## Skills:
-    - Technical: {data['skills']['technical']}
-    - Soft Skills: {data['skills']['soft']}
-    - Tools: {data['skills']['tools']}
-
-    ## Projects:
-    {chr(10).join([f"### {p['name']}\n- Tech: {p['technologies']}\n- Description: {p['description']}\n- URL: {p['url']}\n- Date: {p['date']}" for p in data['projects']]) if data['projects'] else "No projects listed"}
-
-    ## Experience:
-    {chr(10).join([f"### {e['title']} at {e['company']}\n- Duration: {e['duration']}\n- Location: {e['location']}\n- Description: {e['description']}" for e in data['experience']]) if data['experience'] else "No experience listed"}
-
-    ## Education:
-    {chr(10).join([f"### {ed['degree']}\n- Institution: {ed['institution']}\n- Year: {ed['year']}\n- GPA: {ed['gpa']}" for ed in data['education']]) if data['education'] else "No education listed"}
-
-    ## Certifications:
-    {data['certifications'] if data['certifications'] else "No certifications listed"}
-
-    ## Design Requirements:
-    - Theme: {data['design']['theme']}
-    - Layout: {data['design']['layout']}
-    - Fonts: {data['design']['fonts']}
-    - Animations: {', '.join(data['design']['animations'])}
-    - Primary Color: {data['design']['color_scheme']['primary']}
-    - Secondary Color: {data['design']['color_scheme']['secondary']}
-
-    ## Features to Include:
-    - Contact Form: {data['options']['contact_form']}
-    - Resume Download Button: {data['options']['resume_button']}
-    - Testimonials: {data['options']['testimonials']}
-    - SEO Optimized: {data['options']['seo']}
-    - Google Analytics Ready: {data['options']['analytics']}
-
-    ## Technical Requirements:
-    1. Create a COMPLETE single HTML file with inline CSS and JavaScript
-    2. Make it FULLY RESPONSIVE (mobile, tablet, desktop)
-    3. Use the specified color scheme and fonts
-    4. Include smooth scroll behavior
-    5. Add hover effects and animations as specified
-    6. Use Font Awesome icons (via CDN)
-    7. Include meta tags for SEO with proper title, description, keywords
-    8. Add smooth transitions between sections
-    9. Make navigation sticky/fixed on scroll
-    10. Include a hero section with gradient background matching the theme
-    11. Use CSS Grid/Flexbox for modern, responsive layouts
-    12. Add scroll-triggered animations using Intersection Observer
-    13. Include social media icons with proper links
-    14. Make all buttons and links beautifully styled with hover effects
-    15. Add a professional footer with copyright and links
-    16. Use CSS variables for easy theming
-    17. Make the contact form functional with FormSpree or EmailJS integration
-    18. Add smooth page transitions and loading states
-    19. Include proper semantic HTML5
-    20. Ensure WCAG accessibility compliance
-
-    ## Style Guidelines:
-    - Use the {data['design']['theme']} color palette with gradients
-    - Apply {data['design']['fonts']} font pairing from Google Fonts
-    - Implement {data['design']['layout']} layout structure
-    - Include these animations: {', '.join(data['design']['animations'])}
-    - Professional spacing, shadows, rounded corners, and transitions
-    - Use placeholder images from placeholder.com or unsplash
-
-    ## CRITICAL REQUIREMENTS:
-    - Start DIRECTLY with <!DOCTYPE html>
-    - End with </html>
-    - Do NOT include markdown code blocks (```)
-    - Do NOT include explanations or comments outside the HTML
-    - Make it production-ready and visually stunning
-    - Ensure all sections flow naturally
-    - Test all interactive elements work properly
-
-    Generate ONLY the complete, production-ready HTML code now.
+from utils.cache import get_generation_cache, make_cache_key
+from utils.prompts import build_prompt
+from utils.providers import get_provider
+from utils.routing import get_routing_log, resolve_model
+from utils.sanitizer import FENCE_LINE_RE, StreamingSanitizer, sanitize_html
+from utils.validation import validate_api_key
+
+# Bump when the prompt changes so cached portfolios from the old prompt are not reused
+PROMPT_VERSION = 3
+
+GENERATION_CONFIG = {
+    'temperature': 0.7,
+    'top_p': 0.95,
+    'top_k': 40,
+    'max_tokens': 16000,
+}
+
+# Follow-up requests allowed when a document is cut off by the output limit
+MAX_CONTINUATIONS = int(os.environ.get("PORTFOLIO_MAX_CONTINUATIONS", "2"))
+# How much of the partial document is quoted back when asking for the rest
+CONTINUATION_TAIL_CHARS = 1500
+# A stream keeps only this much of its output as context for a continuation
+STREAM_CONTEXT_CHARS = 24000
+
+CONTINUATION_PROMPT = """Your previous reply was cut off by the output limit. It currently ends with:
+
+{tail}
+
+Continue the HTML from exactly that point. Output ONLY the remaining HTML, do not repeat anything already written, do not include markdown code blocks or explanations, and finish with </html>."""
+
+CLOSING_TAG_RE = re.compile(r"</[a-zA-Z][\w:-]*\s*>")
+
+def test_api_key(api_key, provider, model, force=False):
+    """Test if API key is valid
+
+    Uses a model metadata lookup rather than an inference call, and caches
+    the result per hashed key (see utils.validation).
     """
+    return validate_api_key(api_key, provider, model, force=force)
+
+def generation_cache_key(data, provider, model, mode="single"):
+    """Return the generation cache key for data, provider, model and generation mode"""
+    return make_cache_key(data, provider, model, dict(GENERATION_CONFIG, prompt_version=PROMPT_VERSION, mode=mode))
+
+def clean_html_response(html_content):
+    """Strip markdown fences, any preamble before the DOCTYPE and any prose after </html>"""
+    return sanitize_html(html_content)
+
+def request_completion_with_reason(system_prompt, prompt, api_key, provider, model, max_tokens=None,
+                                   history=()):
+    """Send a single non-streaming completion request
+
+    history is a sequence of ("assistant" | "user", text) turns that follow
+    the prompt, used to ask for the rest of a cut-off reply. Returns
+    (raw_text, hit_output_limit).
+    """
+    config = dict(GENERATION_CONFIG, max_tokens=max_tokens or GENERATION_CONFIG['max_tokens'])
+    return get_provider(provider).complete(system_prompt, prompt, api_key, model, config, history)
+
+def request_completion(system_prompt, prompt, api_key, provider, model, max_tokens=None):
+    """Send a single non-streaming completion request and return the raw text"""
+    return request_completion_with_reason(system_prompt, prompt, api_key, provider, model, max_tokens)[0]
+
+def is_complete_html(html_content):
+    """Structure check: a finished document ends with </html>"""
+    return html_content.rstrip()[-len("</html>"):].lower() == "</html>"
+
+def resume_point(html_content):
+    """Index just past the last complete closing tag, where a continuation can pick up"""
+    window = html_content[-20000:]
+    last = None
+    for last in CLOSING_TAG_RE.finditer(window):
+        pass
+    if last is None:
+        return html_content.rfind(">") + 1 or len(html_content)
+    return len(html_content) - len(window) + last.end()
+
+def _clean_continuation(text, partial_html):
+    """Strip fences, a stray lead-in line and any text repeated from the end of partial_html"""
+    lines = [line for line in text.splitlines(keepends=True) if not FENCE_LINE_RE.match(line.rstrip("\r\n"))]
+    if lines and "<" not in lines[0] and lines[0].rstrip().endswith(":"):
+        lines = lines[1:]
+    text = "".join(lines)
+    stripped = text.lstrip()
+    # Models often restart a few tags early; drop the longest repeated overlap
+    for size in range(min(len(stripped), len(partial_html), CONTINUATION_TAIL_CHARS), 7, -1):
+        if stripped.startswith(partial_html[-size:]):
+            return stripped[size:]
+    return text
+
+def request_continuation(system_prompt, prompt, partial_html, api_key, provider, model):
+    """Ask for the rest of a cut-off document; returns (text_to_append, hit_output_limit)"""
+    history = [
+        ("assistant", partial_html),
+        ("user", CONTINUATION_PROMPT.format(tail=partial_html[-CONTINUATION_TAIL_CHARS:])),
+    ]
+    text, truncated = request_completion_with_reason(
+        system_prompt, prompt, api_key, provider, model, history=history
+    )
+    return _clean_continuation(text, partial_html), truncated
+
+def continue_html(html_content, system_prompt, prompt, api_key, provider, model, max_continuations=MAX_CONTINUATIONS):
+    """Extend a truncated document with up to max_continuations follow-up requests
+
+    The first round resumes from the last complete element of the original
+    reply; later rounds append to the exact end of what the previous one
+    returned, like the streaming path, so no continuation is thrown away.
+    Rounds stop early once one adds nothing. If the document is still
+    unfinished, open elements are closed so the result still renders.
+    Returns (html, rounds_used).
+    """
+    rounds = 0
+    if not is_complete_html(html_content):
+        html_content = html_content[:resume_point(html_content)]
+    while rounds < max_continuations and not is_complete_html(html_content):
+        text, _ = request_continuation(system_prompt, prompt, html_content, api_key, provider, model)
+        rounds += 1
+        sanitizer = StreamingSanitizer()
+        extended = sanitizer.feed(html_content + text) + sanitizer.close()
+        if len(extended) <= len(html_content):
+            break
+        html_content = extended
+    if not is_complete_html(html_content):
+        sanitizer = StreamingSanitizer()
+        html_content = sanitizer.feed(html_content) + sanitizer.close(repair=True)
+    return html_content, rounds
+
+def generate_portfolio_html(data, api_key, provider, model, use_cache=True, refresh_cache=False,
+                            max_continuations=MAX_CONTINUATIONS):
+    """Generate complete portfolio HTML using AI
+
+    Results are cached by a hash of the normalized data, provider, model and
+    generation config. Pass refresh_cache=True to skip the lookup but still
+    store the fresh result, or use_cache=False to bypass the cache entirely.
+
+    A reply cut off by the output limit (or missing </html>) is finished with
+    up to max_continuations continuation requests instead of starting over.
+
+    model="auto" picks a model from the size of data (see utils.routing).
+    """
+    model, route = resolve_model(data, provider, model)
+    cache = get_generation_cache() if use_cache else None
+    cache_key = generation_cache_key(data, provider, model)
+    if cache and not refresh_cache:
+        cached_html = cache.get(cache_key)
+        if cached_html is not None:
+            return cached_html
+
+    system_prompt, prompt, _ = build_prompt(data)
+    started = time.monotonic()
 
     try:
-        if "OpenAI" in provider:
-            client = OpenAI(api_key=api_key)
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": "You are an expert web developer and designer who creates stunning, modern, responsive portfolio websites. Generate complete, production-ready HTML with inline CSS and JavaScript."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=16000
-            )
-            html_content = response.choices[0].message.content
-        else:
-            genai.configure(api_key=api_key)
-            ai_model = genai.GenerativeModel(model)
-            generation_config = {
-                'temperature': 0.7,
-                'top_p': 0.95,
-                'top_k': 40,
-                'max_output_tokens': 16000,
-            }
-            response = ai_model.generate_content(
-                prompt,
-                generation_config=generation_config
+        html_content, truncated = request_completion_with_reason(system_prompt, prompt, api_key, provider, model)
+        html_content = clean_html_response(html_content)
+        if truncated or not is_complete_html(html_content):
+            html_content, _ = continue_html(
+                html_content, system_prompt, prompt, api_key, provider, model, max_continuations
             )
-            html_content = response.text
+        if route:
+            get_routing_log().record(route, time.monotonic() - started)
+        if cache:
+            cache.set(cache_key, html_content)
+        return html_content
 
-        # Clean the response
-        html_content = html_content.strip()
+    except Exception as e:
+        if route:
+            get_routing_log().record(route, time.monotonic() - started, "error")
+        raise Exception(f"Error generating portfolio: {str(e)}")
 
-        # Remove markdown code blocks if present
-        if html_content.startswith('```html'):
-            html_content = html_content[7:]
-        elif html_content.startswith('```'):
-            html_content = html_content[3:]
+def stream_portfolio_html(data, api_key, provider, model, use_cache=True, refresh_cache=False,
+                          max_continuations=MAX_CONTINUATIONS, on_stream=None):
+    """Yield clean HTML chunks as the provider streams them
 
-        if html_content.endswith('```'):
-            html_content = html_content[:-3]
+    Each chunk passes through a StreamingSanitizer, so fences, preamble and
+    trailing prose never reach the caller and the chunks can be written out
+    as they arrive. Closing the generator (or abandoning it) closes the
+    upstream stream, so callers can cancel early. The result is only cached
+    once the stream completes. A cache hit is yielded as a single chunk.
 
-        # Ensure it starts with DOCTYPE
-        if not html_content.strip().startswith('<!DOCTYPE'):
-            if '<!DOCTYPE' in html_content:
-                html_content = html_content[html_content.index('<!DOCTYPE'):]
+    If the stream ends before </html>, up to max_continuations continuation
+    requests pick up from the exact end of what was already yielded.
 
-        return html_content.strip()
+    on_stream(stream) is called with the provider stream (see
+    utils.providers.UpstreamStream) as soon as it is opened. Unlike the
+    generator, it can be closed from another thread. An OpenAI stream opens
+    before its first chunk, so it can be closed while this one is still
+    waiting for that chunk; Gemini's opens only once the first chunk is in.
+
+    model="auto" picks a model from the size of data (see utils.routing).
+    """
+    model, route = resolve_model(data, provider, model)
+    cache = get_generation_cache() if use_cache else None
+    cache_key = generation_cache_key(data, provider, model)
+    if cache and not refresh_cache:
+        cached_html = cache.get(cache_key)
+        if cached_html is not None:
+            yield cached_html
+            return
+
+    stream = _stream_completion(data, api_key, provider, model, cache, cache_key, max_continuations, on_stream)
+    if route is None:
+        yield from stream
+        return
+    started = time.monotonic()
+    status = "cancelled"
+    try:
+        yield from stream
+        status = "ok"
+    except Exception:
+        status = "error"
+        raise
+    finally:
+        get_routing_log().record(route, time.monotonic() - started, status)
+
+def _stream_completion(data, api_key, provider, model, cache, cache_key, max_continuations, on_stream=None):
+    system_prompt, prompt, _ = build_prompt(data)
+    sanitizer = StreamingSanitizer()
+    # Only kept when the result is going to be cached
+    chunks = [] if cache else None
+    recent = []
+    response = None
+
+    def emit(text):
+        text = sanitizer.feed(text)
+        if text:
+            if cache:
+                chunks.append(text)
+            recent.append(text)
+            if len(recent) > 64:
+                recent[:] = [''.join(recent)[-STREAM_CONTEXT_CHARS:]]
+        return text
+
+    try:
+        response, texts = get_provider(provider).stream(system_prompt, prompt, api_key, model, GENERATION_CONFIG)
+        if on_stream:
+            on_stream(response)
+        for text in texts:
+            text = emit(text)
+            if text:
+                yield text
 
     except Exception as e:
         raise Exception(f"Error generating portfolio: {str(e)}")
+    finally:
+        close = getattr(response, 'close', None)
+        if close is not None:
+            close()
+
+    rounds = 0
+    while sanitizer.started and not sanitizer.complete and rounds < max_continuations:
+        # What was already yielded cannot be taken back, so resume from its exact end
+        partial_html = ''.join(recent)[-STREAM_CONTEXT_CHARS:] + sanitizer.pending
+        try:
+            text, _ = request_continuation(system_prompt, prompt, partial_html, api_key, provider, model)
+        except Exception as e:
+            raise Exception(f"Error generating portfolio: {str(e)}")
+        rounds += 1
+        if not text.strip():
+            break
+        text = emit(text)
+        if text:
+            yield text
+
+    text = sanitizer.close(repair=True)
+    if text:
+        if cache:
+            chunks.append(text)
+        yield text
+    if cache:
+        cache.set(cache_key, ''.join(chunks))
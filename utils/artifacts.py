@@ -0,0 +1,159 @@
+"""Content-addressed storage and serving for generated portfolios
+
+Each document is written once under its SHA-256 digest and served by a small
+background HTTP server, so the Streamlit preview can point an iframe at a URL
+instead of re-sending the whole document over the websocket on every rerun.
+
+The server only starts when PORTFOLIO_ARTIFACT_URL says where browsers can
+reach it (e.g. https://example.com/artifacts behind the same proxy as the
+app). A localhost default would point remote visitors at their own machine,
+and Streamlit's static file serving sends .html as text/plain, so without a
+public URL the preview is rendered inline.
+"""
+import functools
+import gzip
+import hashlib
+import os
+import re
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+ARTIFACT_DIR = os.environ.get("PORTFOLIO_ARTIFACT_DIR", os.path.join(".cache", "artifacts"))
+ARTIFACT_HOST = os.environ.get("PORTFOLIO_ARTIFACT_HOST", "127.0.0.1")
+ARTIFACT_PORT = int(os.environ.get("PORTFOLIO_ARTIFACT_PORT", "8765"))
+# Public base URL browsers use to reach the server, e.g. https://example.com/artifacts
+ARTIFACT_BASE_URL = os.environ.get("PORTFOLIO_ARTIFACT_URL", "")
+MAX_ARTIFACT_BYTES = 200 * 1024 * 1024
+# Artifacts stored or served this recently may still be open in a session and are never pruned
+ARTIFACT_IN_USE_SECONDS = 3600
+
+ARTIFACT_PATH_RE = re.compile(r"^/[0-9a-f]{32}\.html$")
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def artifact_digest(html_content):
+    """Return the content digest used to name an artifact"""
+    return hashlib.sha256(html_content.encode("utf-8")).hexdigest()[:32]
+
+
+def store_artifact(html_content, artifact_dir=ARTIFACT_DIR):
+    """Write html_content under its digest (once) and return the digest"""
+    digest = artifact_digest(html_content)
+    path = os.path.join(artifact_dir, f"{digest}.html")
+    if os.path.exists(path):
+        _touch(path)
+        return digest
+    os.makedirs(artifact_dir, exist_ok=True)
+    body = html_content.encode("utf-8")
+    # Precompressed copy is written first so the .html never exists without it
+    _write_atomic(f"{path}.gz", gzip.compress(body, compresslevel=9))
+    _write_atomic(path, body)
+    _prune(artifact_dir)
+    return digest
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _touch(path):
+    # mtime doubles as "last used", which _prune reads
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _prune(artifact_dir):
+    # Other sessions may prune the same directory concurrently, so files can vanish at any point
+    entries = []
+    for entry in os.scandir(artifact_dir):
+        if entry.name.endswith(".html"):
+            try:
+                info = entry.stat()
+            except OSError:
+                continue
+            entries.append((info.st_mtime, info.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    in_use_since = time.time() - ARTIFACT_IN_USE_SECONDS
+    for mtime, size, path in sorted(entries):
+        if total <= MAX_ARTIFACT_BYTES or mtime >= in_use_since:
+            break
+        for stale in (path, f"{path}.gz"):
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+        total -= size
+
+
+def artifact_url(digest):
+    """Return the public URL of a stored artifact; only meaningful while the server is serving"""
+    return f"{ARTIFACT_BASE_URL.rstrip('/')}/{digest}.html"
+
+
+class ArtifactRequestHandler(SimpleHTTPRequestHandler):
+    """Serves stored artifacts only, with long-lived immutable caching"""
+
+    def do_GET(self):
+        if not ARTIFACT_PATH_RE.match(self.path):
+            self.send_error(404)
+            return
+        path = self.translate_path(self.path)
+        _touch(path)
+        gz_path = path + ".gz"
+        if "gzip" in self.headers.get("Accept-Encoding", "") and os.path.exists(gz_path):
+            with open(gz_path, "rb") as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        super().do_GET()
+
+    def do_HEAD(self):
+        if not ARTIFACT_PATH_RE.match(self.path):
+            self.send_error(404)
+            return
+        super().do_HEAD()
+
+    def end_headers(self):
+        # Names are content hashes, so a URL's body can never change
+        self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_artifact_server(artifact_dir=ARTIFACT_DIR, host=ARTIFACT_HOST, port=ARTIFACT_PORT):
+    """Start the artifact server once per process; return True if it is serving
+
+    Returns False when PORTFOLIO_ARTIFACT_URL is not set, and the caller
+    renders the document inline instead.
+    """
+    global _server
+    if not ARTIFACT_BASE_URL:
+        return False
+    with _server_lock:
+        if _server is not None:
+            return True
+        os.makedirs(artifact_dir, exist_ok=True)
+        handler = functools.partial(ArtifactRequestHandler, directory=artifact_dir)
+        try:
+            _server = ThreadingHTTPServer((host, port), handler)
+        except OSError:
+            return False
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="artifact-server", daemon=True).start()
+        return True
@@ -0,0 +1,309 @@
+"""Offline page-performance audit for generated portfolios
+
+Checks a generated document for the things that usually make these pages
+slow to load: render-blocking stylesheets and scripts (Google Fonts, the
+Font Awesome CDN), heavy inline CSS/JS, large or deep DOMs, images without
+dimensions or lazy loading, and expensive animations such as particle
+backgrounds. Everything is computed from the HTML alone, so it runs in
+milliseconds and needs no browser or network.
+
+Findings that utils.optimizer can fix (the icon font, font loading, inline
+weight) are marked fixable, and suggest_fixes() returns the optimized page
+with its new score so the fix can be offered or applied.
+
+Usage:
+    python -m utils.audit portfolio.html [more.html ...] [--fix]
+"""
+import argparse
+import json
+import re
+import sys
+from html.parser import HTMLParser
+
+from utils.optimizer import optimize_html
+
+# Lighthouse starts warning around these sizes
+MAX_DOM_NODES = 1500
+MAX_DOM_DEPTH = 32
+MAX_INLINE_SCRIPT_BYTES = 30 * 1024
+MAX_INLINE_STYLE_BYTES = 50 * 1024
+MAX_DOCUMENT_BYTES = 150 * 1024
+MAX_INFINITE_ANIMATIONS = 3
+
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr",
+}
+KNOWN_ORIGINS = {
+    "fonts.googleapis.com": "Google Fonts",
+    "fonts.gstatic.com": "Google Fonts",
+    "cdnjs.cloudflare.com": "cdnjs",
+    "use.fontawesome.com": "Font Awesome",
+    "kit.fontawesome.com": "Font Awesome",
+}
+HOST_RE = re.compile(r"^(?:https?:)?//([^/:]+)", re.I)
+JS_TYPES = ("", "text/javascript", "application/javascript", "module")
+
+KEYFRAMES_RE = re.compile(r"@(?:-webkit-)?keyframes\b", re.I)
+INFINITE_ANIMATION_RE = re.compile(r"animation(?:-iteration-count)?\s*:[^;}]*\binfinite\b", re.I)
+PARTICLE_RE = re.compile(r"particle", re.I)
+RAF_RE = re.compile(r"requestAnimationFrame\s*\(")
+SCROLL_LISTENER_RE = re.compile(r"addEventListener\s*\(\s*['\"](?:scroll|wheel|touchmove)['\"]([^;]*)")
+EXPENSIVE_CSS_RE = re.compile(r"(?:backdrop-filter|filter)\s*:\s*[^;}]*blur\(", re.I)
+
+SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+# Findings optimize_html addresses: trim_assets inlines icons and trims fonts, minification cuts weight
+FIXABLE_FINDINGS = {"icon-font", "font-display", "font-preconnect", "inline-js-weight", "inline-css-weight", "document-weight"}
+
+
+def origin_label(url):
+    match = HOST_RE.match(url or "")
+    if not match:
+        return None
+    host = match.group(1).lower()
+    if host == "cdnjs.cloudflare.com" and "font-awesome" in url:
+        return "Font Awesome"
+    return KNOWN_ORIGINS.get(host, host)
+
+
+class _AuditParser(HTMLParser):
+    """Single pass over the document collecting the audit measurements"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.nodes = 0
+        self.max_depth = 0
+        self.stack = []
+        self.in_head = True
+        self.blocking_styles = []
+        self.blocking_scripts = []
+        self.preconnects = set()
+        self.images = []
+        self.iframes_without_lazy = 0
+        self.inline_scripts = []
+        self.inline_styles = []
+        self.style_attribute_bytes = 0
+        self.canvases = 0
+        self.particle_markup = 0
+        self._text_target = None
+
+    def handle_starttag(self, tag, attrs):
+        attributes = {name: (value or "") for name, value in attrs}
+        self.nodes += 1
+        if tag == "body":
+            self.in_head = False
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(tag)
+            self.max_depth = max(self.max_depth, len(self.stack))
+
+        if "style" in attributes:
+            self.style_attribute_bytes += len(attributes["style"].encode("utf-8"))
+        if PARTICLE_RE.search(attributes.get("class", "") + " " + attributes.get("id", "")):
+            self.particle_markup += 1
+
+        if tag == "link":
+            rel = attributes.get("rel", "").lower().split()
+            href = attributes.get("href", "")
+            if "preconnect" in rel or "dns-prefetch" in rel:
+                self.preconnects.add((HOST_RE.match(href) or [None, href])[1])
+            elif "stylesheet" in rel and self.in_head and attributes.get("media", "all").lower() in ("", "all", "screen"):
+                self.blocking_styles.append(href)
+        elif tag == "script":
+            script_type = attributes.get("type", "").lower()
+            if "src" in attributes:
+                # Only head resources hold up the first paint; body scripts block what follows them
+                if self.in_head and "async" not in attributes and "defer" not in attributes and script_type != "module":
+                    self.blocking_scripts.append(attributes["src"])
+            elif script_type in JS_TYPES:
+                self._text_target = self.inline_scripts
+                self.inline_scripts.append("")
+        elif tag == "style":
+            self._text_target = self.inline_styles
+            self.inline_styles.append("")
+        elif tag == "img":
+            self.images.append(attributes)
+        elif tag == "iframe" and attributes.get("loading", "").lower() != "lazy":
+            self.iframes_without_lazy += 1
+        elif tag == "canvas":
+            self.canvases += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and self.stack and self.stack[-1] == tag:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style"):
+            self._text_target = None
+        if tag in self.stack:
+            # Close implicitly-closed children too, as browsers do
+            while self.stack and self.stack.pop() != tag:
+                pass
+
+    def handle_data(self, data):
+        if self._text_target is not None:
+            self._text_target[-1] += data
+
+
+def _finding(findings, finding_id, severity, penalty, message):
+    findings.append({
+        "id": finding_id, "severity": severity, "penalty": penalty, "message": message,
+        "fixable": finding_id in FIXABLE_FINDINGS,
+    })
+
+
+def audit_html(html_content):
+    """Return {"score", "grade", "findings", "metrics"} for a generated document
+
+    The score starts at 100 and each finding subtracts its penalty. Findings
+    are sorted by severity, then by penalty.
+    """
+    parser = _AuditParser()
+    parser.feed(html_content)
+    parser.close()
+
+    css = "\n".join(parser.inline_styles)
+    js = "\n".join(parser.inline_scripts)
+    inline_script_bytes = len(js.encode("utf-8"))
+    inline_style_bytes = len(css.encode("utf-8")) + parser.style_attribute_bytes
+    document_bytes = len(html_content.encode("utf-8"))
+    images_without_dimensions = sum(1 for img in parser.images if not (img.get("width") and img.get("height")))
+    # The first image is usually the hero and should load eagerly
+    images_without_lazy = sum(1 for img in parser.images[1:] if img.get("loading", "").lower() != "lazy")
+    blocking_origins = [origin_label(url) or "same origin" for url in parser.blocking_styles + parser.blocking_scripts]
+    infinite_animations = len(INFINITE_ANIMATION_RE.findall(css))
+    particles = bool(PARTICLE_RE.search(js) or parser.particle_markup) and bool(parser.canvases or RAF_RE.search(js) or parser.particle_markup)
+    font_urls = [url for url in parser.blocking_styles if origin_label(url) == "Google Fonts"]
+
+    findings = []
+    if parser.blocking_styles:
+        # Only the Font Awesome stylesheet can be removed; font stylesheets stay, trimmed
+        _finding(
+            findings, "render-blocking-css", "high" if len(parser.blocking_styles) > 2 else "medium",
+            min(5 * len(parser.blocking_styles), 20),
+            f"{len(parser.blocking_styles)} render-blocking stylesheet(s): "
+            f"{', '.join(sorted(set(origin_label(url) or url for url in parser.blocking_styles)))}"
+        )
+        findings[-1]["fixable"] = "Font Awesome" in blocking_origins
+    if parser.blocking_scripts:
+        _finding(
+            findings, "render-blocking-js", "high", min(10 * len(parser.blocking_scripts), 30),
+            f"{len(parser.blocking_scripts)} external script(s) without async or defer"
+        )
+    if font_urls and not all("display=swap" in url for url in font_urls):
+        _finding(findings, "font-display", "medium", 5, "Google Fonts loaded without display=swap, so text stays invisible until fonts arrive")
+    if font_urls and not {"fonts.googleapis.com", "fonts.gstatic.com"} <= parser.preconnects:
+        _finding(findings, "font-preconnect", "low", 3, "No preconnect to fonts.googleapis.com and fonts.gstatic.com")
+    if any(label == "Font Awesome" for label in blocking_origins):
+        _finding(findings, "icon-font", "medium", 5, "The full Font Awesome stylesheet and icon font are downloaded for a handful of icons")
+    if inline_script_bytes > MAX_INLINE_SCRIPT_BYTES:
+        _finding(findings, "inline-js-weight", "medium", 5, f"{inline_script_bytes / 1024:.1f} KB of inline JavaScript")
+    if inline_style_bytes > MAX_INLINE_STYLE_BYTES:
+        _finding(findings, "inline-css-weight", "medium", 5, f"{inline_style_bytes / 1024:.1f} KB of inline CSS")
+    if document_bytes > MAX_DOCUMENT_BYTES:
+        _finding(findings, "document-weight", "medium", 5, f"The document is {document_bytes / 1024:.1f} KB")
+    if parser.nodes > MAX_DOM_NODES:
+        _finding(findings, "dom-size", "high", 10, f"{parser.nodes} DOM elements (aim for under {MAX_DOM_NODES})")
+    if parser.max_depth > MAX_DOM_DEPTH:
+        _finding(findings, "dom-depth", "medium", 5, f"DOM is {parser.max_depth} levels deep (aim for under {MAX_DOM_DEPTH})")
+    if images_without_dimensions:
+        _finding(
+            findings, "image-dimensions", "medium", min(2 * images_without_dimensions, 10),
+            f"{images_without_dimensions} image(s) without width and height, which shifts the layout as they load"
+        )
+    if images_without_lazy:
+        _finding(
+            findings, "image-lazy-loading", "low", min(2 * images_without_lazy, 10),
+            f"{images_without_lazy} below-the-fold image(s) without loading=\"lazy\""
+        )
+    if parser.iframes_without_lazy:
+        _finding(findings, "iframe-lazy-loading", "low", 3, f"{parser.iframes_without_lazy} iframe(s) without loading=\"lazy\"")
+    if particles:
+        _finding(findings, "particle-animation", "high", 10, "A particle background animates continuously and keeps the CPU busy")
+    if infinite_animations > MAX_INFINITE_ANIMATIONS:
+        _finding(findings, "infinite-animations", "medium", 5, f"{infinite_animations} infinite CSS animations")
+    if EXPENSIVE_CSS_RE.search(css):
+        _finding(findings, "blur-filters", "low", 3, "blur() filters are expensive to paint, especially while scrolling")
+    passive_missing = [options for options in SCROLL_LISTENER_RE.findall(js) if "passive" not in options]
+    if passive_missing:
+        _finding(findings, "scroll-listeners", "medium", 5, f"{len(passive_missing)} scroll/touch listener(s) without {{passive: true}}")
+
+    findings.sort(key=lambda f: (SEVERITY_ORDER[f["severity"]], -f["penalty"]))
+    score = max(0, 100 - sum(f["penalty"] for f in findings))
+    return {
+        "score": score,
+        "grade": "good" if score >= 90 else "needs work" if score >= 50 else "poor",
+        "findings": findings,
+        "metrics": {
+            "document_bytes": document_bytes,
+            "dom_nodes": parser.nodes,
+            "dom_depth": parser.max_depth,
+            "blocking_stylesheets": len(parser.blocking_styles),
+            "blocking_scripts": len(parser.blocking_scripts),
+            "blocking_origins": sorted(set(blocking_origins)),
+            "inline_script_bytes": inline_script_bytes,
+            "inline_style_bytes": inline_style_bytes,
+            "images": len(parser.images),
+            "images_without_dimensions": images_without_dimensions,
+            "images_without_lazy": images_without_lazy,
+            "keyframes": len(KEYFRAMES_RE.findall(css)),
+            "infinite_animations": infinite_animations,
+        },
+    }
+
+
+def suggest_fixes(html_content, report=None):
+    """Run optimize_html and return {"html", "stats", "report", "fixed"}, or None if it does not help
+
+    fixed lists the ids of the fixable findings the optimized page no longer has.
+    """
+    report = report or audit_html(html_content)
+    if not any(finding["fixable"] for finding in report["findings"]):
+        return None
+    fixed_html, stats = optimize_html(html_content)
+    fixed_report = audit_html(fixed_html)
+    if fixed_html == html_content or fixed_report["score"] < report["score"]:
+        return None
+    remaining = {finding["id"] for finding in fixed_report["findings"]}
+    for finding in fixed_report["findings"]:
+        # Whatever is left is beyond what the optimizer can do
+        finding["fixable"] = False
+    return {
+        "html": fixed_html,
+        "stats": stats,
+        "report": fixed_report,
+        "fixed": [f["id"] for f in report["findings"] if f["fixable"] and f["id"] not in remaining],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit generated portfolios for page-load performance")
+    parser.add_argument("files", nargs="+", help="Generated HTML files")
+    parser.add_argument("--json", action="store_true", help="Print the full reports as JSON")
+    parser.add_argument("--min-score", type=int, default=0, help="Exit with 1 if any page scores below this")
+    parser.add_argument("--fix", action="store_true", help="Rewrite each file with utils.optimizer when that improves its score")
+    args = parser.parse_args(argv)
+
+    reports = {}
+    for path in args.files:
+        with open(path, encoding="utf-8") as f:
+            html_content = f.read()
+        reports[path] = audit_html(html_content)
+        fixes = suggest_fixes(html_content, reports[path]) if args.fix else None
+        if fixes:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(fixes["html"])
+            print(f"{path}: fixed {', '.join(fixes['fixed']) or 'page weight'} ({reports[path]['score']} -> {fixes['report']['score']})", file=sys.stderr)
+            reports[path] = fixes["report"]
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        for path, report in reports.items():
+            print(f"{path}: {report['score']}/100 ({report['grade']})")
+            for finding in report["findings"]:
+                fixable = " (fixable with --fix)" if finding["fixable"] else ""
+                print(f"  [{finding['severity']}] -{finding['penalty']} {finding['message']}{fixable}")
+    return 1 if any(report["score"] < args.min_score for report in reports.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""Bulk portfolio generation from a JSONL or CSV file of profiles
+
+Usage:
+    python -m utils.batch profiles.jsonl -o output/ --provider "Google Gemini" \\
+        --model gemini-2.5-flash --api-key $GEMINI_API_KEY --concurrency 8
+
+Each profile has the same shape as the portfolio_data dict built in app.py.
+CSV files use dotted column names (personal.name, design.theme, ...) and
+JSON for list fields (projects, experience, education, design.animations).
+Pass --fake to run the real generation pipeline (prompts, cache, routing,
+cleanup) against a local fake OpenAI client instead of a real API.
+"""
+import argparse
+import asyncio
+import copy
+import csv
+import functools
+import json
+import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.audit import audit_html
+from utils.optimizer import optimize_html
+from utils.providers import upstream_limit
+from utils.templates import get_color_schemes
+
+LIST_FIELDS = {"projects", "experience", "education", "design.animations"}
+
+DEFAULT_PROFILE = {
+    "personal": {"name": "", "title": "", "bio": "", "email": "", "phone": "", "location": ""},
+    "social": {"github": "", "linkedin": "", "twitter": "", "website": "", "portfolio": ""},
+    "skills": {"technical": "", "soft": "", "tools": ""},
+    "projects": [],
+    "experience": [],
+    "education": [],
+    "certifications": "",
+    "design": {
+        "theme": "Modern Gradient",
+        "layout": "Single Page Scroll",
+        "fonts": "Poppins & Roboto",
+        "animations": ["Fade In", "Hover Effects"],
+        "color_scheme": None,
+    },
+    "options": {
+        "contact_form": True,
+        "resume_button": True,
+        "testimonials": False,
+        "blog": False,
+        "seo": True,
+        "analytics": True,
+    },
+}
+
+
+def _merge(defaults, values):
+    merged = copy.deepcopy(defaults)
+    for key, value in values.items():
+        if isinstance(merged.get(key), dict) and isinstance(value, dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def complete_profile(profile):
+    """Fill in any missing fields the way app.py would"""
+    data = _merge(DEFAULT_PROFILE, profile)
+    if not data["design"].get("color_scheme"):
+        color_schemes = get_color_schemes()
+        data["design"]["color_scheme"] = color_schemes.get(data["design"]["theme"], color_schemes["Modern Gradient"])
+    return data
+
+
+def _parse_csv_value(column, value):
+    if column in LIST_FIELDS:
+        return json.loads(value) if value.strip() else []
+    if column.startswith("options."):
+        return value.strip().lower() in ("1", "true", "yes", "y")
+    return value
+
+
+def _csv_row_to_profile(row):
+    profile = {}
+    for column, value in row.items():
+        if column is None or value is None:
+            continue
+        target = profile
+        parts = column.strip().split(".")
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = _parse_csv_value(column.strip(), value)
+    return profile
+
+
+def load_profiles(path):
+    """Read profiles from a .jsonl or .csv file"""
+    profiles = []
+    if path.endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                profiles.append(complete_profile(_csv_row_to_profile(row)))
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    profiles.append(complete_profile(json.loads(line)))
+    return profiles
+
+
+def _slugify(text):
+    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return slug or "portfolio"
+
+
+class BatchGenerator:
+    """Generate many portfolios concurrently and stream them to an output directory"""
+
+    def __init__(self, generate_fn, api_key, provider, model, output_dir,
+                 concurrency=4, retries=2, backoff=1.0, optimize=False, audit=False, min_audit_score=0):
+        self.generate_fn = generate_fn
+        self.api_key = api_key
+        self.provider = provider
+        self.model = model
+        self.output_dir = output_dir
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.optimize = optimize
+        self.audit = audit or min_audit_score > 0
+        self.min_audit_score = min_audit_score
+        self._executor = None
+
+    async def _in_thread(self, fn, *args):
+        # The default executor caps at min(32, cpus + 4) threads, which would quietly cap --concurrency
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(fn, *args))
+
+    async def _generate_one(self, index, data, semaphore, manifest_file, manifest_lock):
+        name = data["personal"].get("name", "")
+        entry = {"index": index, "name": name, "status": "failed", "attempts": 0}
+
+        async with semaphore:
+            started = time.monotonic()
+            for attempt in range(self.retries + 1):
+                entry["attempts"] = attempt + 1
+                try:
+                    html_content = await self._in_thread(
+                        self.generate_fn, data, self.api_key, self.provider, self.model
+                    )
+                except Exception as e:
+                    entry["error"] = str(e)
+                    if attempt < self.retries:
+                        # Exponential backoff with jitter so retries do not arrive in lockstep
+                        await asyncio.sleep(self.backoff * (2 ** attempt) * (0.5 + random.random()))
+                    continue
+
+                if self.optimize:
+                    html_content, stats = await self._in_thread(optimize_html, html_content)
+                    entry["original_bytes"] = stats["original_bytes"]
+                if self.audit:
+                    report = await self._in_thread(audit_html, html_content)
+                    entry["audit_score"] = report["score"]
+                    entry["audit_findings"] = [finding["id"] for finding in report["findings"]]
+                    if report["score"] < self.min_audit_score:
+                        # A retry would usually return the same cached page, so reject instead
+                        entry.update(status="rejected", error=f"audit score {report['score']} is below {self.min_audit_score}")
+                        break
+                filename = f"{index:04d}-{_slugify(name)}.html"
+                await self._in_thread(self._write_file, filename, html_content)
+                entry.update(status="ok", file=filename, bytes=len(html_content.encode("utf-8")))
+                entry.pop("error", None)
+                break
+
+            entry["seconds"] = round(time.monotonic() - started, 3)
+        async with manifest_lock:
+            manifest_file.write(json.dumps(entry) + "\n")
+            manifest_file.flush()
+        return entry
+
+    def _write_file(self, filename, html_content):
+        with open(os.path.join(self.output_dir, filename), "w", encoding="utf-8") as f:
+            f.write(html_content)
+
+    async def run(self, profiles, on_result=None):
+        """Generate every profile and return the summary written to manifest.json"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        manifest_lock = asyncio.Lock()
+        started = time.monotonic()
+        results = []
+
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="batch")
+        # The app's process-wide upstream cap would otherwise quietly cap --concurrency too
+        with self._executor, upstream_limit(self.concurrency), \
+                open(os.path.join(self.output_dir, "manifest.jsonl"), "w", encoding="utf-8") as manifest_file:
+            tasks = [
+                asyncio.create_task(self._generate_one(i, data, semaphore, manifest_file, manifest_lock))
+                for i, data in enumerate(profiles)
+            ]
+            for task in asyncio.as_completed(tasks):
+                entry = await task
+                results.append(entry)
+                if on_result:
+                    on_result(entry)
+
+        elapsed = time.monotonic() - started
+        succeeded = sum(1 for r in results if r["status"] == "ok")
+        rejected = sum(1 for r in results if r["status"] == "rejected")
+        summary = {
+            "total": len(results),
+            "succeeded": succeeded,
+            "rejected": rejected,
+            "failed": len(results) - succeeded - rejected,
+            "elapsed_seconds": round(elapsed, 3),
+            "portfolios_per_minute": round(succeeded / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "concurrency": self.concurrency,
+            "provider": self.provider,
+            "model": self.model,
+            "results": sorted(results, key=lambda r: r["index"]),
+        }
+        with open(os.path.join(self.output_dir, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate portfolios in bulk from a JSONL or CSV file")
+    parser.add_argument("input", help="Path to a .jsonl or .csv file of profiles")
+    parser.add_argument("-o", "--output-dir", default="batch_output")
+    parser.add_argument("--provider", default="Google Gemini", help='"OpenAI (GPT-4/3.5)" or "Google Gemini"')
+    parser.add_argument("--model", default="gemini-2.5-flash", help='A model name, or "auto" to route each profile by size')
+    parser.add_argument("--api-key", default=os.environ.get("PORTFOLIO_API_KEY", ""))
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--optimize", action="store_true", help="Minify and strip unused CSS before writing each file")
+    parser.add_argument("--audit", action="store_true", help="Score each page for load performance (see utils.audit)")
+    parser.add_argument("--min-audit-score", type=int, default=0, help="Do not write pages that score below this (implies --audit)")
+    parser.add_argument("--fake", action="store_true", help="Use a local fake OpenAI client instead of a real API")
+    parser.add_argument("--fake-latency", type=float, default=0.5)
+    parser.add_argument("--fake-failure-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    if args.fake:
+        # Faked at the client level, so everything between the profile and the API still runs
+        from utils.fake_provider import FAKE_API_KEY, FAKE_PROVIDER, FakeOpenAIClient, install_fake_openai
+        install_fake_openai(FakeOpenAIClient(latency=args.fake_latency, failure_rate=args.fake_failure_rate))
+        args.api_key, args.provider = FAKE_API_KEY, FAKE_PROVIDER
+    elif not args.api_key:
+        parser.error("--api-key (or PORTFOLIO_API_KEY) is required unless --fake is set")
+    from utils.ai_generator import generate_portfolio_html
+    generate_fn = generate_portfolio_html
+
+    profiles = load_profiles(args.input)
+    generator = BatchGenerator(
+        generate_fn, args.api_key, args.provider, args.model, args.output_dir,
+        concurrency=args.concurrency, retries=args.retries, optimize=args.optimize,
+        audit=args.audit, min_audit_score=args.min_audit_score
+    )
+
+    def report(entry):
+        status = {"ok": "✅", "rejected": "🚫"}.get(entry["status"], "❌")
+        audit_note = f", audit {entry['audit_score']}/100" if "audit_score" in entry else ""
+        print(f"{status} [{entry['index']}] {entry['name']} ({entry['seconds']}s, {entry['attempts']} attempt(s){audit_note})")
+
+    summary = asyncio.run(generator.run(profiles, on_result=report))
+    print(
+        f"\n{summary['succeeded']}/{summary['total']} portfolios in {summary['elapsed_seconds']}s "
+        f"({summary['portfolios_per_minute']} portfolios/min)"
+        + (f", {summary['rejected']} rejected by the audit" if summary["rejected"] else "")
+    )
+    return 0 if summary["failed"] == 0 and summary["rejected"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+"""Offline performance benchmark against a local fake provider
+
+Usage:
+    python -m utils.benchmark -o results.json --concurrency 1,4,16 --requests 40 \\
+        --latency 0.3 --token-rate 2000 --failure-rate 0.02
+
+A FakeOpenAIClient is registered for a fake key, so generate_portfolio_html,
+stream_portfolio_html and test_api_key run their real code paths (prompt
+building, sanitizing, continuations) without network access. Pass
+--responses with a directory or JSONL of recorded replies to replay them
+instead of the built-in one. Results are written as JSON so runs from
+different releases can be compared.
+
+Startup cost is measured by importing modules in fresh interpreters, so
+the cost of the generation module can be compared with the provider SDKs
+it now loads lazily.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+
+from utils.ai_generator import (
+    clean_html_response, generate_portfolio_html, stream_portfolio_html, test_api_key
+)
+from utils.fake_provider import (
+    FAKE_API_KEY, FAKE_PROVIDER, FakeOpenAIClient, install_fake_openai, load_recorded_responses, sample_profile
+)
+from utils.optimizer import optimize_html
+from utils.prompts import build_prompt
+from utils.providers import upstream_limit
+
+RESULTS_VERSION = 1
+FAKE_MODEL = "fake-model"
+
+# Imported one at a time in a fresh interpreter to measure cold-start cost
+STARTUP_MODULES = ("utils.ai_generator", "utils.renderer", "openai", "google.generativeai")
+
+
+def summarize(samples):
+    """Return count, mean and percentiles (milliseconds) for a list of durations in seconds"""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def percentile(p):
+        index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered) + 0.5) - 1))
+        return round(ordered[index] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": percentile(50),
+        "p90_ms": percentile(90),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def _time_calls(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def bench_prompt_build(profile, iterations):
+    return summarize(_time_calls(lambda: build_prompt(profile), iterations))
+
+
+def bench_cleanup(responses, iterations):
+    """Time the sanitizer and the optimizer on each recorded reply"""
+    cleanup, optimize = [], []
+    for response in responses:
+        cleanup.extend(_time_calls(lambda: clean_html_response(response), iterations))
+        cleaned = clean_html_response(response)
+        optimize.extend(_time_calls(lambda: optimize_html(cleaned), iterations))
+    return {"cleanup": summarize(cleanup), "optimize": summarize(optimize)}
+
+
+def bench_validation(iterations):
+    """Time uncached (forced) and cached key checks"""
+    return {
+        "uncached": summarize(_time_calls(lambda: test_api_key(FAKE_API_KEY, FAKE_PROVIDER, FAKE_MODEL, force=True), iterations)),
+        "cached": summarize(_time_calls(lambda: test_api_key(FAKE_API_KEY, FAKE_PROVIDER, FAKE_MODEL), iterations)),
+    }
+
+
+def _generate_once(profile):
+    started = time.perf_counter()
+    generate_portfolio_html(profile, FAKE_API_KEY, FAKE_PROVIDER, FAKE_MODEL, use_cache=False)
+    return time.perf_counter() - started, None
+
+
+def _stream_once(profile):
+    started = time.perf_counter()
+    first_chunk = None
+    for _ in stream_portfolio_html(profile, FAKE_API_KEY, FAKE_PROVIDER, FAKE_MODEL, use_cache=False):
+        if first_chunk is None:
+            first_chunk = time.perf_counter() - started
+    return time.perf_counter() - started, first_chunk
+
+
+def bench_end_to_end(profile, concurrency, requests, stream=False):
+    """Run requests generations with up to concurrency in flight; return latency and throughput"""
+    run_once = _stream_once if stream else _generate_once
+    latencies, first_chunks, errors = [], [], 0
+    started = time.perf_counter()
+    # Measure the provider at this concurrency, not the app's process-wide upstream cap
+    with upstream_limit(concurrency), ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(run_once, profile) for _ in range(requests)]
+        for future in as_completed(futures):
+            try:
+                latency, first_chunk = future.result()
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(latency)
+            if first_chunk is not None:
+                first_chunks.append(first_chunk)
+    elapsed = time.perf_counter() - started
+    result = {
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_per_second": round(len(latencies) / elapsed, 3) if elapsed > 0 else 0.0,
+        "latency": summarize(latencies),
+    }
+    if stream:
+        result["time_to_first_chunk"] = summarize(first_chunks)
+    return result
+
+
+def _import_seconds(module):
+    code = f"import time; started = time.perf_counter(); import {module}; print(time.perf_counter() - started)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=120)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def bench_startup(runs, modules=STARTUP_MODULES):
+    """Time a cold import of each module, once per fresh interpreter"""
+    results = {}
+    for module in modules:
+        samples = [_import_seconds(module) for _ in range(runs)]
+        if None in samples:
+            results[module] = {"error": "import failed"}
+        else:
+            results[module] = summarize(samples)
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_benchmark(client, profile, concurrency_levels, requests, iterations=200, stream=False, startup_runs=5):
+    """Run every benchmark against client and return the results dict"""
+    install_fake_openai(client)
+    results = {
+        "version": RESULTS_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "latency": client.latency,
+            "jitter": client.jitter,
+            "token_rate": client.token_rate,
+            "failure_rate": client.failure_rate,
+            "responses": len(client.responses),
+            "requests": requests,
+            "iterations": iterations,
+        },
+        "prompt_build": bench_prompt_build(profile, iterations),
+        "validation": bench_validation(max(1, iterations // 20)),
+    }
+    if startup_runs:
+        results["startup"] = bench_startup(startup_runs)
+    results.update(bench_cleanup(client.responses, max(1, iterations // 10)))
+    results["end_to_end"] = [bench_end_to_end(profile, level, requests) for level in concurrency_levels]
+    if stream:
+        results["streaming"] = [bench_end_to_end(profile, level, requests, stream=True) for level in concurrency_levels]
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark portfolio generation against a local fake provider")
+    parser.add_argument("-o", "--output", help="Write JSON results here (default: stdout)")
+    parser.add_argument("--responses", help="Directory, file or JSONL of recorded replies to replay")
+    parser.add_argument("--profile", help="JSON file with the portfolio data to generate (default: built-in sample)")
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=32, help="Generations per concurrency level")
+    parser.add_argument("--iterations", type=int, default=200, help="Iterations for the micro-benchmarks")
+    parser.add_argument("--latency", type=float, default=0.2, help="Fake time to first token, in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--token-rate", type=float, default=0.0, help="Fake output tokens per second (0 = instant)")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stream", action="store_true", help="Also benchmark the streaming path")
+    parser.add_argument("--startup-runs", type=int, default=5, help="Fresh interpreters per module import timing (0 to skip)")
+    args = parser.parse_args(argv)
+
+    responses = load_recorded_responses(args.responses) if args.responses else None
+    profile = sample_profile()
+    if args.profile:
+        from utils.batch import complete_profile
+        with open(args.profile, encoding="utf-8") as f:
+            profile = complete_profile(json.load(f))
+    client = FakeOpenAIClient(
+        responses, latency=args.latency, jitter=args.jitter, token_rate=args.token_rate,
+        failure_rate=args.failure_rate, seed=args.seed
+    )
+    levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+
+    results = run_benchmark(
+        client, profile, levels, args.requests, args.iterations, stream=args.stream, startup_runs=args.startup_runs
+    )
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    for module, timing in results.get("startup", {}).items():
+        detail = f"{timing['p50_ms']:.1f} ms" if "p50_ms" in timing else timing["error"]
+        print(f"import {module}: {detail}", file=sys.stderr)
+    for run in results["end_to_end"]:
+        print(
+            f"concurrency {run['concurrency']:>3}: p50 {run['latency'].get('p50_ms', 0):.1f} ms, "
+            f"p95 {run['latency'].get('p95_ms', 0):.1f} ms, {run['throughput_per_second']:.2f} req/s, "
+            f"{run['errors']} error(s)",
+            file=sys.stderr
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
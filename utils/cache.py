@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_CACHE_DIR = os.environ.get("PORTFOLIO_CACHE_DIR", os.path.join(".cache", "portfolios"))
+DEFAULT_MEMORY_ENTRIES = 64
+DEFAULT_DISK_BYTES = 50 * 1024 * 1024
+
+
+def normalize_portfolio_data(value):
+    """Return a canonical copy of portfolio data for hashing"""
+    if isinstance(value, dict):
+        return {str(k): normalize_portfolio_data(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_portfolio_data(v) for v in value]
+    if isinstance(value, str):
+        return value.replace("\r\n", "\n").strip()
+    return value
+
+
+def make_cache_key(data, provider, model, config=None):
+    """Hash portfolio data, provider, model and generation config into a cache key"""
+    payload = {
+        "data": normalize_portfolio_data(data),
+        "provider": provider,
+        "model": model,
+        "config": config or {},
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class GenerationCache:
+    """Two-tier cache for generated portfolios: in-memory LRU backed by a size-capped directory"""
+
+    def __init__(self, max_entries=DEFAULT_MEMORY_ENTRIES, cache_dir=DEFAULT_CACHE_DIR,
+                 max_disk_bytes=DEFAULT_DISK_BYTES):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "disk_evictions": 0,
+        }
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.html")
+
+    def get(self, key):
+        """Return cached HTML for key, or None"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return self._memory[key]
+
+        html_content = self._read_disk(key)
+        with self._lock:
+            if html_content is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember(key, html_content)
+        return html_content
+
+    def set(self, key, html_content):
+        """Store HTML under key in both tiers"""
+        with self._lock:
+            self._remember(key, html_content)
+        self._write_disk(key, html_content)
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".html"):
+                    os.remove(entry.path)
+
+    def get_stats(self):
+        """Return hit/miss/eviction counters and current tier sizes"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["hits"] = stats["memory_hits"] + stats["disk_hits"]
+            stats["memory_entries"] = len(self._memory)
+        stats["disk_bytes"] = sum(size for _, size, _ in self._disk_entries())
+        return stats
+
+    def _remember(self, key, html_content):
+        # Caller holds the lock
+        self._memory[key] = html_content
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _read_disk(self, key):
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                html_content = f.read()
+            os.utime(path)  # Refresh recency for eviction
+            return html_content
+        except OSError:
+            return None
+
+    def _write_disk(self, key, html_content):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(html_content)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        self._enforce_disk_cap()
+
+    def _disk_entries(self):
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".html"):
+                try:
+                    st_info = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.path, st_info.st_size, st_info.st_mtime))
+        return entries
+
+    def _enforce_disk_cap(self):
+        entries = sorted(self._disk_entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self._stats["disk_evictions"] += 1
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_generation_cache():
+    """Return the process-wide generation cache"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = GenerationCache()
+        return _default_cache
@@ -0,0 +1,148 @@
+"""Pooled provider SDK clients
+
+The openai and google.generativeai packages are only imported when the
+first client for that provider is built, keeping them off the cold-start path.
+"""
+import hashlib
+import threading
+import time
+
+
+DEFAULT_IDLE_TIMEOUT = 600
+DEFAULT_MAX_CLIENTS = 128
+
+
+def hash_api_key(api_key):
+    """Return a short stable digest so raw keys are never used as dict keys"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class ClientRegistry:
+    """Thread-safe cache of provider clients keyed by (provider, hashed api key, model)
+
+    Reusing clients keeps their HTTP connection pools and TLS sessions warm.
+    Clients idle for longer than idle_timeout seconds are closed and dropped.
+    """
+
+    def __init__(self, idle_timeout=DEFAULT_IDLE_TIMEOUT, max_clients=DEFAULT_MAX_CLIENTS):
+        self.idle_timeout = idle_timeout
+        self.max_clients = max_clients
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, provider, api_key, model, factory):
+        """Return the cached client for this key, building it with factory() on a miss
+
+        factory() runs outside the lock, so a slow first SDK import or client
+        build never holds up other sessions. If two threads build the same
+        client at once, the first one stored wins and the other is closed.
+        """
+        key = (provider, hash_api_key(api_key), model)
+        with self._lock:
+            self._evict_idle(time.monotonic())
+            entry = self._clients.get(key)
+            if entry is not None:
+                entry[1] = time.monotonic()
+                self._stats["hits"] += 1
+                return entry[0]
+            self._stats["misses"] += 1
+
+        client = factory()
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                entry[1] = time.monotonic()
+                built_twice, client = client, entry[0]
+            else:
+                built_twice = None
+                self._clients[key] = [client, time.monotonic()]
+                if len(self._clients) > self.max_clients:
+                    oldest = min(self._clients, key=lambda k: self._clients[k][1])
+                    self._drop(oldest)
+        if built_twice is not None:
+            _close_client(built_twice)
+        return client
+
+    def put(self, provider, api_key, model, client):
+        """Register a ready-made client (e.g. a local stand-in) for this key"""
+        key = (provider, hash_api_key(api_key), model)
+        with self._lock:
+            if key in self._clients:
+                self._drop(key)
+            self._clients[key] = [client, time.monotonic()]
+
+    def clear(self):
+        """Close and drop every cached client"""
+        with self._lock:
+            for key in list(self._clients):
+                self._drop(key)
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self._stats, clients=len(self._clients))
+
+    def _evict_idle(self, now):
+        # Caller holds the lock
+        for key in [k for k, (_, last_used) in self._clients.items() if now - last_used > self.idle_timeout]:
+            self._drop(key)
+
+    def _drop(self, key):
+        # Caller holds the lock
+        client, _ = self._clients.pop(key)
+        self._stats["evictions"] += 1
+        _close_client(client)
+
+
+def _close_client(client):
+    close = getattr(client, "close", None)
+    if close is not None:
+        try:
+            close()
+        except Exception:
+            pass
+
+
+_registry = ClientRegistry()
+
+
+def get_client_registry():
+    """Return the process-wide client registry"""
+    return _registry
+
+
+def _make_openai_client(api_key):
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+def get_openai_client(api_key):
+    """Return a pooled OpenAI client for api_key"""
+    return _registry.get("openai", api_key, None, lambda: _make_openai_client(api_key))
+
+
+def _make_gemini_service_client(service, api_key):
+    # Built with the key's own client_options rather than genai.configure, which
+    # swaps process-wide state that another session may be configuring at the same time
+    from google.ai import generativelanguage as glm
+    from google.api_core.client_options import ClientOptions
+    return getattr(glm, f"{service}ServiceClient")(client_options=ClientOptions(api_key=api_key))
+
+
+def _make_gemini_model(api_key, model):
+    import google.generativeai as genai
+    ai_model = genai.GenerativeModel(model)
+    # GenerativeModel takes no client argument and only falls back to the
+    # process-wide default client while this is unset
+    ai_model._client = _make_gemini_service_client("Generative", api_key)
+    return ai_model
+
+
+def get_gemini_model(api_key, model):
+    """Return a pooled Gemini GenerativeModel bound to api_key"""
+    return _registry.get("gemini", api_key, model, lambda: _make_gemini_model(api_key, model))
+
+
+def get_gemini_model_client(api_key):
+    """Return a pooled Gemini model-metadata client bound to api_key"""
+    return _registry.get("gemini-models", api_key, None, lambda: _make_gemini_service_client("Model", api_key))
@@ -0,0 +1,168 @@
+"""Static-site export bundle
+
+Splits a generated single-file portfolio into index.html plus one
+content-hashed file per inline <style> and <script> block, writes gzip
+and (when the brotli package is installed) brotli precompressed copies of
+every text file, and adds cache headers: hashed assets can be cached
+forever, index.html is always revalidated. Everything is packaged as a zip
+ready for Netlify, Cloudflare Pages or any static host.
+
+Usage:
+    python -m utils.export portfolio.html -o site.zip
+"""
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import re
+import sys
+import zipfile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ASSET_DIR = "assets"
+HASH_LENGTH = 10
+# Content type drives both the zip layout and the Content-Type in the manifest
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+}
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "public, max-age=0, must-revalidate"
+# Fixed timestamp so the same document always produces the same zip
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+STYLE_RE = re.compile(r"<style([^>]*)>(.*?)</style>", re.S | re.I)
+SCRIPT_RE = re.compile(r"<script([^>]*)>(.*?)</script>", re.S | re.I)
+SRC_ATTR_RE = re.compile(r"\ssrc\s*=", re.I)
+TYPE_ATTR_RE = re.compile(r"""\stype\s*=\s*["']?([^"'\s>]+)""", re.I)
+# Only classic and module JavaScript moves to a file; JSON-LD and templates stay inline
+JS_TYPES = {"", "text/javascript", "application/javascript", "module"}
+
+
+def hashed_name(stem, content, extension):
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+    return f"{ASSET_DIR}/{stem}.{digest}{extension}"
+
+
+def split_assets(html_content):
+    """Move inline styles and scripts into hashed files
+
+    Returns (html, assets) where assets maps each path to its content. Each
+    block keeps its position in the document, so cascade and execution order
+    are unchanged.
+    """
+    assets = {}
+
+    def extract_style(match):
+        attributes, css = match.group(1), match.group(2).strip()
+        if not css:
+            return ""
+        path = hashed_name("styles", css, ".css")
+        assets[path] = css
+        return f'<link rel="stylesheet" href="{path}"{attributes}>'
+
+    def extract_script(match):
+        attributes, js = match.group(1), match.group(2).strip()
+        script_type = TYPE_ATTR_RE.search(attributes)
+        if SRC_ATTR_RE.search(attributes) or (script_type and script_type.group(1).lower() not in JS_TYPES):
+            return match.group(0)
+        if not js:
+            return ""
+        path = hashed_name("script", js, ".js")
+        assets[path] = js
+        return f'<script src="{path}"{attributes}></script>'
+
+    html_content = STYLE_RE.sub(extract_style, html_content)
+    html_content = SCRIPT_RE.sub(extract_script, html_content)
+    return html_content, assets
+
+
+def _extension(path):
+    return path[path.rfind("."):]
+
+
+def build_export_bundle(html_content):
+    """Return (zip_bytes, manifest) for a static-site export of html_content"""
+    index_html, assets = split_assets(html_content)
+    files = dict(assets, **{"index.html": index_html})
+
+    manifest = {"files": [], "brotli": brotli is not None}
+    compressed = {}
+    for path, content in files.items():
+        body = content.encode("utf-8")
+        entry = {
+            "path": path,
+            "bytes": len(body),
+            "sha256": hashlib.sha256(body).hexdigest(),
+            "content_type": CONTENT_TYPES[_extension(path)],
+            "cache_control": REVALIDATE_CACHE if path == "index.html" else IMMUTABLE_CACHE,
+        }
+        gz = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(gz) < len(body):
+            compressed[f"{path}.gz"] = gz
+            entry["gzip_bytes"] = len(gz)
+        if brotli is not None:
+            br = brotli.compress(body, quality=11)
+            if len(br) < len(body):
+                compressed[f"{path}.br"] = br
+                entry["brotli_bytes"] = len(br)
+        manifest["files"].append(entry)
+
+    headers = "".join(
+        f"/{entry['path']}\n  Cache-Control: {entry['cache_control']}\n  Content-Type: {entry['content_type']}\n"
+        for entry in manifest["files"]
+    )
+    headers += f"/\n  Cache-Control: {REVALIDATE_CACHE}\n"
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as bundle:
+        def write(path, data, compress):
+            info = zipfile.ZipInfo(path, date_time=ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+            info.external_attr = 0o644 << 16
+            bundle.writestr(info, data)
+
+        for path, content in sorted(files.items()):
+            write(path, content.encode("utf-8"), True)
+        # Already compressed, deflating them again only costs time
+        for path, data in sorted(compressed.items()):
+            write(path, data, False)
+        write("_headers", headers.encode("utf-8"), True)
+        write("manifest.json", json.dumps(manifest, indent=2).encode("utf-8"), True)
+
+    manifest["zip_bytes"] = buffer.tell()
+    return buffer.getvalue(), manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a generated portfolio as a static-site zip")
+    parser.add_argument("html", help="Generated portfolio HTML file")
+    parser.add_argument("-o", "--output", default="site.zip", help="Zip file to write (default: site.zip)")
+    args = parser.parse_args(argv)
+
+    with open(args.html, encoding="utf-8") as f:
+        html_content = f.read()
+    bundle, manifest = build_export_bundle(html_content)
+    with open(args.output, "wb") as f:
+        f.write(bundle)
+    for entry in manifest["files"]:
+        sizes = ", ".join(
+            f"{label} {entry[key] / 1024:.1f} KB"
+            for label, key in (("gzip", "gzip_bytes"), ("br", "brotli_bytes"))
+            if key in entry
+        )
+        print(f"{entry['path']}: {entry['bytes'] / 1024:.1f} KB" + (f" ({sizes})" if sizes else ""), file=sys.stderr)
+    if not manifest["brotli"]:
+        print("brotli is not installed, so no .br files were written", file=sys.stderr)
+    print(f"wrote {args.output} ({manifest['zip_bytes'] / 1024:.1f} KB)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+import html
+import json
+import math
+import os
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+FAKE_API_KEY = "fake-local-key"
+# Contains "OpenAI" so the real generation code takes its OpenAI path
+FAKE_PROVIDER = "OpenAI (local fake)"
+
+
+class FakeProvider:
+    """Local stand-in for an LLM provider, for batch runs and tests without API keys
+
+    Sleeps for a configurable latency and returns a small deterministic
+    portfolio built from the data. failure_rate injects random errors.
+    """
+
+    def __init__(self, latency=0.5, jitter=0.0, failure_rate=0.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def _roll(self):
+        with self._lock:
+            self.calls += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            fail = self._random.random() < self.failure_rate
+        return delay, fail
+
+    def generate_portfolio_html(self, data, api_key=None, provider=None, model=None, **kwargs):
+        """Same call shape as utils.ai_generator.generate_portfolio_html"""
+        delay, fail = self._roll()
+        time.sleep(delay)
+        if fail:
+            raise Exception("Error generating portfolio: fake provider failure")
+        return render_fake_portfolio(data)
+
+
+def render_fake_portfolio(data):
+    """Return a minimal but complete portfolio document for data"""
+    personal = data.get('personal', {})
+    name = html.escape(personal.get('name', ''))
+    title = html.escape(personal.get('title', ''))
+    bio = html.escape(personal.get('bio', ''))
+    projects = ''.join(
+        f"<li><strong>{html.escape(p.get('name', ''))}</strong> {html.escape(p.get('description', ''))}</li>"
+        for p in data.get('projects', [])
+    )
+    return (
+        "<!DOCTYPE html>\n"
+        f"<html lang=\"en\"><head><meta charset=\"UTF-8\"><title>{name}</title></head>"
+        f"<body><header><h1>{name}</h1><p>{title}</p></header>"
+        f"<section id=\"about\"><p>{bio}</p></section>"
+        f"<section id=\"projects\"><ul>{projects}</ul></section>"
+        "</body></html>"
+    )
+
+
+SAMPLE_PROFILE = {
+    "personal": {
+        "name": "Alex Rivera",
+        "title": "Full Stack Developer",
+        "bio": "I build fast, accessible web applications and the APIs behind them.",
+        "email": "alex@example.com",
+        "location": "Lisbon, Portugal",
+    },
+    "social": {"github": "https://github.com/example", "linkedin": "https://linkedin.com/in/example"},
+    "skills": {"technical": "Python, TypeScript, React, PostgreSQL", "soft": "Mentoring, Writing", "tools": "Docker, Git"},
+    "projects": [
+        {"name": f"Project {i}", "description": "A web app that does something useful for its users. " * 3,
+         "technologies": "Python, React", "url": "https://example.com", "date": "2023"}
+        for i in range(1, 5)
+    ],
+    "experience": [
+        {"title": "Senior Engineer", "company": "Acme", "location": "Remote", "duration": "2021 - Present",
+         "description": "Led the platform team and cut page load times in half."},
+        {"title": "Engineer", "company": "Globex", "location": "Porto", "duration": "2018 - 2021",
+         "description": "Built internal tools and customer-facing dashboards."},
+    ],
+    "education": [{"degree": "BSc Computer Science", "institution": "University", "year": "2018", "gpa": ""}],
+    "certifications": "AWS Certified Developer",
+}
+
+
+def sample_profile():
+    """Return a complete, realistic profile for benchmarks and demos"""
+    from utils.batch import complete_profile
+    return complete_profile(SAMPLE_PROFILE)
+
+
+def recorded_response(data=None):
+    """Return a model-style reply: preamble, fenced document and a closing note"""
+    from utils.renderer import render_portfolio_html
+    document = render_portfolio_html(data or sample_profile())
+    return f"Here is your portfolio website:\n\n```html\n{document}\n```\n\nLet me know if you want any changes!"
+
+
+def load_recorded_responses(path):
+    """Load replies from a directory of files, a single file, or a JSONL of {"response": ...}"""
+    if os.path.isdir(path):
+        paths = sorted(os.path.join(path, name) for name in os.listdir(path) if not name.startswith("."))
+    else:
+        paths = [path]
+    responses = []
+    for file_path in paths:
+        with open(file_path, encoding="utf-8") as f:
+            if file_path.endswith(".jsonl"):
+                responses.extend(json.loads(line)["response"] for line in f if line.strip())
+            else:
+                responses.append(f.read())
+    return responses
+
+
+class FakeOpenAIClient(FakeProvider):
+    """Drop-in for openai.OpenAI that replays recorded replies locally
+
+    Supports chat.completions.create (streaming or not) and models.retrieve,
+    which is all the generation and validation code uses. latency is the
+    time to first token and token_rate (tokens per second, 0 for instant)
+    paces the rest. Replies longer than max_tokens are cut off with
+    finish_reason "length", and a follow-up request that carries the partial
+    reply gets the remainder, so continuations are exercised too.
+    """
+
+    def __init__(self, responses=None, latency=0.5, jitter=0.0, token_rate=0.0, failure_rate=0.0,
+                 chunk_chars=64, seed=None):
+        super().__init__(latency=latency, jitter=jitter, failure_rate=failure_rate, seed=seed)
+        self.responses = list(responses) if responses else [recorded_response()]
+        self.token_rate = token_rate
+        self.chunk_chars = chunk_chars
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.models = SimpleNamespace(retrieve=self._retrieve)
+
+    def _retrieve(self, model):
+        delay, fail = self._roll()
+        time.sleep(delay)
+        if fail:
+            raise Exception("fake provider failure")
+        return SimpleNamespace(id=model)
+
+    def _reply_for(self, messages):
+        if messages[-1]["role"] == "user" and len(messages) > 2 and messages[-2]["role"] == "assistant":
+            anchor = messages[-2]["content"][-200:]
+            for response in self.responses:
+                index = response.find(anchor)
+                if index != -1:
+                    return response[index + len(anchor):]
+            return ""
+        with self._lock:
+            return self._random.choice(self.responses)
+
+    def _generation_seconds(self, text):
+        return math.ceil(len(text) / 4) / self.token_rate if self.token_rate else 0.0
+
+    def _create(self, model, messages, max_tokens=None, stream=False, **kwargs):
+        delay, fail = self._roll()
+        text = self._reply_for(messages)
+        finish_reason = "stop"
+        if max_tokens and len(text) > max_tokens * 4:
+            text, finish_reason = text[:max_tokens * 4], "length"
+        if stream and not fail:
+            # Like the real API, the stream opens at once and the latency is the wait for its first chunk
+            return FakeStream(self, text, finish_reason, delay)
+        time.sleep(delay)
+        if fail:
+            raise Exception("fake provider failure")
+        time.sleep(self._generation_seconds(text))
+        message = SimpleNamespace(content=text)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=finish_reason)])
+
+
+class FakeStream:
+    """Streaming reply of a FakeOpenAIClient; like openai.Stream, close() may be called from another thread"""
+
+    def __init__(self, client, text, finish_reason, first_chunk_delay):
+        self._client = client
+        self._text = text
+        self._finish_reason = finish_reason
+        self._first_chunk_delay = first_chunk_delay
+        self._closed = threading.Event()
+
+    @property
+    def closed(self):
+        return self._closed.is_set()
+
+    def close(self):
+        self._closed.set()
+
+    def _wait(self, seconds):
+        if self._closed.wait(seconds):
+            raise Exception("fake stream closed")
+
+    def __iter__(self):
+        self._wait(self._first_chunk_delay)
+        chunk_chars = self._client.chunk_chars
+        for start in range(0, len(self._text), chunk_chars):
+            chunk = self._text[start:start + chunk_chars]
+            self._wait(self._client._generation_seconds(chunk))
+            last = start + chunk_chars >= len(self._text)
+            delta = SimpleNamespace(content=chunk)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=self._finish_reason if last else None)])
+
+
+def install_fake_openai(client, api_key=FAKE_API_KEY):
+    """Make the real generation and validation code use client for api_key"""
+    from utils.clients import get_client_registry
+    get_client_registry().put("openai", api_key, None, client)
+    return client
@@ -0,0 +1,182 @@
+"""Hedged generation across two providers
+
+The primary provider is streamed first. If it has not produced its first
+chunk within hedge_delay seconds, the same request is sent to the other
+provider. Whichever finishes first with a complete document wins, and the
+other attempt is cancelled: a loser still waiting for an upstream slot gives
+up waiting, and one with an open stream has it closed. One slow provider
+then no longer sets the tail latency.
+
+An OpenAI stream is open before its first chunk, so closing it cancels the
+request even while it is still waiting for that chunk. Gemini's
+generate_content(stream=True) only returns once the first chunk has
+arrived, so until then a losing Gemini attempt cannot be stopped; after
+that it is cancelled best-effort (see GeminiProvider.stream). A loser whose
+stream cannot be cancelled only stops being read and is counted as
+"abandoned" rather than "cancelled".
+"""
+import contextvars
+import queue
+import threading
+import time
+
+from utils.ai_generator import is_complete_html, stream_portfolio_html
+from utils.providers import GenerationCancelled, cancel_scope, is_cancelled
+
+DEFAULT_HEDGE_DELAY = 4.0
+
+
+class HedgeStats:
+    """Thread-safe counters for hedged generations"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0, "hedges_fired": 0, "primary_wins": 0, "hedge_wins": 0,
+            "failures": 0, "cancelled": 0, "abandoned": 0,
+        }
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self._stats[name] += amount
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats["hedge_rate"] = round(stats["hedges_fired"] / stats["requests"], 3) if stats["requests"] else 0.0
+        return stats
+
+
+_stats = HedgeStats()
+
+
+def get_hedge_stats():
+    """Return the process-wide hedging stats"""
+    return _stats
+
+
+class _Attempt:
+    """Consumes one provider stream on a background thread"""
+
+    def __init__(self, name, data, target, results, use_cache, refresh_cache):
+        self.name = name
+        self.provider = target[0]
+        self.first_chunk = threading.Event()
+        self.cancelled = threading.Event()
+        self._args = (data, target[1], target[0], target[2])
+        self._kwargs = {"use_cache": use_cache, "refresh_cache": refresh_cache}
+        self._results = results
+        self._stream = None
+        self._stream_lock = threading.Lock()
+        # Runs in a copy of the caller's context, so its cancel scope applies to the attempt
+        self._thread = threading.Thread(
+            target=contextvars.copy_context().run, args=(self._run,), name=f"hedge-{name}", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        """Stop the attempt, closing its upstream stream if it is already open"""
+        with self._stream_lock:
+            self.cancelled.set()
+            stream, self._stream = self._stream, None
+        if stream is not None:
+            self._close_upstream(stream)
+
+    def _opened(self, stream):
+        # Called from the attempt's thread as soon as the provider stream exists
+        with self._stream_lock:
+            if not self.cancelled.is_set():
+                self._stream = stream
+                return
+        self._close_upstream(stream)
+
+    def _close_upstream(self, stream):
+        _stats.increment("cancelled" if stream.cancellable else "abandoned")
+        stream.close()
+
+    def _run(self):
+        # Cancelling the attempt also stops it waiting for an upstream slot
+        with cancel_scope(self.cancelled.is_set):
+            self._consume()
+
+    def _consume(self):
+        stream = stream_portfolio_html(*self._args, on_stream=self._opened, **self._kwargs)
+        chunks = []
+        try:
+            for chunk in stream:
+                if self.cancelled.is_set():
+                    return
+                chunks.append(chunk)
+                self.first_chunk.set()
+            html_content = "".join(chunks)
+            if is_complete_html(html_content):
+                self._results.put((self, html_content, None))
+            else:
+                self._results.put((self, None, "incomplete document"))
+        except Exception as e:
+            self._results.put((self, None, str(e)))
+        finally:
+            with self._stream_lock:
+                self._stream = None
+            # Closing the generator closes the upstream HTTP stream
+            stream.close()
+
+
+def generate_portfolio_html_hedged(data, primary, secondary, hedge_delay=DEFAULT_HEDGE_DELAY,
+                                   use_cache=True, refresh_cache=False, on_hedge=None):
+    """Generate with primary, hedging to secondary if the first chunk is slow
+
+    primary and secondary are (provider, api_key, model) tuples. on_hedge()
+    is called from the calling thread when the hedge fires. Returns
+    (html, winning_provider). Raises if neither provider produces a complete
+    document.
+    """
+    _stats.increment("requests")
+    results = queue.Queue()
+    attempts = [_Attempt("primary", data, primary, results, use_cache, refresh_cache)]
+    attempts[0].start()
+
+    deadline = time.monotonic() + hedge_delay
+    while not attempts[0].first_chunk.is_set() and results.empty():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        attempts[0].first_chunk.wait(min(remaining, 0.05))
+
+    def fire_hedge():
+        _stats.increment("hedges_fired")
+        if on_hedge:
+            on_hedge()
+        attempts.append(_Attempt("hedge", data, secondary, results, use_cache, refresh_cache))
+        attempts[1].start()
+
+    if not attempts[0].first_chunk.is_set() and results.empty():
+        fire_hedge()
+
+    errors = []
+    finished = set()
+    while len(errors) < len(attempts):
+        try:
+            attempt, html_content, error = results.get(timeout=0.1)
+        except queue.Empty:
+            if is_cancelled():
+                for other in attempts:
+                    other.cancel()
+                raise GenerationCancelled("Generation cancelled")
+            continue
+        finished.add(attempt)
+        if html_content is not None:
+            for other in attempts:
+                if other not in finished:
+                    other.cancel()
+            _stats.increment("hedge_wins" if attempt.name == "hedge" else "primary_wins")
+            return html_content, attempt.provider
+        errors.append(f"{attempt.provider}: {error}")
+        if len(attempts) == 1:
+            # The primary failed before the hedge delay ran out; try the other provider now
+            fire_hedge()
+
+    _stats.increment("failures")
+    raise Exception(f"Error generating portfolio: {'; '.join(errors)}")
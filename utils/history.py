@@ -0,0 +1,302 @@
+"""Persistent generation history
+
+Every generated portfolio is kept in a SQLite database with the
+portfolio_data it came from, keyed by user and by a hash of that data, so
+earlier versions can be listed and restored in later sessions. The user
+key comes from history_key(): the signed-in account when the app has auth
+configured, otherwise a random history ID the visitor keeps in the page URL
+and can paste into another browser. It is never derived from an API key,
+which may be rotated or shared. Since the data includes contact details,
+each user keeps at most MAX_VERSIONS_PER_USER versions for at most
+MAX_AGE_DAYS, and delete_user() removes everything stored for a user.
+
+Versions are usually small edits of their parent, so HTML is stored as a
+zlib-compressed delta against the parent version: a list of token ranges
+copied from the parent plus the inserted tokens, with tokens ending at each
+">" so minified markup still diffs finely. A full snapshot is stored
+instead when the delta would not be smaller or the parent chain reaches
+MAX_DELTA_CHAIN, which keeps restores to a bounded number of steps.
+"""
+import contextlib
+import difflib
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+
+from utils.cache import normalize_portfolio_data
+
+DEFAULT_HISTORY_PATH = os.environ.get("PORTFOLIO_HISTORY_DB", os.path.join(".cache", "history.sqlite3"))
+MAX_VERSIONS_PER_USER = int(os.environ.get("PORTFOLIO_HISTORY_MAX_VERSIONS", "50"))
+MAX_AGE_DAYS = float(os.environ.get("PORTFOLIO_HISTORY_MAX_DAYS", "30"))
+MAX_DELTA_CHAIN = 10
+MAX_VERSIONS_LISTED = 20
+
+TOKEN_RE = re.compile(r"[^>]*>|[^>]+$")
+HISTORY_ID_RE = re.compile(r"[0-9a-f]{32}")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_key TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    parent_id INTEGER REFERENCES versions(id),
+    depth INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    label TEXT NOT NULL DEFAULT '',
+    data BLOB NOT NULL,
+    html_sha TEXT NOT NULL,
+    html_kind TEXT NOT NULL,
+    html BLOB NOT NULL,
+    html_bytes INTEGER NOT NULL,
+    stored_bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS versions_user_created ON versions (user_key, created_at);
+CREATE INDEX IF NOT EXISTS versions_user_input ON versions (user_key, input_hash, html_sha);
+CREATE INDEX IF NOT EXISTS versions_created ON versions (created_at);
+CREATE INDEX IF NOT EXISTS versions_parent ON versions (parent_id);
+"""
+
+
+def input_hash(data):
+    """Hash normalized portfolio_data so identical inputs map to the same key"""
+    blob = json.dumps(normalize_portfolio_data(data), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def new_history_id():
+    """Return a fresh random history ID"""
+    return uuid.uuid4().hex
+
+
+def history_key(user_email=None, history_id=None):
+    """Return the key history is stored under, or None if there is no usable identity
+
+    A signed-in user_email wins over history_id; a history_id that is not one
+    made by new_history_id() is ignored.
+    """
+    if user_email:
+        return "user:" + hashlib.sha256(user_email.strip().lower().encode("utf-8")).hexdigest()[:32]
+    history_id = (history_id or "").strip().lower()
+    if HISTORY_ID_RE.fullmatch(history_id):
+        return "id:" + history_id
+    return None
+
+
+def _tokens(html_content):
+    return TOKEN_RE.findall(html_content)
+
+
+def make_delta(parent_html, html_content):
+    """Return a delta turning parent_html into html_content
+
+    The delta is a list of [start, end] token ranges copied from the parent
+    and strings inserted as-is.
+    """
+    old, new = _tokens(parent_html), _tokens(html_content)
+    delta = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old, new, autojunk=False).get_opcodes():
+        if tag == "equal":
+            delta.append([i1, i2])
+        elif j2 > j1:
+            delta.append("".join(new[j1:j2]))
+    return delta
+
+
+def apply_delta(parent_html, delta):
+    old = _tokens(parent_html)
+    return "".join(part if isinstance(part, str) else "".join(old[part[0]:part[1]]) for part in delta)
+
+
+def _pack(value):
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 9)
+
+
+def _unpack(blob):
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class HistoryStore:
+    """SQLite-backed version history, safe to share between threads"""
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH, max_versions=MAX_VERSIONS_PER_USER, max_age_days=MAX_AGE_DAYS):
+        self.path = path
+        self.max_versions = max_versions
+        self.max_age_days = max_age_days
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _initialize(self):
+        # Only the one-time schema setup is serialized here; everything else relies on SQLite's locking
+        with self._init_lock:
+            if self._initialized:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10)
+            try:
+                # WAL lets readers carry on while another session writes
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(SCHEMA)
+            finally:
+                connection.close()
+            self._initialized = True
+
+    @contextlib.contextmanager
+    def _connection(self, write=False):
+        # One short-lived connection per call: commits on success, always closed
+        self._initialize()
+        connection = sqlite3.connect(self.path, timeout=10)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                if write:
+                    # Take the write lock up front so a read-then-write cannot be interleaved
+                    connection.execute("BEGIN IMMEDIATE")
+                yield connection
+        finally:
+            connection.close()
+
+    def save(self, user_key, data, html_content, parent_id=None, label=""):
+        """Store a version, prune old ones and return the new version's id
+
+        A document already stored for user_key from the same data is not stored
+        again; its id is returned instead.
+        """
+        html_sha = hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+        data_hash = input_hash(data)
+        with self._connection(write=True) as connection:
+            existing = connection.execute(
+                "SELECT id FROM versions WHERE user_key = ? AND input_hash = ? AND html_sha = ? ORDER BY id DESC LIMIT 1",
+                (user_key, data_hash, html_sha)
+            ).fetchone()
+            if existing:
+                return existing["id"]
+
+            kind, blob, depth = "full", _pack(html_content), 0
+            parent = None
+            if parent_id is not None:
+                parent = connection.execute(
+                    "SELECT id, depth FROM versions WHERE id = ? AND user_key = ?", (parent_id, user_key)
+                ).fetchone()
+            if parent and parent["depth"] < MAX_DELTA_CHAIN:
+                delta_blob = _pack(make_delta(self._html(connection, parent["id"]), html_content))
+                if len(delta_blob) < len(blob):
+                    kind, blob, depth = "delta", delta_blob, parent["depth"] + 1
+
+            cursor = connection.execute(
+                "INSERT INTO versions (user_key, input_hash, parent_id, depth, created_at, label, data, html_sha,"
+                " html_kind, html, html_bytes, stored_bytes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    user_key, data_hash, parent["id"] if kind == "delta" else None, depth, time.time(),
+                    label, _pack(data), html_sha, kind, blob, len(html_content.encode("utf-8")), len(blob)
+                )
+            )
+            self._prune(connection, user_key)
+            return cursor.lastrowid
+
+    def _prune(self, connection, user_key):
+        # Versions past the age limit (any user) or beyond user_key's newest max_versions
+        expired = [row["id"] for row in connection.execute(
+            "SELECT id FROM versions WHERE created_at < ?", (time.time() - self.max_age_days * 86400,)
+        )]
+        expired += [row["id"] for row in connection.execute(
+            "SELECT id FROM versions WHERE user_key = ? ORDER BY created_at DESC, id DESC LIMIT -1 OFFSET ?",
+            (user_key, self.max_versions)
+        )]
+        self._delete(connection, set(expired))
+
+    def _delete(self, connection, version_ids):
+        if not version_ids:
+            return
+        placeholders = ",".join("?" * len(version_ids))
+        # Deltas against a deleted version become full snapshots first, so they can still be restored
+        orphans = connection.execute(
+            f"SELECT id FROM versions WHERE parent_id IN ({placeholders}) AND id NOT IN ({placeholders})",
+            (*version_ids, *version_ids)
+        ).fetchall()
+        for row in orphans:
+            blob = _pack(self._html(connection, row["id"]))
+            connection.execute(
+                "UPDATE versions SET html_kind = 'full', html = ?, stored_bytes = ?, parent_id = NULL, depth = 0"
+                " WHERE id = ?", (blob, len(blob), row["id"])
+            )
+        connection.execute(f"DELETE FROM versions WHERE id IN ({placeholders})", tuple(version_ids))
+
+    def delete_user(self, user_key):
+        """Delete every version stored for user_key; returns how many were removed"""
+        with self._connection(write=True) as connection:
+            return connection.execute("DELETE FROM versions WHERE user_key = ?", (user_key,)).rowcount
+
+    def _html(self, connection, version_id):
+        # Walk up to the nearest full snapshot, then replay the deltas back down
+        chain = []
+        while version_id is not None:
+            row = connection.execute(
+                "SELECT parent_id, html_kind, html FROM versions WHERE id = ?", (version_id,)
+            ).fetchone()
+            chain.append(row)
+            version_id = row["parent_id"] if row["html_kind"] == "delta" else None
+        html_content = _unpack(chain[-1]["html"])
+        for row in reversed(chain[:-1]):
+            html_content = apply_delta(html_content, _unpack(row["html"]))
+        return html_content
+
+    def load(self, user_key, version_id):
+        """Return (portfolio_data, html) for one of user_key's versions, or None"""
+        with self._connection() as connection:
+            row = connection.execute(
+                "SELECT data FROM versions WHERE id = ? AND user_key = ?", (version_id, user_key)
+            ).fetchone()
+            if row is None:
+                return None
+            return _unpack(row["data"]), self._html(connection, version_id)
+
+    def find(self, user_key, data):
+        """Return the id of the newest version generated from data, or None"""
+        with self._connection() as connection:
+            row = connection.execute(
+                "SELECT id FROM versions WHERE user_key = ? AND input_hash = ? ORDER BY id DESC LIMIT 1",
+                (user_key, input_hash(data))
+            ).fetchone()
+        return row["id"] if row else None
+
+    def list_versions(self, user_key, limit=MAX_VERSIONS_LISTED):
+        """Return the newest versions for user_key, without their content"""
+        with self._connection() as connection:
+            rows = connection.execute(
+                "SELECT id, parent_id, created_at, label, input_hash, html_kind, html_bytes, stored_bytes"
+                " FROM versions WHERE user_key = ? ORDER BY created_at DESC, id DESC LIMIT ?",
+                (user_key, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_stats(self, user_key=None):
+        """Return version count, raw HTML bytes and stored bytes, for one user or everyone"""
+        query = "SELECT COUNT(*) AS versions, COALESCE(SUM(html_bytes), 0) AS html_bytes," \
+                " COALESCE(SUM(stored_bytes), 0) AS stored_bytes FROM versions"
+        params = ()
+        if user_key is not None:
+            query += " WHERE user_key = ?"
+            params = (user_key,)
+        with self._connection() as connection:
+            return dict(connection.execute(query, params).fetchone())
+
+
+_history_store = None
+_history_store_lock = threading.Lock()
+
+
+def get_history_store():
+    """Return the process-wide history store, created on first use"""
+    global _history_store
+    with _history_store_lock:
+        if _history_store is None:
+            _history_store = HistoryStore()
+        return _history_store
@@ -0,0 +1,220 @@
+"""Process-wide background job scheduler
+
+Generation requests become jobs that run on a fixed pool of worker
+threads, so Streamlit script threads never block on an LLM call. The
+workers cap concurrent jobs; a job may still fan out into several upstream
+requests, which utils.providers caps for the whole process. Queued jobs
+are dispatched round-robin across users, so one user with several queued
+jobs cannot starve the others, and both the per-user and total queue depth
+are bounded.
+"""
+import itertools
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+DEFAULT_MAX_WORKERS = int(os.environ.get("PORTFOLIO_MAX_WORKERS", "4"))
+DEFAULT_MAX_QUEUED_PER_USER = 2
+DEFAULT_MAX_QUEUE_DEPTH = int(os.environ.get("PORTFOLIO_MAX_QUEUE_DEPTH", "64"))
+# Finished jobs are kept this long so the owning session can collect them
+FINISHED_JOB_TTL = 600
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+
+
+class QueueFullError(Exception):
+    """Raised when a job cannot be queued because a depth limit was reached"""
+
+
+class Job:
+    """One unit of work; fn(job) reports progress through job.report()"""
+
+    def __init__(self, user_id, fn, label=""):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.label = label
+        self.status = QUEUED
+        self.progress = {}
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._fn = fn
+        self._cancelled = threading.Event()
+
+    def report(self, **progress):
+        """Merge progress fields (stage, done, total, message, ...) for pollers to read"""
+        self.progress = dict(self.progress, **progress)
+
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+    def snapshot(self):
+        return {
+            "id": self.id,
+            "label": self.label,
+            "status": self.status,
+            "progress": dict(self.progress),
+            "result": self.result,
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobScheduler:
+    """Bounded worker pool with per-user round-robin dispatch"""
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, max_queued_per_user=DEFAULT_MAX_QUEUED_PER_USER,
+                 max_queue_depth=DEFAULT_MAX_QUEUE_DEPTH):
+        self.max_workers = max_workers
+        self.max_queued_per_user = max_queued_per_user
+        self.max_queue_depth = max_queue_depth
+        self._jobs = {}
+        # user_id -> deque of queued jobs; rotated so each user gets a turn
+        self._queues = OrderedDict()
+        self._queued = 0
+        self._running = 0
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0, "rejected": 0}
+        self._condition = threading.Condition()
+        self._workers = []
+        self._counter = itertools.count(1)
+
+    def submit(self, user_id, fn, label=""):
+        """Queue fn(job) for user_id and return the job id
+
+        Raises QueueFullError if the user already has max_queued_per_user jobs
+        waiting or running, or the whole queue is at max_queue_depth.
+        """
+        job = Job(user_id, fn, label)
+        with self._condition:
+            self._prune(time.time())
+            active = sum(
+                1 for j in self._jobs.values() if j.user_id == user_id and j.status in (QUEUED, RUNNING)
+            )
+            if active >= self.max_queued_per_user:
+                self._stats["rejected"] += 1
+                raise QueueFullError("You already have a generation in progress. Please wait for it to finish.")
+            if self._queued >= self.max_queue_depth:
+                self._stats["rejected"] += 1
+                raise QueueFullError("The server is busy right now. Please try again in a minute.")
+            self._jobs[job.id] = job
+            self._queues.setdefault(user_id, deque()).append(job)
+            self._queued += 1
+            self._stats["submitted"] += 1
+            self._ensure_workers()
+            self._condition.notify()
+        return job.id
+
+    def get(self, job_id):
+        """Return a snapshot of the job with its queue position, or None if unknown or expired"""
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            snapshot = job.snapshot()
+            snapshot["position"] = self._position(job) if job.status == QUEUED else 0
+        return snapshot
+
+    def cancel(self, job_id):
+        """Cancel a queued or running job; returns False if it already finished
+
+        A running job is marked cancelled right away and whatever it returns
+        is discarded; job.is_cancelled() tells it to stop early.
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in (QUEUED, RUNNING):
+                return False
+            job._cancelled.set()
+            if job.status == QUEUED:
+                self._queues[job.user_id].remove(job)
+                if not self._queues[job.user_id]:
+                    del self._queues[job.user_id]
+                self._queued -= 1
+            self._finish(job, CANCELLED)
+            return True
+
+    def get_stats(self):
+        with self._condition:
+            return dict(self._stats, queued=self._queued, running=self._running, workers=self.max_workers)
+
+    def _position(self, job):
+        # Caller holds the lock. Position under round-robin dispatch, 1 = next to start
+        own_index = self._queues[job.user_id].index(job)
+        position = 1
+        ahead = True
+        for user_id, queue in self._queues.items():
+            if user_id == job.user_id:
+                ahead = False
+            # Every user gets own_index turns before ours; users ahead in the rotation get one more
+            position += min(len(queue), own_index + 1 if ahead else own_index)
+        return position
+
+    def _ensure_workers(self):
+        # Caller holds the lock
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._work, name=f"job-worker-{next(self._counter)}", daemon=True
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _next_job(self):
+        # Caller holds the lock. Take the head of the first user's queue, then move that user to the back
+        user_id, queue = next(iter(self._queues.items()))
+        job = queue.popleft()
+        del self._queues[user_id]
+        if queue:
+            self._queues[user_id] = queue
+        self._queued -= 1
+        return job
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while not self._queues:
+                    self._condition.wait()
+                job = self._next_job()
+                job.status = RUNNING
+                job.started_at = time.time()
+                self._running += 1
+                fn = job._fn
+            try:
+                result, error = fn(job), None
+            except Exception as e:
+                result, error = None, str(e)
+            with self._condition:
+                self._running -= 1
+                if job.status == CANCELLED:
+                    # Already reported as cancelled; the result is discarded
+                    continue
+                job.result, job.error = result, error
+                self._finish(job, FAILED if error is not None else DONE)
+
+    def _finish(self, job, status):
+        # Caller holds the lock
+        job.status = status
+        job.finished_at = time.time()
+        job._fn = None
+        self._stats[{DONE: "completed", FAILED: "failed", CANCELLED: "cancelled"}[status]] += 1
+
+    def _prune(self, now):
+        # Caller holds the lock
+        for job_id in [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > FINISHED_JOB_TTL
+        ]:
+            del self._jobs[job_id]
+
+
+_scheduler = JobScheduler()
+
+
+def get_job_scheduler():
+    """Return the process-wide job scheduler"""
+    return _scheduler
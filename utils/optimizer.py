@@ -0,0 +1,385 @@
+"""Post-processing optimizer for generated portfolio HTML
+
+Replaces the Font Awesome stylesheet with the icons the page uses and trims
+Google Fonts to the weights it uses (see utils.trim), then minifies the
+markup, inline CSS and inline JavaScript, drops CSS rules whose selectors
+match no element in the document and removes exact duplicate rules.
+Everything is conservative: anything the optimizer cannot reason about
+(attribute selectors, escaped class names, unknown script types) is kept.
+"""
+import gzip
+import json
+import re
+from html.parser import HTMLParser
+
+from utils.trim import trim_assets
+
+PROTECTED_BLOCK_RE = re.compile(r"<(script|style|pre|textarea)\b([^>]*)>(.*?)</\1\s*>", re.S | re.I)
+# Section markers are kept so incremental regeneration can still find them
+HTML_COMMENT_RE = re.compile(r"<!--(?!\s*/?section:)(?!\[if).*?-->", re.S | re.I)
+BLOCK_TAGS = (
+    "html|head|body|meta|link|title|style|script|noscript|div|section|header|footer|nav|main|article|aside|"
+    "h[1-6]|p|ul|ol|li|dl|dt|dd|form|fieldset|table|thead|tbody|tfoot|tr|td|th|figure|figcaption|blockquote|hr|br|!doctype"
+)
+SPACE_BEFORE_BLOCK_RE = re.compile(r"\s+(</?(?:%s)\b)" % BLOCK_TAGS, re.I)
+SPACE_AFTER_BLOCK_RE = re.compile(r"(</?(?:%s)\b[^>]*>)\s+" % BLOCK_TAGS, re.I)
+CSS_STRING_RE = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')")
+CSS_GROUP_AT_RULES = ("@media", "@supports", "@container", "@layer", "@document")
+PSEUDO_RE = re.compile(r"::?[a-zA-Z-]+(\([^()]*(\([^()]*\)[^()]*)*\))?")
+JS_TYPES = ("", "text/javascript", "application/javascript", "module")
+JS_REGEX_PRECEDERS = "(,=:[!&|?{};+-*%<>~^"
+JS_WORD_RE = re.compile(r"[A-Za-z_][\w-]*")
+JS_REGEX_KEYWORDS = {"return", "typeof", "case", "in", "of", "new", "delete", "void", "throw", "else", "do", "yield", "await"}
+
+
+class _UsageCollector(HTMLParser):
+    """Collect tag names, classes and ids present in a document"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tags = set()
+        self.classes = set()
+        self.ids = set()
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag.lower())
+        for name, value in attrs:
+            if name == "class" and value:
+                self.classes.update(value.split())
+            elif name == "id" and value:
+                self.ids.add(value.strip())
+
+
+def _collect_usage(html_content, scripts):
+    collector = _UsageCollector()
+    collector.feed(html_content)
+    collector.close()
+    # Scripts can add classes, ids and elements at runtime, so treat every word in them as used
+    script_words = set()
+    for script in scripts:
+        script_words.update(JS_WORD_RE.findall(script))
+    return {
+        "tags": collector.tags | {w.lower() for w in script_words},
+        "classes": collector.classes | script_words,
+        "ids": collector.ids | script_words,
+    }
+
+
+def _protect_strings(text, pattern):
+    strings = []
+
+    def stash(match):
+        strings.append(match.group(0))
+        return f"\x00{len(strings) - 1}\x00"
+
+    return pattern.sub(stash, text), strings
+
+
+def _restore_strings(text, strings):
+    return re.sub(r"\x00(\d+)\x00", lambda m: strings[int(m.group(1))], text)
+
+
+def _minify_css_fragment(text, declarations=True):
+    text, strings = _protect_strings(text, CSS_STRING_RE)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+    # In selectors and at-rule preludes a space before ":" is significant
+    text = re.sub(r"\s*:\s*" if declarations else r":\s+", ":", text)
+    text = text.replace(";}", "}")
+    if declarations:
+        text = text.rstrip(";")
+    return _restore_strings(text.strip(), strings)
+
+
+def _minify_selector(selector):
+    selector, strings = _protect_strings(selector, CSS_STRING_RE)
+    selector = re.sub(r"\s+", " ", selector)
+    selector = re.sub(r"\s*([,>])\s*", r"\1", selector)
+    return _restore_strings(selector.strip(), strings)
+
+
+def _find_css_boundary(css, start, chars):
+    """Return the index of the first of chars at depth zero, skipping strings"""
+    i = start
+    while i < len(css):
+        c = css[i]
+        if c in "\"'":
+            end = css.find(c, i + 1)
+            while end != -1 and css[end - 1] == "\\":
+                end = css.find(c, end + 1)
+            i = len(css) if end == -1 else end + 1
+            continue
+        if c in chars:
+            return i
+        i += 1
+    return -1
+
+
+def _matching_brace(css, open_index):
+    depth = 0
+    i = open_index
+    while i < len(css):
+        c = css[i]
+        if c in "\"'":
+            end = css.find(c, i + 1)
+            while end != -1 and css[end - 1] == "\\":
+                end = css.find(c, end + 1)
+            i = len(css) if end == -1 else end + 1
+            continue
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(css)
+
+
+def parse_css(css):
+    """Parse CSS into nodes: ("rule", selector, body), ("group", prelude, children),
+    ("block", prelude, body) for other at-rules, and ("raw", text)"""
+    nodes = []
+    i = 0
+    while i < len(css):
+        while i < len(css) and css[i].isspace():
+            i += 1
+        if i >= len(css):
+            break
+        boundary = _find_css_boundary(css, i, "{;}")
+        if boundary == -1:
+            nodes.append(("raw", css[i:].strip()))
+            break
+        if css[boundary] != "{":
+            statement = css[i:boundary + 1].strip()
+            if statement not in (";", "}"):
+                nodes.append(("raw", statement))
+            i = boundary + 1
+            continue
+        prelude = css[i:boundary].strip()
+        close = _matching_brace(css, boundary)
+        body = css[boundary + 1:close]
+        if prelude.lower().startswith(CSS_GROUP_AT_RULES):
+            nodes.append(("group", prelude, parse_css(body)))
+        elif prelude.startswith("@"):
+            nodes.append(("block", prelude, body))
+        else:
+            nodes.append(("rule", prelude, body))
+        i = close + 1
+    return nodes
+
+
+def _compound_may_match(compound, used):
+    if not compound or compound == "*":
+        return True
+    tag = re.match(r"^[a-zA-Z][\w-]*", compound)
+    if tag and tag.group(0).lower() not in used["tags"]:
+        return False
+    if any(c not in used["classes"] for c in re.findall(r"\.([\w-]+)", compound)):
+        return False
+    if any(i not in used["ids"] for i in re.findall(r"#([\w-]+)", compound)):
+        return False
+    return True
+
+
+def selector_may_match(selector, used):
+    """Return False only when a selector provably matches nothing in the document"""
+    if "\\" in selector:
+        return True
+    stripped = PSEUDO_RE.sub("", selector)
+    stripped = re.sub(r"\[[^\]]*\]", "", stripped)
+    for compound in re.split(r"\s*[>+~]\s*|\s+", stripped.strip()):
+        if not _compound_may_match(compound, used):
+            return False
+    return True
+
+
+def _split_selectors(prelude):
+    parts = []
+    depth = 0
+    current = ""
+    for c in prelude:
+        if c in "([":
+            depth += 1
+        elif c in ")]":
+            depth -= 1
+        if c == "," and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += c
+    parts.append(current)
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _optimize_css_nodes(nodes, used, stats):
+    kept = []
+    for node in nodes:
+        if node[0] == "rule":
+            selectors = [s for s in _split_selectors(node[1]) if selector_may_match(s, used)]
+            if not selectors:
+                stats["removed_rules"] += 1
+                continue
+            kept.append(("rule", ",".join(_minify_selector(s) for s in selectors), _minify_css_fragment(node[2])))
+        elif node[0] == "group":
+            children = _optimize_css_nodes(node[2], used, stats)
+            if children:
+                kept.append(("group", _minify_css_fragment(node[1], declarations=False), children))
+        elif node[0] == "block":
+            kept.append(("block", _minify_css_fragment(node[1], declarations=False), _minify_css_fragment(node[2])))
+        else:
+            kept.append(("raw", _minify_css_fragment(node[1], declarations=False)))
+
+    # Keep the last copy of an exact duplicate so the cascade order is unchanged
+    seen = set()
+    deduped = []
+    for node in reversed(kept):
+        key = (node[0], node[1], node[2] if node[0] != "group" else _serialize_css(node[2]))
+        if node[0] in ("rule", "block") and key in seen:
+            stats["duplicate_rules"] += 1
+            continue
+        seen.add(key)
+        deduped.append(node)
+    return list(reversed(deduped))
+
+
+def _serialize_css(nodes):
+    out = []
+    for node in nodes:
+        if node[0] in ("rule", "block"):
+            out.append(f"{node[1]}{{{node[2]}}}")
+        elif node[0] == "group":
+            out.append(f"{node[1]}{{{_serialize_css(node[2])}}}")
+        else:
+            out.append(node[1])
+    return "".join(out)
+
+
+def optimize_css(css, used, stats):
+    """Minify css, dropping unused and duplicate rules"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    return _serialize_css(_optimize_css_nodes(parse_css(css), used, stats))
+
+
+def _starts_js_regex(out, last_significant):
+    if last_significant == "" or last_significant in JS_REGEX_PRECEDERS:
+        return True
+    if last_significant.isalpha():
+        word = re.search(r"([A-Za-z_$]+)\s*$", "".join(out[-16:]))
+        return bool(word) and word.group(1) in JS_REGEX_KEYWORDS
+    return False
+
+
+def minify_js(js):
+    """Strip comments, indentation and blank lines from JavaScript
+
+    Strings, template literals and regex literals are left untouched and line
+    breaks are preserved, so automatic semicolon insertion still behaves.
+    """
+    out = []
+    literals = []
+    last_significant = ""
+    i = 0
+    n = len(js)
+    while i < n:
+        c = js[i]
+        if c in "\"'`":
+            j = i + 1
+            while j < n and js[j] != c:
+                if js[j] == "\\":
+                    j += 1
+                elif c != "`" and js[j] == "\n":
+                    break
+                j += 1
+            literals.append(js[i:j + 1])
+            out.append(f"\x00{len(literals) - 1}\x00")
+            last_significant = c
+            i = j + 1
+            continue
+        if c == "/" and i + 1 < n and js[i + 1] == "/":
+            j = js.find("\n", i)
+            i = n if j == -1 else j
+            continue
+        if c == "/" and i + 1 < n and js[i + 1] == "*":
+            j = js.find("*/", i + 2)
+            i = n if j == -1 else j + 2
+            out.append(" ")
+            continue
+        if c == "/" and _starts_js_regex(out, last_significant):
+            j = i + 1
+            in_class = False
+            while j < n and js[j] != "\n":
+                if js[j] == "\\":
+                    j += 2
+                    continue
+                if js[j] == "[":
+                    in_class = True
+                elif js[j] == "]":
+                    in_class = False
+                elif js[j] == "/" and not in_class:
+                    break
+                j += 1
+            literals.append(js[i:j + 1])
+            out.append(f"\x00{len(literals) - 1}\x00")
+            last_significant = "/"
+            i = j + 1
+            continue
+        out.append(c)
+        if not c.isspace():
+            last_significant = c
+        i += 1
+
+    lines = (re.sub(r"[ \t]+", " ", line).strip() for line in "".join(out).split("\n"))
+    return _restore_strings("\n".join(line for line in lines if line), literals)
+
+
+def minify_html(html_content):
+    """Collapse whitespace and drop comments outside script/style/pre/textarea"""
+    html_content = HTML_COMMENT_RE.sub("", html_content)
+    html_content = re.sub(r"\s+", " ", html_content)
+    html_content = SPACE_BEFORE_BLOCK_RE.sub(r"\1", html_content)
+    html_content = SPACE_AFTER_BLOCK_RE.sub(r"\1", html_content)
+    return html_content.strip()
+
+
+def optimize_html(html_content):
+    """Return (optimized_html, stats) for a generated portfolio document"""
+    stats = {
+        "original_bytes": len(html_content.encode("utf-8")),
+        "removed_rules": 0,
+        "duplicate_rules": 0,
+    }
+    html_content, trim_stats = trim_assets(html_content)
+    stats.update(trim_stats)
+    blocks = PROTECTED_BLOCK_RE.findall(html_content)
+    scripts = [body for tag, _, body in blocks if tag.lower() == "script"]
+    used = _collect_usage(PROTECTED_BLOCK_RE.sub(lambda m: f"<{m.group(1)}{m.group(2)}></{m.group(1)}>", html_content), scripts)
+
+    protected = []
+
+    def protect(match):
+        tag, attrs, body = match.group(1), match.group(2), match.group(3)
+        lower_tag = tag.lower()
+        if lower_tag == "style":
+            body = optimize_css(body, used, stats)
+        elif lower_tag == "script":
+            script_type = (re.search(r"type\s*=\s*[\"']?([^\"'\s>]+)", attrs) or [None, ""])[1].lower()
+            if script_type == "application/ld+json":
+                try:
+                    body = json.dumps(json.loads(body), ensure_ascii=False, separators=(",", ":"))
+                except ValueError:
+                    pass
+            elif script_type in JS_TYPES:
+                body = minify_js(body)
+        attrs = re.sub(r"\s+", " ", attrs).rstrip()
+        protected.append(f"<{tag}{attrs}>{body}</{tag}>")
+        return f"\x01{len(protected) - 1}\x01"
+
+    html_content = PROTECTED_BLOCK_RE.sub(protect, html_content)
+    html_content = minify_html(html_content)
+    html_content = re.sub(r"\x01(\d+)\x01", lambda m: protected[int(m.group(1))], html_content)
+
+    optimized_bytes = html_content.encode("utf-8")
+    stats["optimized_bytes"] = len(optimized_bytes)
+    stats["gzip_bytes"] = len(gzip.compress(optimized_bytes, compresslevel=9))
+    return html_content, stats
@@ -0,0 +1,242 @@
+"""Prompt construction for portfolio generation
+
+The prompt is split into a static system prefix, identical for every request
+so provider-side prompt caching can hit, and a compact JSON payload holding
+only the fields the user actually filled in.
+"""
+import copy
+import json
+import math
+
+# Rough budget for the per-user payload; the static prefix is not counted
+DEFAULT_INPUT_TOKEN_BUDGET = 3000
+
+# Lists whose descriptions are shortened, then entries dropped, when a payload is over budget
+TRIMMABLE_LISTS = ("projects", "experience", "education")
+MIN_TRIMMED_CHARS = 120
+
+SYSTEM_PROMPT = """You are an expert web developer and designer who creates stunning, modern, responsive portfolio websites. Generate complete, production-ready HTML with inline CSS and JavaScript.
+
+You will receive the person's details as JSON. Only the fields they filled in are present; omit sections with no data instead of inventing content.
+
+## Technical Requirements:
+1. Create a COMPLETE single HTML file with inline CSS and JavaScript
+2. Make it FULLY RESPONSIVE (mobile, tablet, desktop)
+3. Use the specified color scheme and fonts
+4. Include smooth scroll behavior
+5. Add hover effects and animations as specified
+6. Use Font Awesome icons (via CDN)
+7. Include meta tags for SEO with proper title, description, keywords
+8. Add smooth transitions between sections
+9. Make navigation sticky/fixed on scroll
+10. Include a hero section with gradient background matching the theme
+11. Use CSS Grid/Flexbox for modern, responsive layouts
+12. Add scroll-triggered animations using Intersection Observer
+13. Include social media icons with proper links
+14. Make all buttons and links beautifully styled with hover effects
+15. Add a professional footer with copyright and links
+16. Use CSS variables for easy theming
+17. Make the contact form functional with FormSpree or EmailJS integration
+18. Add smooth page transitions and loading states
+19. Include proper semantic HTML5
+20. Ensure WCAG accessibility compliance
+
+## Style Guidelines:
+- Use the design.theme color palette with gradients (design.colors)
+- Apply the design.fonts font pairing from Google Fonts
+- Implement the design.layout layout structure
+- Include the animations listed in design.animations
+- Include every item listed in features
+- Professional spacing, shadows, rounded corners, and transitions
+- Use placeholder images from placeholder.com or unsplash
+
+## CRITICAL REQUIREMENTS:
+- Start DIRECTLY with <!DOCTYPE html>
+- End with </html>
+- Do NOT include markdown code blocks (```)
+- Do NOT include explanations or comments outside the HTML
+- Make it production-ready and visually stunning
+- Ensure all sections flow naturally
+- Test all interactive elements work properly"""
+
+FEATURE_LABELS = {
+    "contact_form": "contact form",
+    "resume_button": "resume download button",
+    "testimonials": "testimonials section",
+    "blog": "blog/articles section",
+    "seo": "SEO meta tags",
+    "analytics": "Google Analytics ready snippet",
+}
+
+
+def estimate_tokens(text):
+    """Cheap token estimate (about four characters per token for English and JSON)"""
+    return math.ceil(len(text) / 4)
+
+
+def _compact(value):
+    """Drop empty strings, lists and dicts recursively"""
+    if isinstance(value, dict):
+        compacted = {k: _compact(v) for k, v in value.items()}
+        return {k: v for k, v in compacted.items() if v not in ("", None, [], {})}
+    if isinstance(value, list):
+        compacted = [_compact(v) for v in value]
+        return [v for v in compacted if v not in ("", None, [], {})]
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def build_payload(data):
+    """Return the compact structured payload for portfolio data"""
+    design = data.get("design", {})
+    scheme = design.get("color_scheme") or {}
+    payload = {
+        "personal": data.get("personal", {}),
+        "social": data.get("social", {}),
+        "skills": data.get("skills", {}),
+        "projects": data.get("projects", []),
+        "experience": data.get("experience", []),
+        "education": data.get("education", []),
+        "certifications": data.get("certifications", ""),
+        "features": [label for key, label in FEATURE_LABELS.items() if data.get("options", {}).get(key)],
+        # Design goes last: requests that differ only in design (e.g. variants) then share
+        # everything up to it, which is what provider prefix caching matches on
+        "design": {
+            "theme": design.get("theme", ""),
+            "layout": design.get("layout", ""),
+            "fonts": design.get("fonts", ""),
+            "animations": design.get("animations", []),
+            "colors": {
+                "primary": scheme.get("primary", ""),
+                "secondary": scheme.get("secondary", ""),
+                "accent": scheme.get("accent", ""),
+            },
+        },
+    }
+    return _compact(payload)
+
+
+def _serialize(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _shorten(text, limit):
+    if len(text) <= limit:
+        return text
+    cut = text[:limit].rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;") + "…"
+
+
+def _longest_text(payload):
+    """Return (container, key, length) for the longest trimmable text field"""
+    candidates = []
+    for list_name in TRIMMABLE_LISTS:
+        for item in payload.get(list_name, []):
+            if isinstance(item.get("description"), str):
+                candidates.append((item, "description"))
+    if isinstance(payload.get("certifications"), str):
+        candidates.append((payload, "certifications"))
+    if isinstance(payload.get("personal", {}).get("bio"), str):
+        candidates.append((payload["personal"], "bio"))
+    candidates = [(c, k, len(c[k])) for c, k in candidates if len(c[k]) > MIN_TRIMMED_CHARS]
+    return max(candidates, key=lambda c: c[2]) if candidates else None
+
+
+def fit_to_budget(payload, budget=DEFAULT_INPUT_TOKEN_BUDGET):
+    """Shrink the payload until it fits the token budget
+
+    The longest free-text field is shortened first; once nothing is left to
+    shorten, the last entries of the longest list are dropped. Returns the
+    trimmed copy and a list of what was changed.
+    """
+    payload = copy.deepcopy(payload)
+    trimmed = []
+    while estimate_tokens(_serialize(payload)) > budget:
+        longest = _longest_text(payload)
+        if longest:
+            container, key, length = longest
+            container[key] = _shorten(container[key], max(MIN_TRIMMED_CHARS, int(length * 0.6)))
+            trimmed.append(f"shortened {key}")
+            continue
+        lists = [name for name in TRIMMABLE_LISTS if len(payload.get(name, [])) > 1]
+        if not lists:
+            break
+        longest_list = max(lists, key=lambda name: len(payload[name]))
+        payload[longest_list].pop()
+        trimmed.append(f"dropped one {longest_list} entry")
+    return payload, trimmed
+
+
+def build_prompt(data, budget=DEFAULT_INPUT_TOKEN_BUDGET):
+    """Return (system_prompt, user_prompt, report) for portfolio data"""
+    payload, trimmed = fit_to_budget(build_payload(data), budget)
+    user_prompt = (
+        "Portfolio data (JSON):\n"
+        f"{_serialize(payload)}\n\n"
+        "Generate ONLY the complete, production-ready HTML code now."
+    )
+    report = {
+        "system_tokens": estimate_tokens(SYSTEM_PROMPT),
+        "payload_tokens": estimate_tokens(user_prompt),
+        "input_tokens": estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(user_prompt),
+        "budget": budget,
+        "trimmed": sorted(set(trimmed)),
+    }
+    return SYSTEM_PROMPT, user_prompt, report
+
+
+SKELETON_SYSTEM_PROMPT = """You are an expert web developer and designer who creates stunning, modern, responsive portfolio websites.
+
+You are writing the shared shell of a single-file portfolio. Other developers will write each content section in parallel and drop it into your shell, so:
+- Output a COMPLETE HTML document: <!DOCTYPE html>, <head> with SEO meta tags, Google Fonts and Font Awesome (via CDN), one <style> block, sticky navigation, a <main> element, a footer and one <script> block
+- Inside <main>, write exactly one placeholder comment per requested section, in the given order, like <!-- SECTION:projects -->, and nothing else
+- The <style> block must fully style every section: hero, cards, grids, tags, timelines, forms, buttons, social icons, using CSS variables for theming
+- Use short, reusable class names (e.g. .section, .section-title, .card, .card-grid, .tag, .btn, .timeline-item, .hero, .social-links)
+- The script must add scroll-triggered animations with Intersection Observer for elements with the class .reveal
+- Use the design.theme colors, design.fonts pairing, design.layout structure and design.animations
+
+## CRITICAL REQUIREMENTS:
+- Start DIRECTLY with <!DOCTYPE html> and end with </html>
+- Do NOT include markdown code blocks (```) or explanations"""
+
+SECTION_SYSTEM_PROMPT = """You are an expert web developer writing one section of a portfolio website. The page shell, CSS and JavaScript already exist.
+
+- Output ONLY a single <section> element with the requested id, no <html>, <head>, <style> or <script>
+- Use ONLY the CSS class names you are given; add the class "reveal" to elements that should animate in
+- Use semantic HTML5, Font Awesome icons (<i class="fa-...">) and accessible markup
+- Use only the data provided; do not invent employers, projects or contact details
+
+## CRITICAL REQUIREMENTS:
+- Start DIRECTLY with <section and end with </section>
+- Do NOT include markdown code blocks (```) or explanations"""
+
+
+def build_skeleton_prompt(data, section_ids):
+    """Return (system_prompt, user_prompt) for the shared style/skeleton pass"""
+    payload = build_payload(data)
+    shell = {
+        "personal": {k: v for k, v in payload.get("personal", {}).items() if k in ("name", "title")},
+        "social": payload.get("social", {}),
+        "design": payload.get("design", {}),
+        "features": payload.get("features", []),
+        "sections": section_ids,
+    }
+    user_prompt = (
+        "Portfolio shell (JSON):\n"
+        f"{_serialize(_compact(shell))}\n\n"
+        "Generate ONLY the complete HTML shell now."
+    )
+    return SKELETON_SYSTEM_PROMPT, user_prompt
+
+
+def build_section_prompt(section_id, section_payload, class_names, budget=DEFAULT_INPUT_TOKEN_BUDGET):
+    """Return (system_prompt, user_prompt) for one section of a parallel generation"""
+    section_payload, _ = fit_to_budget(_compact(section_payload), budget)
+    user_prompt = (
+        f'Section id: "{section_id}"\n'
+        f"Available CSS classes: {' '.join(class_names)}\n"
+        f"Section data (JSON):\n{_serialize(section_payload)}\n\n"
+        f'Generate ONLY the <section id="{section_id}"> element now.'
+    )
+    return SECTION_SYSTEM_PROMPT, user_prompt
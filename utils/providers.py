@@ -0,0 +1,296 @@
+"""Provider interface for the LLM backends
+
+Each provider wraps one SDK behind the same three calls: complete, stream
+and check_key. Clients come from utils.clients, which imports an SDK only
+when its first client is built. A session that only uses Gemini never
+pays for importing openai, and vice versa.
+
+Every complete and stream call holds one of MAX_UPSTREAM_CALLS process-wide
+slots (PORTFOLIO_MAX_UPSTREAM_CALLS, default 8), so the number of requests
+the app has in flight to the providers is capped no matter how many jobs,
+sections or variants fan out at once. Tools that pick their own concurrency,
+such as utils.batch and utils.benchmark, set the cap with upstream_limit().
+Calls made inside cancel_scope(should_stop) stop waiting for a slot, and
+raise GenerationCancelled, as soon as should_stop() returns True.
+"""
+import contextlib
+import contextvars
+import os
+import threading
+
+from utils.clients import get_gemini_model, get_gemini_model_client, get_openai_client
+
+MAX_UPSTREAM_CALLS = int(os.environ.get("PORTFOLIO_MAX_UPSTREAM_CALLS", "8"))
+# How often a call waiting for a slot re-checks its cancel scope
+SLOT_POLL_SECONDS = 0.1
+
+
+
+class UpstreamSlots:
+    """A counting semaphore whose limit can be changed while slots are held"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._in_use = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """Take a slot, waiting at most timeout seconds; returns False if none came free"""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_use < self.limit, timeout):
+                return False
+            self._in_use += 1
+            return True
+
+    def release(self):
+        with self._condition:
+            if self._in_use == 0:
+                raise ValueError("UpstreamSlots released too many times")
+            self._in_use -= 1
+            self._condition.notify()
+
+    def resize(self, limit):
+        """Set a new limit and return the old one; slots already held are kept"""
+        with self._condition:
+            previous, self.limit = self.limit, limit
+            self._condition.notify_all()
+            return previous
+
+    @property
+    def in_use(self):
+        return self._in_use
+
+
+_upstream_slots = UpstreamSlots(MAX_UPSTREAM_CALLS)
+_should_stop = contextvars.ContextVar("should_stop", default=None)
+
+
+@contextlib.contextmanager
+def upstream_limit(limit):
+    """Cap upstream calls at limit inside this block, e.g. at a CLI's own --concurrency"""
+    previous = _upstream_slots.resize(limit)
+    try:
+        yield
+    finally:
+        _upstream_slots.resize(previous)
+
+
+class GenerationCancelled(Exception):
+    """Raised by provider calls made inside a cancel scope that was cancelled"""
+
+
+@contextlib.contextmanager
+def cancel_scope(should_stop):
+    """Make provider calls in this context (and threads started with its copy) honour should_stop()
+
+    A nested scope also honours the one around it, so an inner scope can only
+    stop calls earlier, never keep them running after the outer one stops.
+    """
+    outer = _should_stop.get()
+    if outer is not None:
+        inner = should_stop
+
+        def should_stop():
+            return inner() or outer()
+
+    token = _should_stop.set(should_stop)
+    try:
+        yield
+    finally:
+        _should_stop.reset(token)
+
+
+def is_cancelled():
+    """True if the current cancel scope has been cancelled"""
+    should_stop = _should_stop.get()
+    return bool(should_stop and should_stop())
+
+
+def _acquire_slot():
+    while not _upstream_slots.acquire(timeout=SLOT_POLL_SECONDS):
+        if is_cancelled():
+            raise GenerationCancelled("Generation cancelled")
+    if is_cancelled():
+        _upstream_slots.release()
+        raise GenerationCancelled("Generation cancelled")
+
+
+@contextlib.contextmanager
+def upstream_slot():
+    """Hold one upstream slot for the duration of a non-streaming call"""
+    _acquire_slot()
+    try:
+        yield
+    finally:
+        _upstream_slots.release()
+
+
+class UpstreamStream:
+    """A streaming response holding one upstream slot until it is exhausted or closed
+
+    Iterating yields the text chunks; close() cancels the response and gives
+    the slot back, and is safe to call more than once or from another thread.
+    cancel defaults to the response's close(). cancellable is False when there
+    is none: close() then only stops reading, and the provider may keep
+    generating until it is done.
+    """
+
+    def __init__(self, response, texts, cancel=None):
+        self.response = response
+        self._cancel = cancel or getattr(response, "close", None)
+        self.cancellable = callable(self._cancel)
+        self._texts = texts
+        self._lock = threading.Lock()
+        self._released = False
+
+    def __iter__(self):
+        try:
+            yield from self._texts
+        finally:
+            self._release()
+
+    def close(self):
+        try:
+            if self.cancellable:
+                self._cancel()
+        finally:
+            self._release()
+
+    def _release(self):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        _upstream_slots.release()
+
+
+def is_length_stop(finish_reason):
+    # OpenAI reports "length"; Gemini reports the MAX_TOKENS enum member
+    return getattr(finish_reason, "name", finish_reason) in ("length", "MAX_TOKENS")
+
+
+class OpenAIProvider:
+    name = "openai"
+
+    def _messages(self, system_prompt, prompt, history=()):
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ] + [{"role": role, "content": text} for role, text in history]
+
+    def complete(self, system_prompt, prompt, api_key, model, config, history=()):
+        """Return (text, hit_output_limit) for one non-streaming request"""
+        with upstream_slot():
+            response = get_openai_client(api_key).chat.completions.create(
+                model=model,
+                messages=self._messages(system_prompt, prompt, history),
+                temperature=config['temperature'],
+                max_tokens=config['max_tokens']
+            )
+        choice = response.choices[0]
+        return choice.message.content or "", is_length_stop(choice.finish_reason)
+
+    def stream(self, system_prompt, prompt, api_key, model, config):
+        """Return (stream, text_iterator); close the stream to cancel"""
+        _acquire_slot()
+        try:
+            response = get_openai_client(api_key).chat.completions.create(
+                model=model,
+                messages=self._messages(system_prompt, prompt),
+                temperature=config['temperature'],
+                max_tokens=config['max_tokens'],
+                stream=True
+            )
+        except BaseException:
+            _upstream_slots.release()
+            raise
+
+        def texts():
+            for event in response:
+                if event.choices and event.choices[0].delta.content:
+                    yield event.choices[0].delta.content
+
+        stream = UpstreamStream(response, texts())
+        return stream, iter(stream)
+
+    def check_key(self, api_key, model):
+        """Raise if api_key cannot see model"""
+        get_openai_client(api_key).models.retrieve(model)
+
+
+def _gemini_text(response):
+    # response.text raises ValueError on a safety-blocked, empty or multi-part candidate
+    candidates = response.candidates
+    if not candidates:
+        return ""
+    return "".join(getattr(part, "text", "") for part in candidates[0].content.parts)
+
+
+class GeminiProvider:
+    name = "gemini"
+
+    def _generation_config(self, config):
+        return {
+            'temperature': config['temperature'],
+            'top_p': config['top_p'],
+            'top_k': config['top_k'],
+            'max_output_tokens': config['max_tokens'],
+        }
+
+    def _contents(self, system_prompt, prompt, history=()):
+        # The static prefix goes first so Gemini sees an identical leading part every time
+        contents = [system_prompt, prompt]
+        if history:
+            contents = [{"role": "user", "parts": contents}] + [
+                {"role": "model" if role == "assistant" else "user", "parts": [text]} for role, text in history
+            ]
+        return contents
+
+    def complete(self, system_prompt, prompt, api_key, model, config, history=()):
+        with upstream_slot():
+            response = get_gemini_model(api_key, model).generate_content(
+                self._contents(system_prompt, prompt, history),
+                generation_config=self._generation_config(config)
+            )
+        candidates = response.candidates
+        return _gemini_text(response), bool(candidates) and is_length_stop(candidates[0].finish_reason)
+
+    def stream(self, system_prompt, prompt, api_key, model, config):
+        """Return (stream, text_iterator); close the stream to cancel, best-effort
+
+        The SDK response has no close(). Cancelling goes through the gRPC call
+        it wraps, a private attribute; when that is missing (another transport
+        or SDK version), closing only stops reading, and Gemini keeps generating
+        and billing tokens until the response is complete.
+        """
+        _acquire_slot()
+        try:
+            response = get_gemini_model(api_key, model).generate_content(
+                self._contents(system_prompt, prompt),
+                generation_config=self._generation_config(config),
+                stream=True
+            )
+        except BaseException:
+            _upstream_slots.release()
+            raise
+
+        def texts():
+            for event in response:
+                text = _gemini_text(event)
+                if text:
+                    yield text
+
+        stream = UpstreamStream(response, texts(), cancel=getattr(getattr(response, "_iterator", None), "cancel", None))
+        return stream, iter(stream)
+
+    def check_key(self, api_key, model):
+        get_gemini_model_client(api_key).get_model(name=f"models/{model}")
+
+
+_openai = OpenAIProvider()
+_gemini = GeminiProvider()
+
+
+def get_provider(provider):
+    """Return the provider for a UI label such as "OpenAI (GPT-4/3.5)" or "Google Gemini" """
+    return _openai if "OpenAI" in provider else _gemini
@@ -0,0 +1,455 @@
+"""Offline deterministic portfolio renderer
+
+Turns the portfolio_data dict built in app.py into a complete single-file
+portfolio using precompiled templates for each layout plus the schemes and
+fonts in utils.templates. No network calls, so it renders in milliseconds.
+"""
+import html
+import re
+from string import Template
+
+from utils.templates import get_color_schemes, get_font_pairs
+
+DOCUMENT_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>$page_title</title>
+$meta
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="$font_url" rel="stylesheet">
+<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css">
+<style>
+$css
+</style>
+$analytics
+</head>
+<body class="$body_class">
+$body
+<script>
+$script
+</script>
+</body>
+</html>
+""")
+
+BASE_CSS = Template("""
+:root {
+  --primary-gradient: $primary;
+  --secondary: $secondary;
+  --accent: $accent;
+  --text: #1f2937;
+  --muted: #6b7280;
+  --surface: #ffffff;
+  --background: #f8fafc;
+  --heading-font: '$heading_font', sans-serif;
+  --body-font: '$body_font', sans-serif;
+}
+* { box-sizing: border-box; margin: 0; padding: 0; }
+html { scroll-behavior: smooth; }
+body { font-family: var(--body-font); color: var(--text); background: var(--background); line-height: 1.6; }
+h1, h2, h3 { font-family: var(--heading-font); line-height: 1.2; }
+a { color: var(--secondary); text-decoration: none; }
+.container { max-width: 1100px; margin: 0 auto; padding: 0 1.5rem; }
+.nav { position: sticky; top: 0; z-index: 10; background: var(--surface); box-shadow: 0 2px 12px rgba(0,0,0,0.08); }
+.nav ul { list-style: none; display: flex; flex-wrap: wrap; gap: 1.25rem; padding: 1rem 1.5rem; justify-content: center; }
+.nav a { color: var(--text); font-weight: 500; }
+.nav a:hover, .nav a.active { color: var(--secondary); }
+.hero { background: var(--primary-gradient); color: #fff; padding: 6rem 1.5rem; text-align: center; }
+.hero h1 { font-size: clamp(2.2rem, 6vw, 3.5rem); margin-bottom: 0.5rem; }
+.hero .tagline { font-size: 1.25rem; opacity: 0.95; }
+.hero .location { margin-top: 0.5rem; opacity: 0.85; }
+.social { display: flex; gap: 1rem; justify-content: center; margin-top: 1.5rem; }
+.social a { color: #fff; font-size: 1.4rem; width: 2.75rem; height: 2.75rem; display: inline-flex; align-items: center; justify-content: center; border-radius: 50%; background: rgba(255,255,255,0.15); }
+.btn { display: inline-block; margin-top: 1.5rem; padding: 0.75rem 1.75rem; border-radius: 999px; background: #fff; color: var(--secondary); font-weight: 600; border: none; cursor: pointer; }
+section.block { padding: 4rem 0; }
+section.block h2 { font-size: 2rem; margin-bottom: 1.5rem; color: var(--secondary); }
+.card { background: var(--surface); border-radius: 14px; padding: 1.5rem; box-shadow: 0 6px 24px rgba(0,0,0,0.06); border-top: 4px solid var(--accent); }
+.cards { display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 1.5rem; }
+.card h3 { margin-bottom: 0.25rem; }
+.meta { color: var(--muted); font-size: 0.9rem; margin-bottom: 0.75rem; }
+.card ul { padding-left: 1.2rem; }
+.tags { display: flex; flex-wrap: wrap; gap: 0.5rem; }
+.tag { background: var(--background); border: 1px solid var(--secondary); color: var(--secondary); padding: 0.25rem 0.75rem; border-radius: 999px; font-size: 0.9rem; }
+.skill-group { margin-bottom: 1.25rem; }
+.skill-group h3 { font-size: 1.1rem; margin-bottom: 0.5rem; }
+.contact-list { list-style: none; display: grid; gap: 0.5rem; margin-bottom: 1.5rem; }
+.contact-list i { color: var(--secondary); width: 1.5rem; }
+form.contact { display: grid; gap: 1rem; max-width: 560px; }
+form.contact input, form.contact textarea { padding: 0.75rem 1rem; border: 1px solid #d1d5db; border-radius: 10px; font: inherit; }
+form.contact button { background: var(--primary-gradient); color: #fff; }
+footer { background: #111827; color: #d1d5db; text-align: center; padding: 2rem 1rem; }
+footer a { color: #fff; }
+@media (max-width: 640px) {
+  .hero { padding: 4rem 1rem; }
+  section.block { padding: 3rem 0; }
+}
+""")
+
+LAYOUT_CSS = {
+    "Single Page Scroll": "",
+    "Grid Layout": """
+main.grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(420px, 1fr)); gap: 1.5rem; padding: 2rem 1.5rem; max-width: 1300px; margin: 0 auto; }
+main.grid section.block { background: var(--surface); border-radius: 16px; padding: 2rem; box-shadow: 0 6px 24px rgba(0,0,0,0.06); }
+main.grid section.block .container { padding: 0; }
+main.grid .cards { grid-template-columns: 1fr; }
+@media (max-width: 640px) { main.grid { grid-template-columns: 1fr; } }
+""",
+    "Side Navigation": """
+.nav { position: fixed; top: 0; left: 0; bottom: 0; width: 220px; background: var(--primary-gradient); }
+.nav ul { flex-direction: column; justify-content: flex-start; padding: 2rem 1.5rem; }
+.nav a { color: #fff; }
+.nav a:hover, .nav a.active { color: #fff; text-decoration: underline; }
+.page { margin-left: 220px; }
+@media (max-width: 860px) {
+  .nav { position: sticky; width: auto; bottom: auto; }
+  .nav ul { flex-direction: row; padding: 1rem; }
+  .page { margin-left: 0; }
+}
+""",
+    "Multi-Section with Tabs": """
+.tabs { display: flex; flex-wrap: wrap; gap: 0.5rem; justify-content: center; padding: 1rem; background: var(--surface); position: sticky; top: 0; z-index: 10; box-shadow: 0 2px 12px rgba(0,0,0,0.08); }
+.tabs button { border: none; background: transparent; padding: 0.6rem 1.25rem; border-radius: 999px; font: inherit; font-weight: 500; cursor: pointer; color: var(--text); }
+.tabs button.active { background: var(--primary-gradient); color: #fff; }
+.tab-panel { display: none; }
+.tab-panel.active { display: block; }
+""",
+}
+
+ANIMATION_CSS = {
+    "Fade In": """
+.reveal { opacity: 0; transform: translateY(24px); transition: opacity 0.7s ease, transform 0.7s ease; }
+.reveal.visible { opacity: 1; transform: none; }
+""",
+    "Slide In": """
+.reveal:nth-child(odd) { transform: translateX(-40px); }
+.reveal:nth-child(even) { transform: translateX(40px); }
+.reveal { transition: opacity 0.7s ease, transform 0.7s ease; }
+.reveal.visible { transform: none; }
+""",
+    "Parallax Scrolling": """
+.hero { background-attachment: fixed; background-size: cover; }
+""",
+    "Hover Effects": """
+.card, .btn, .social a { transition: transform 0.25s ease, box-shadow 0.25s ease; }
+.card:hover { transform: translateY(-6px); box-shadow: 0 14px 32px rgba(0,0,0,0.12); }
+.btn:hover, .social a:hover { transform: translateY(-2px); }
+""",
+    "Typing Animation": """
+.hero .tagline { display: inline-block; overflow: hidden; white-space: nowrap; border-right: 2px solid #fff; animation: typing 3s steps(40, end), caret 0.8s step-end infinite; max-width: 100%; }
+@keyframes typing { from { width: 0; } to { width: 100%; } }
+@keyframes caret { 50% { border-color: transparent; } }
+""",
+    "Particle Background": """
+.hero { position: relative; overflow: hidden; }
+.hero::before { content: ""; position: absolute; inset: 0; background-image: radial-gradient(rgba(255,255,255,0.35) 1px, transparent 1px); background-size: 28px 28px; animation: drift 30s linear infinite; pointer-events: none; }
+.hero > * { position: relative; }
+@keyframes drift { from { background-position: 0 0; } to { background-position: 280px 280px; } }
+@media (prefers-reduced-motion: reduce) { .hero::before { animation: none; } }
+""",
+}
+
+REVEAL_SCRIPT = """
+var revealObserver = new IntersectionObserver(function (entries) {
+  entries.forEach(function (entry) {
+    if (entry.isIntersecting) { entry.target.classList.add('visible'); revealObserver.unobserve(entry.target); }
+  });
+}, { threshold: 0.1 });
+document.querySelectorAll('.reveal').forEach(function (el) { revealObserver.observe(el); });
+"""
+
+TABS_SCRIPT = """
+document.querySelectorAll('.tabs button').forEach(function (button) {
+  button.addEventListener('click', function () {
+    document.querySelectorAll('.tabs button, .tab-panel').forEach(function (el) { el.classList.remove('active'); });
+    button.classList.add('active');
+    document.getElementById(button.dataset.target).classList.add('active');
+    document.querySelectorAll('.tab-panel.active .reveal').forEach(function (el) { el.classList.add('visible'); });
+  });
+});
+"""
+
+FOOTER_YEAR_SCRIPT = """
+document.getElementById('year').textContent = new Date().getFullYear();
+"""
+
+SECTION_TEMPLATE = Template("""<section id="$section_id" class="block $extra_class">
+<div class="container">
+<h2>$heading</h2>
+$content
+</div>
+</section>""")
+
+HERO_TEMPLATE = Template("""<header class="hero" id="home">
+<h1>$name</h1>
+<p class="tagline">$title</p>
+$location
+<div class="social">$social</div>
+$resume
+</header>""")
+
+LAYOUT_TEMPLATES = {
+    "Single Page Scroll": Template("""$nav
+$hero
+<main>
+$sections
+</main>
+$footer"""),
+    "Grid Layout": Template("""$nav
+$hero
+<main class="grid">
+$sections
+</main>
+$footer"""),
+    "Side Navigation": Template("""$nav
+<div class="page">
+$hero
+<main>
+$sections
+</main>
+$footer
+</div>"""),
+    "Multi-Section with Tabs": Template("""$hero
+<div class="tabs" role="tablist">$tabs</div>
+<main>
+$sections
+</main>
+$footer"""),
+}
+
+SOCIAL_LINKS = [
+    ("github", "fab fa-github", "GitHub", "https://github.com/{}"),
+    ("linkedin", "fab fa-linkedin", "LinkedIn", "https://www.linkedin.com/in/{}"),
+    ("twitter", "fab fa-x-twitter", "Twitter", "https://twitter.com/{}"),
+    ("website", "fas fa-globe", "Website", "{}"),
+    ("portfolio", "fab fa-behance", "Portfolio", "{}"),
+]
+
+
+def _esc(value):
+    return html.escape(str(value or "").strip())
+
+
+def _url(value):
+    value = str(value or "").strip()
+    if value and not re.match(r"^[a-z]+://", value, re.I):
+        value = "https://" + value
+    return html.escape(value, quote=True)
+
+
+def _rich_text(text):
+    """Render free text as paragraphs, turning bullet lines into a list"""
+    paragraphs = []
+    bullets = []
+    for line in str(text or "").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] in "•-*":
+            bullets.append(f"<li>{_esc(line[1:])}</li>")
+        else:
+            if bullets:
+                paragraphs.append(f"<ul>{''.join(bullets)}</ul>")
+                bullets = []
+            paragraphs.append(f"<p>{_esc(line)}</p>")
+    if bullets:
+        paragraphs.append(f"<ul>{''.join(bullets)}</ul>")
+    return "".join(paragraphs)
+
+
+def _tags(text):
+    items = [item.strip() for item in re.split(r"[,\n]", str(text or "")) if item.strip()]
+    return "".join(f'<span class="tag">{_esc(item)}</span>' for item in items)
+
+
+def _social_links(social):
+    links = []
+    for key, icon, label, pattern in SOCIAL_LINKS:
+        value = str(social.get(key) or "").strip()
+        if not value:
+            continue
+        if "{}" in pattern and pattern != "{}":
+            value = value.lstrip("@").rstrip("/").split("/")[-1]
+            href = html.escape(pattern.format(value), quote=True)
+        else:
+            href = _url(value)
+        links.append(f'<a href="{href}" target="_blank" rel="noopener" aria-label="{label}"><i class="{icon}"></i></a>')
+    return "".join(links)
+
+
+def _build_sections(data):
+    """Return an ordered list of (section_id, nav label, html) for non-empty sections"""
+    personal = data.get("personal", {})
+    sections = []
+
+    if personal.get("bio"):
+        sections.append(("about", "About", _rich_text(personal["bio"])))
+
+    skills = data.get("skills", {})
+    skill_groups = [
+        (label, _tags(skills.get(key)))
+        for key, label in (("technical", "Technical"), ("tools", "Tools & Platforms"), ("soft", "Soft Skills"))
+    ]
+    skill_html = "".join(
+        f'<div class="skill-group reveal"><h3>{label}</h3><div class="tags">{tags}</div></div>'
+        for label, tags in skill_groups if tags
+    )
+    if skill_html:
+        sections.append(("skills", "Skills", skill_html))
+
+    projects = data.get("projects") or []
+    if projects:
+        cards = []
+        for p in projects:
+            link = f'<a href="{_url(p.get("url"))}" target="_blank" rel="noopener"><i class="fas fa-arrow-up-right-from-square"></i> View project</a>' if p.get("url") else ""
+            meta = " · ".join(_esc(v) for v in (p.get("date"), p.get("technologies")) if v)
+            cards.append(
+                f'<article class="card reveal"><h3>{_esc(p.get("name"))}</h3>'
+                f'<p class="meta">{meta}</p>{_rich_text(p.get("description"))}{link}</article>'
+            )
+        sections.append(("projects", "Projects", f'<div class="cards">{"".join(cards)}</div>'))
+
+    experience = data.get("experience") or []
+    if experience:
+        cards = []
+        for e in experience:
+            heading = _esc(e.get("title"))
+            if e.get("company"):
+                heading += f" @ {_esc(e.get('company'))}"
+            meta = " · ".join(_esc(v) for v in (e.get("duration"), e.get("location")) if v)
+            cards.append(
+                f'<article class="card reveal"><h3>{heading}</h3>'
+                f'<p class="meta">{meta}</p>{_rich_text(e.get("description"))}</article>'
+            )
+        sections.append(("experience", "Experience", f'<div class="cards">{"".join(cards)}</div>'))
+
+    education = data.get("education") or []
+    if education:
+        cards = []
+        for ed in education:
+            meta = " · ".join(_esc(v) for v in (ed.get("institution"), ed.get("year")) if v)
+            gpa = f"<p>GPA: {_esc(ed.get('gpa'))}</p>" if ed.get("gpa") else ""
+            cards.append(f'<article class="card reveal"><h3>{_esc(ed.get("degree"))}</h3><p class="meta">{meta}</p>{gpa}</article>')
+        sections.append(("education", "Education", f'<div class="cards">{"".join(cards)}</div>'))
+
+    if data.get("certifications"):
+        sections.append(("certifications", "Awards", f'<div class="card reveal">{_rich_text(data["certifications"])}</div>'))
+
+    options = data.get("options", {})
+    if options.get("testimonials"):
+        sections.append(("testimonials", "Testimonials", '<div class="cards"><blockquote class="card reveal"><p>"Add a quote from a colleague or client here."</p><p class="meta">— Name, Role</p></blockquote></div>'))
+    if options.get("blog"):
+        sections.append(("blog", "Blog", '<div class="cards"><article class="card reveal"><h3>Your first article</h3><p>Share what you are learning and building.</p></article></div>'))
+
+    contact_items = []
+    if personal.get("email"):
+        email = _esc(personal["email"])
+        contact_items.append(f'<li><i class="fas fa-envelope"></i><a href="mailto:{email}">{email}</a></li>')
+    if personal.get("phone"):
+        contact_items.append(f'<li><i class="fas fa-phone"></i>{_esc(personal["phone"])}</li>')
+    if personal.get("location"):
+        contact_items.append(f'<li><i class="fas fa-location-dot"></i>{_esc(personal["location"])}</li>')
+    contact_html = f'<ul class="contact-list">{"".join(contact_items)}</ul>' if contact_items else ""
+    if options.get("contact_form"):
+        action = f'mailto:{_esc(personal.get("email"))}' if personal.get("email") else "#"
+        contact_html += (
+            f'<form class="contact" action="{action}" method="post" enctype="text/plain">'
+            '<input type="text" name="name" placeholder="Your name" aria-label="Your name" required>'
+            '<input type="email" name="email" placeholder="Your email" aria-label="Your email" required>'
+            '<textarea name="message" rows="5" placeholder="Your message" aria-label="Your message" required></textarea>'
+            '<button class="btn" type="submit">Send Message</button></form>'
+        )
+    if contact_html:
+        sections.append(("contact", "Contact", contact_html))
+
+    return sections
+
+
+def render_portfolio_html(data):
+    """Render a complete portfolio document from portfolio_data without calling an LLM"""
+    personal = data.get("personal", {})
+    design = data.get("design", {})
+    options = data.get("options", {})
+
+    color_schemes = get_color_schemes()
+    font_pairs = get_font_pairs()
+    layout = design.get("layout") if design.get("layout") in LAYOUT_TEMPLATES else "Single Page Scroll"
+    scheme = design.get("color_scheme") or color_schemes.get(design.get("theme"), color_schemes["Modern Gradient"])
+    fonts = font_pairs.get(design.get("fonts"), font_pairs["Poppins & Roboto"])
+    animations = design.get("animations") or []
+
+    name = _esc(personal.get("name"))
+    title = _esc(personal.get("title"))
+    sections = _build_sections(data)
+
+    resume = '<a class="btn" href="#" download><i class="fas fa-download"></i> Download Resume</a>' if options.get("resume_button") else ""
+    location = f'<p class="location"><i class="fas fa-location-dot"></i> {_esc(personal.get("location"))}</p>' if personal.get("location") else ""
+    hero = HERO_TEMPLATE.substitute(
+        name=name, title=title, location=location, social=_social_links(data.get("social", {})), resume=resume
+    )
+
+    is_tabs = layout == "Multi-Section with Tabs"
+    section_html = []
+    for i, (section_id, label, content) in enumerate(sections):
+        extra_class = "tab-panel" + (" active" if i == 0 else "") if is_tabs else ""
+        section_html.append(SECTION_TEMPLATE.substitute(
+            section_id=section_id, extra_class=extra_class, heading=label, content=content
+        ))
+
+    nav = '<nav class="nav" aria-label="Main"><ul>' + "".join(
+        f'<li><a href="#{section_id}">{label}</a></li>' for section_id, label, _ in sections
+    ) + "</ul></nav>"
+    tabs = "".join(
+        f'<button type="button" role="tab" data-target="{section_id}" class="{"active" if i == 0 else ""}">{label}</button>'
+        for i, (section_id, label, _) in enumerate(sections)
+    )
+    footer = (
+        f'<footer><p>&copy; <span id="year"></span> {name}. All rights reserved.</p>'
+        f'<div class="social">{_social_links(data.get("social", {}))}</div></footer>'
+    )
+
+    body = LAYOUT_TEMPLATES[layout].substitute(
+        nav=nav, hero=hero, sections="\n".join(section_html), footer=footer, tabs=tabs
+    )
+
+    css = BASE_CSS.substitute(
+        primary=scheme["primary"], secondary=scheme["secondary"], accent=scheme["accent"],
+        heading_font=fonts["heading"], body_font=fonts["body"]
+    )
+    css += LAYOUT_CSS[layout]
+    if "Fade In" not in animations and "Slide In" not in animations:
+        css += ".reveal { opacity: 1; }\n"
+    for animation in animations:
+        css += ANIMATION_CSS.get(animation, "")
+
+    script = FOOTER_YEAR_SCRIPT
+    if "Fade In" in animations or "Slide In" in animations:
+        script += REVEAL_SCRIPT
+    if is_tabs:
+        script += TABS_SCRIPT
+
+    meta = ""
+    if options.get("seo"):
+        description = _esc(str(personal.get("bio") or "")[:160])
+        keywords = _esc(data.get("skills", {}).get("technical"))
+        meta = (
+            f'<meta name="description" content="{description}">\n'
+            f'<meta name="keywords" content="{keywords}">\n'
+            f'<meta name="author" content="{name}">\n'
+            f'<meta property="og:title" content="{name} | {title}">\n'
+            f'<meta property="og:description" content="{description}">'
+        )
+    analytics = "<!-- Google Analytics: replace G-XXXXXXXXXX with your measurement ID -->" if options.get("analytics") else ""
+
+    return DOCUMENT_TEMPLATE.substitute(
+        page_title=f"{name} | {title}" if title else name,
+        meta=meta,
+        font_url=html.escape(fonts["url"], quote=True),
+        css=css.strip(),
+        analytics=analytics,
+        body_class=layout.lower().replace(" ", "-"),
+        body=body,
+        script=script.strip(),
+    )
@@ -0,0 +1,162 @@
+"""Instant re-theming of generated portfolios
+
+Generated pages carry their theme in a small number of places: the :root
+CSS variables, gradients and hex/rgb colors taken from the color scheme,
+the Google Fonts link and the font-family declarations. Switching to
+another scheme or font pair rewrites those in place, in milliseconds and
+without another LLM call. When a page has nothing recognizable to rewrite
+(for example the model picked its own colors), the report says so and the
+caller falls back to a regular generation.
+"""
+import re
+
+from utils.templates import get_color_schemes, get_font_pairs
+
+HEX_COLOR_RE = re.compile(r"#[0-9a-fA-F]{6}\b|#[0-9a-fA-F]{3}\b")
+RGB_COLOR_RE = re.compile(r"rgba?\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*([,)])")
+STYLE_BLOCK_RE = re.compile(r"(<style[^>]*>)(.*?)(</style>)", re.S | re.I)
+STYLE_ATTR_RE = re.compile(r"(\sstyle\s*=\s*)([\"'])(.*?)\2", re.S | re.I)
+ROOT_BLOCK_RE = re.compile(r":root\s*\{[^}]*\}")
+GRADIENT_VAR_RE = re.compile(r"(--[\w-]*gradient[\w-]*\s*:\s*)([^;}]+)", re.I)
+GOOGLE_FONTS_URL_RE = re.compile(r"https?://fonts\.googleapis\.com/css2?\?[^\"')\s]+")
+FONT_DECLARATION_RE = re.compile(r"((?:font-family|--[\w-]*font[\w-]*)\s*:\s*)([^;}]+)", re.I)
+# Stands in for the new gradient until the color pass is done, so its stops are not mapped twice
+GRADIENT_PLACEHOLDER = "\x00gradient\x00"
+
+# Fields that may change without touching the generated content
+THEME_FIELDS = ("theme", "color_scheme", "fonts")
+
+
+def _hex_to_rgb(color):
+    color = color.lstrip("#")
+    if len(color) == 3:
+        color = "".join(c * 2 for c in color)
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def color_mapping(old_scheme, new_scheme):
+    """Map each old scheme color (lowercase hex) to the new one in the same role"""
+    old_stops = HEX_COLOR_RE.findall(old_scheme["primary"])
+    new_stops = HEX_COLOR_RE.findall(new_scheme["primary"])
+    mapping = {}
+    for index, color in enumerate(old_stops):
+        # Gradients with a different number of stops map by relative position
+        position = round(index * (len(new_stops) - 1) / max(len(old_stops) - 1, 1))
+        mapping[color.lower()] = new_stops[position]
+    mapping[old_scheme["secondary"].lower()] = new_scheme["secondary"]
+    mapping[old_scheme["accent"].lower()] = new_scheme["accent"]
+    return {old: new for old, new in mapping.items() if old != new.lower()}
+
+
+def _rewrite_css(css, mapping, rgb_mapping, old_scheme, new_scheme, font_names, counts):
+    def replace_gradient_var(match):
+        if match.group(2).strip() == GRADIENT_PLACEHOLDER:
+            return match.group(0)
+        counts["colors"] += 1
+        return match.group(1) + GRADIENT_PLACEHOLDER
+
+    if old_scheme["primary"] != new_scheme["primary"]:
+        counts["colors"] += css.count(old_scheme["primary"])
+        css = css.replace(old_scheme["primary"], GRADIENT_PLACEHOLDER)
+        # A gradient variable holds the page's main gradient even if the model picked its own stops
+        for root in ROOT_BLOCK_RE.findall(css):
+            css = css.replace(root, GRADIENT_VAR_RE.sub(replace_gradient_var, root))
+
+    def replace_hex(match):
+        color = match.group(0)
+        full = "#" + "".join(c * 2 for c in color[1:]) if len(color) == 4 else color
+        new = mapping.get(full.lower())
+        if new is None:
+            return color
+        counts["colors"] += 1
+        return new
+
+    def replace_rgb(match):
+        new = rgb_mapping.get(tuple(int(part) for part in match.group(1, 2, 3)))
+        if new is None:
+            return match.group(0)
+        counts["colors"] += 1
+        prefix = match.group(0)[:match.group(0).index("(") + 1]
+        return f"{prefix}{new[0]}, {new[1]}, {new[2]}{match.group(4)}"
+
+    css = HEX_COLOR_RE.sub(replace_hex, css)
+    css = RGB_COLOR_RE.sub(replace_rgb, css).replace(GRADIENT_PLACEHOLDER, new_scheme["primary"])
+
+    if font_names:
+        def replace_fonts(match):
+            value = match.group(2)
+            for old, new in font_names.items():
+                value, replaced = re.subn(rf"(?<![\w-]){re.escape(old)}(?![\w-])", new, value)
+                counts["font_families"] += replaced
+            return match.group(1) + value
+        css = FONT_DECLARATION_RE.sub(replace_fonts, css)
+    return css
+
+
+def retheme_html(html_content, old_design, new_theme=None, new_fonts=None):
+    """Rewrite html_content from old_design's scheme and fonts to new_theme and new_fonts
+
+    old_design is the design dict the page was generated with. Returns
+    (html, report); report["themable"] is False when a requested change found
+    nothing to rewrite, and the caller should regenerate instead.
+    """
+    schemes = get_color_schemes()
+    font_pairs = get_font_pairs()
+    old_theme = old_design.get("theme")
+    old_fonts = old_design.get("fonts")
+    new_theme = new_theme or old_theme
+    new_fonts = new_fonts or old_fonts
+    counts = {"colors": 0, "font_links": 0, "font_families": 0}
+    change_theme = new_theme != old_theme
+    change_fonts = new_fonts != old_fonts
+    report = {"theme": new_theme, "fonts": new_fonts, "changes": counts, "themable": True}
+    if not change_theme and not change_fonts:
+        return html_content, report
+    if (change_theme and (old_theme not in schemes or new_theme not in schemes)) or \
+            (change_fonts and (old_fonts not in font_pairs or new_fonts not in font_pairs)):
+        report["themable"] = False
+        return html_content, report
+
+    old_scheme = new_scheme = schemes.get(old_theme) or {"primary": "", "secondary": "", "accent": ""}
+    mapping, rgb_mapping = {}, {}
+    if change_theme:
+        new_scheme = schemes[new_theme]
+        mapping = color_mapping(old_scheme, new_scheme)
+        rgb_mapping = {_hex_to_rgb(old): _hex_to_rgb(new) for old, new in mapping.items()}
+
+    font_names = {}
+    if change_fonts:
+        old_pair, new_pair = font_pairs[old_fonts], font_pairs[new_fonts]
+        font_names = {old_pair["heading"]: new_pair["heading"], old_pair["body"]: new_pair["body"]}
+        font_names = {old: new for old, new in font_names.items() if old != new}
+
+        def replace_font_url(match):
+            counts["font_links"] += 1
+            url = new_pair["url"]
+            return url.replace("&", "&amp;") if "&amp;" in match.group(0) else url
+        html_content = GOOGLE_FONTS_URL_RE.sub(replace_font_url, html_content)
+
+    def rewrite(css):
+        return _rewrite_css(css, mapping, rgb_mapping, old_scheme, new_scheme, font_names, counts)
+
+    html_content = STYLE_BLOCK_RE.sub(lambda m: m.group(1) + rewrite(m.group(2)) + m.group(3), html_content)
+    html_content = STYLE_ATTR_RE.sub(lambda m: m.group(1) + m.group(2) + rewrite(m.group(3)) + m.group(2), html_content)
+
+    # A new font link alone would load fonts that nothing uses, so font-family names must have matched
+    report["themable"] = (not change_theme or counts["colors"] > 0) and (not change_fonts or counts["font_families"] > 0)
+    return html_content, report
+
+
+def is_theme_only_change(old_data, new_data):
+    """True if new_data differs from old_data, and only in theme, color scheme or fonts
+
+    Identical data is not a theme change; it is a plain cache hit.
+    """
+    if not old_data or old_data == new_data:
+        return False
+
+    def without_theme(data):
+        design = {k: v for k, v in data.get("design", {}).items() if k not in THEME_FIELDS}
+        return dict(data, design=design)
+
+    return without_theme(old_data) == without_theme(new_data)
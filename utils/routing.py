@@ -0,0 +1,164 @@
+"""Input-size-aware model routing
+
+With the model set to "auto", each request is sized from portfolio_data
+(estimated prompt and output tokens plus how many entries it lists) and
+sent to the first tier whose rule it fits. Small profiles go to the lite
+tier, rich ones to the strong tier. Every decision is kept with its
+observed latency so the rules can be tuned against real numbers.
+
+Rules can be overridden with PORTFOLIO_ROUTING_RULES, either inline JSON or
+a path to a JSON file holding a list like ROUTING_RULES.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+from utils.prompts import FEATURE_LABELS, build_prompt
+
+AUTO_MODEL = "auto"
+
+# Models behind each tier, per provider ("OpenAI" matches any OpenAI label)
+MODEL_TIERS = {
+    "OpenAI": {"lite": "gpt-4o-mini", "fast": "gpt-4o-mini", "strong": "gpt-4o"},
+    "Gemini": {"lite": "gemini-2.5-flash-lite", "fast": "gemini-2.5-flash", "strong": "gemini-2.5-pro"},
+}
+
+# First matching rule wins; a limit that is left out is not checked
+ROUTING_RULES = [
+    {"tier": "lite", "max_input_tokens": 700, "max_output_tokens": 6000, "max_entries": 4},
+    {"tier": "fast", "max_input_tokens": 1800, "max_output_tokens": 10000, "max_entries": 10},
+    {"tier": "strong"},
+]
+
+# Rough output cost of each part of a portfolio, in tokens
+BASE_OUTPUT_TOKENS = 3500
+OUTPUT_TOKENS_PER_ENTRY = {"projects": 450, "experience": 350, "education": 200}
+OUTPUT_TOKENS_PER_FEATURE = 400
+OUTPUT_TOKENS_PER_ANIMATION = 150
+
+MAX_LOG_ENTRIES = 200
+ROUTING_LOG_PATH = os.environ.get("PORTFOLIO_ROUTING_LOG", "")
+
+logger = logging.getLogger(__name__)
+
+
+def load_routing_rules():
+    """Return the configured rules, falling back to ROUTING_RULES"""
+    configured = os.environ.get("PORTFOLIO_ROUTING_RULES", "").strip()
+    if not configured:
+        return ROUTING_RULES
+    try:
+        if configured.startswith("["):
+            return json.loads(configured)
+        with open(configured, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring invalid PORTFOLIO_ROUTING_RULES: %s", e)
+        return ROUTING_RULES
+
+
+def model_tiers(provider):
+    return MODEL_TIERS["OpenAI"] if "OpenAI" in provider else MODEL_TIERS["Gemini"]
+
+
+def estimate_output_tokens(data):
+    """Estimate the size of the generated document from what it has to show"""
+    tokens = BASE_OUTPUT_TOKENS
+    for key, per_entry in OUTPUT_TOKENS_PER_ENTRY.items():
+        tokens += per_entry * len(data.get(key) or [])
+    options = data.get("options", {})
+    tokens += OUTPUT_TOKENS_PER_FEATURE * sum(1 for key in FEATURE_LABELS if options.get(key))
+    tokens += OUTPUT_TOKENS_PER_ANIMATION * len(data.get("design", {}).get("animations") or [])
+    return tokens
+
+
+def profile_size(data):
+    """Return the measurements routing rules are checked against"""
+    _, _, report = build_prompt(data)
+    return {
+        "input_tokens": report["payload_tokens"],
+        "output_tokens": estimate_output_tokens(data),
+        "entries": sum(len(data.get(key) or []) for key in OUTPUT_TOKENS_PER_ENTRY),
+    }
+
+
+def _fits(rule, size):
+    return all(
+        size[measure] <= rule[f"max_{measure}"]
+        for measure in ("input_tokens", "output_tokens", "entries")
+        if f"max_{measure}" in rule
+    )
+
+
+def route_model(data, provider, rules=None):
+    """Pick a model for data; returns a decision dict with the model, tier and sizes"""
+    size = profile_size(data)
+    tiers = model_tiers(provider)
+    rules = rules or load_routing_rules()
+    for index, rule in enumerate(rules):
+        if _fits(rule, size) and rule.get("tier") in tiers:
+            break
+    else:
+        index, rule = None, {"tier": "strong"}
+    return dict(size, provider=provider, tier=rule["tier"], model=tiers[rule["tier"]], rule=index)
+
+
+def resolve_model(data, provider, model):
+    """Return (model, decision); decision is None unless model is "auto" """
+    if model != AUTO_MODEL:
+        return model, None
+    decision = route_model(data, provider)
+    return decision["model"], decision
+
+
+class RoutingLog:
+    """Bounded, thread-safe record of routing decisions and how long they took"""
+
+    def __init__(self, max_entries=MAX_LOG_ENTRIES, path=ROUTING_LOG_PATH):
+        self.path = path
+        self._entries = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def record(self, decision, seconds, status="ok"):
+        entry = dict(decision, seconds=round(seconds, 3), status=status, at=time.time())
+        logger.info(
+            "routed %s to %s (%s tier, ~%d in / ~%d out tokens): %.2fs %s",
+            entry["provider"], entry["model"], entry["tier"],
+            entry["input_tokens"], entry["output_tokens"], seconds, status
+        )
+        with self._lock:
+            self._entries.append(entry)
+            if self.path:
+                try:
+                    with open(self.path, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(entry) + "\n")
+                except OSError:
+                    pass
+
+    def entries(self):
+        with self._lock:
+            return list(self._entries)
+
+    def get_stats(self):
+        """Return {tier: {"requests", "errors", "mean_seconds"}} over the kept entries"""
+        stats = {}
+        for entry in self.entries():
+            tier = stats.setdefault(entry["tier"], {"requests": 0, "errors": 0, "total_seconds": 0.0})
+            tier["requests"] += 1
+            tier["total_seconds"] += entry["seconds"]
+            if entry["status"] != "ok":
+                tier["errors"] += 1
+        for tier in stats.values():
+            tier["mean_seconds"] = round(tier.pop("total_seconds") / tier["requests"], 3)
+        return stats
+
+
+_routing_log = RoutingLog()
+
+
+def get_routing_log():
+    """Return the process-wide routing log"""
+    return _routing_log
@@ -0,0 +1,314 @@
+"""Incremental cleanup of model output
+
+Models wrap the document in markdown fences, put a sentence of preamble in
+front of it and sometimes a note after it. StreamingSanitizer removes all of
+that one chunk at a time, so output can be written to disk or a client as it
+arrives. It only ever holds back a short tail (a possible fence line, a
+partial "</html>" or a partial tag) plus the stack of open elements, never
+the whole document.
+"""
+import re
+
+# Where a document is allowed to start
+DOCUMENT_START_RE = re.compile(r"<!doctype|<html[\s>]", re.I)
+DOCUMENT_END = "</html>"
+FENCE_LINE_RE = re.compile(r"^[ \t]*```[\w+-]*[ \t]*$")
+FENCE_PREFIX_RE = re.compile(r"[ \t]*`{1,3}[\w+-]{0,20}[ \t]*")
+
+# Preamble kept while looking for the document start; past this the output is
+# assumed to have no DOCTYPE and is emitted from its first tag
+MAX_PREAMBLE_CHARS = 64 * 1024
+# Longest tail held back for fence/end detection before it is emitted anyway
+MAX_HOLD_CHARS = 4096
+# A single tag (e.g. with an inline data: URI) longer than this is skipped
+MAX_TAG_CHARS = 256 * 1024
+MAX_DEPTH = 1024
+
+VOID_ELEMENTS = frozenset((
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+    "param", "source", "track", "wbr",
+))
+RAW_TEXT_ELEMENTS = frozenset(("script", "style", "textarea", "title"))
+# Elements whose text is shown as written, so a ``` line inside them is content
+PREFORMATTED_ELEMENTS = frozenset(("pre", "code"))
+
+TAG_RE = re.compile(
+    r"<!--.*?-->|<![^>]*>|<\?[^>]*>|<(/?)([a-zA-Z][\w:-]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>",
+    re.S
+)
+
+
+class TagTracker:
+    """Keeps the stack of open elements for HTML fed to it in pieces"""
+
+    def __init__(self):
+        self.stack = []
+        self.stray_closes = 0
+        self.overflow = 0
+        self._tail = ""
+        self._raw = None
+
+    def feed(self, text):
+        buffer = self._tail + text
+        pos = 0
+        while True:
+            if self._raw:
+                end = re.compile(rf"</{self._raw}\s*>", re.I).search(buffer, pos)
+                if end is None:
+                    # Keep just enough to spot a closing tag split across chunks
+                    pos = max(pos, len(buffer) - len(self._raw) - 16)
+                    break
+                self._close(self._raw)
+                self._raw = None
+                pos = end.end()
+                continue
+
+            pos = buffer.find("<", pos)
+            if pos == -1:
+                pos = len(buffer)
+                break
+            if pos + 1 >= len(buffer):
+                break
+            if buffer[pos + 1] not in "/!?" and not buffer[pos + 1].isalpha():
+                pos += 1
+                continue
+            match = TAG_RE.match(buffer, pos)
+            if match is None:
+                if len(buffer) - pos > MAX_TAG_CHARS:
+                    pos += 1
+                    continue
+                break
+            pos = match.end()
+            name = match.group(2)
+            if name is None:
+                continue
+            name = name.lower()
+            if match.group(1):
+                self._close(name)
+            elif name not in VOID_ELEMENTS and not match.group(3).rstrip().endswith("/"):
+                self._open(name)
+                if name in RAW_TEXT_ELEMENTS:
+                    self._raw = name
+        self._tail = buffer[pos:]
+
+    def copy(self):
+        """Return an independent tracker in the same state, to look ahead with"""
+        tracker = TagTracker()
+        tracker.stack = list(self.stack)
+        tracker.stray_closes = self.stray_closes
+        tracker.overflow = self.overflow
+        tracker._tail = self._tail
+        tracker._raw = self._raw
+        return tracker
+
+    @property
+    def in_raw_text(self):
+        """True inside a script, style, textarea or title, where tags are only text"""
+        return self._raw is not None
+
+    @property
+    def in_tag(self):
+        """True if the text so far ends inside an unfinished tag or comment"""
+        return self._tail.startswith("<") and not self._raw
+
+    def _open(self, name):
+        if len(self.stack) >= MAX_DEPTH:
+            self.overflow += 1
+            return
+        self.stack.append(name)
+
+    def _close(self, name):
+        if name not in self.stack:
+            self.stray_closes += 1
+            return
+        # Closing an outer element implicitly closes anything left open inside it
+        while self.stack.pop() != name:
+            pass
+
+
+class StreamingSanitizer:
+    """Turn raw model output into clean HTML one chunk at a time
+
+    feed(chunk) returns the clean text that can be emitted so far and
+    close() returns whatever was held back. Everything before the document
+    start and after "</html>" is dropped, as are markdown fence lines; inside
+    a script, style or <pre> both are kept as content. If no document start
+    ever arrives (e.g. a bare <section>), close() returns the fence-stripped
+    preamble instead, like the old whole-string cleanup.
+    """
+
+    def __init__(self):
+        self.tags = TagTracker()
+        self.stats = {"input_chars": 0, "output_chars": 0, "dropped_chars": 0, "fence_lines": 0}
+        self._state = "preamble"
+        self._buffer = ""
+        self._at_line_start = True
+
+    @property
+    def started(self):
+        """True once the document start has been seen"""
+        return self._state != "preamble"
+
+    @property
+    def complete(self):
+        """True once "</html>" has been seen"""
+        return self._state == "done"
+
+    @property
+    def open_tags(self):
+        return list(self.tags.stack)
+
+    @property
+    def pending(self):
+        """Text accepted by feed() but still held back"""
+        return self._buffer if self._state == "body" else ""
+
+    def feed(self, chunk):
+        """Consume a raw chunk and return the clean text ready to emit"""
+        self.stats["input_chars"] += len(chunk)
+        if self._state == "done":
+            self.stats["dropped_chars"] += len(chunk)
+            return ""
+        self._buffer += chunk
+        if self._state == "preamble" and not self._find_start():
+            return ""
+        return self._drain(final=False)
+
+    def close(self, repair=False):
+        """Flush the held-back tail; with repair=True also close any open elements"""
+        if self._state == "preamble":
+            text = "\n".join(
+                line for line in self._buffer.splitlines() if not FENCE_LINE_RE.match(line)
+            ).strip()
+            self._buffer = ""
+            self._state = "body"
+            self._at_line_start = True
+            text = self._emit(text)
+        elif self._state == "body":
+            text = self._drain(final=True)
+        else:
+            text = ""
+        if repair and self._state != "done":
+            text += self.closing_tags()
+        return text
+
+    def closing_tags(self):
+        """Return the markup that would close every element still open"""
+        prefix = ""
+        open_tags = list(self.tags.stack)
+        if self.tags.in_tag:
+            tail = self.tags._tail
+            prefix = "-->" if tail.startswith("<!--") else ">"
+            partial = re.match(r"<([a-zA-Z][\w:-]*)", tail)
+            if partial and partial.group(1).lower() not in VOID_ELEMENTS:
+                open_tags.append(partial.group(1).lower())
+        return prefix + "".join(f"</{name}>" for name in reversed(open_tags))
+
+    def _find_start(self):
+        match = DOCUMENT_START_RE.search(self._buffer)
+        if match is None:
+            if len(self._buffer) <= MAX_PREAMBLE_CHARS:
+                return False
+            # No DOCTYPE in sight; treat the first tag as the start of the document
+            start = self._buffer.find("<")
+            start = start if start != -1 else len(self._buffer) - len("<!doctype")
+        else:
+            start = match.start()
+        self.stats["dropped_chars"] += start
+        self._buffer = self._buffer[start:]
+        self._state = "body"
+        self._at_line_start = False
+        return True
+
+    def _drain(self, final):
+        buffer = self._buffer
+        end = self._find_end(buffer)
+        if end != -1:
+            end += len(DOCUMENT_END)
+            self.stats["dropped_chars"] += len(buffer) - end
+            buffer = buffer[:end]
+            self._state = "done"
+            final = True
+
+        hold = 0 if final else self._hold_length(buffer)
+        ready, self._buffer = buffer[:len(buffer) - hold], buffer[len(buffer) - hold:]
+        ready = self._drop_fence_lines(ready, final)
+        if final:
+            ready = ready.rstrip()
+        return self._emit(ready)
+
+    def _find_end(self, buffer):
+        """Index of the first "</html>" that is markup, not script text or an attribute"""
+        lowered = buffer.lower()
+        end = lowered.find(DOCUMENT_END)
+        if end == -1:
+            return -1
+        probe = self.tags.copy()
+        pos = 0
+        while end != -1:
+            probe.feed(buffer[pos:end])
+            if not probe.in_raw_text and not probe.in_tag:
+                return end
+            pos = end
+            end = lowered.find(DOCUMENT_END, end + 1)
+        return -1
+
+    def _hold_length(self, buffer):
+        """Length of the tail that might still turn into a fence, "</html>" or trailing space"""
+        # Trailing whitespace is held anyway, so look at the last line with text on it
+        stripped = buffer.rstrip()
+        line_start = stripped.rfind("\n") + 1
+        hold = 0
+        if (line_start or self._at_line_start) and FENCE_PREFIX_RE.fullmatch(stripped, line_start):
+            # Along with the newline before it, which goes if the line turns out to be a fence
+            hold = len(buffer) - max(line_start - 1, 0)
+        lowered = buffer[-len(DOCUMENT_END) + 1:].lower()
+        for size in range(min(len(lowered), len(DOCUMENT_END) - 1), 0, -1):
+            if DOCUMENT_END.startswith(lowered[-size:]):
+                hold = max(hold, size)
+                break
+        hold = max(hold, len(buffer) - len(buffer.rstrip()))
+        return hold if hold <= MAX_HOLD_CHARS else 0
+
+    def _drop_fence_lines(self, text, final):
+        if "```" not in text:
+            return text
+        lines = text.split("\n")
+        kept = []
+        # Text is only fed to self.tags once emitted, so follow along on a copy
+        probe = self.tags.copy()
+        for index, line in enumerate(lines):
+            starts_line = index > 0 or self._at_line_start
+            ends_line = index < len(lines) - 1 or final
+            verbatim = probe.in_raw_text or not PREFORMATTED_ELEMENTS.isdisjoint(probe.stack)
+            if starts_line and ends_line and not verbatim and FENCE_LINE_RE.match(line):
+                self.stats["fence_lines"] += 1
+                continue
+            kept.append(line)
+            probe.feed(line + "\n")
+        return "\n".join(kept)
+
+    def _emit(self, text):
+        if text:
+            self._at_line_start = text.endswith("\n")
+            self.stats["output_chars"] += len(text)
+            self.tags.feed(text)
+        return text
+
+
+def sanitize_stream(chunks, repair=False):
+    """Yield clean HTML from an iterable of raw model output chunks"""
+    sanitizer = StreamingSanitizer()
+    for chunk in chunks:
+        text = sanitizer.feed(chunk)
+        if text:
+            yield text
+    text = sanitizer.close(repair=repair)
+    if text:
+        yield text
+
+
+def sanitize_html(text):
+    """Clean a complete model response in one call"""
+    sanitizer = StreamingSanitizer()
+    return sanitizer.feed(text) + sanitizer.close()
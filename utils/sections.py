@@ -0,0 +1,308 @@
+"""Section-parallel portfolio generation
+
+A shared shell (head, CSS, nav, footer, script) is generated first. Then each
+content section is requested concurrently and stitched into the shell's
+placeholders, so wall-clock time approaches that of the slowest section
+rather than one long monolithic completion.
+
+Each section is fingerprinted over the slice of portfolio_data it renders,
+so later edits only regenerate the sections whose inputs changed.
+"""
+import contextvars
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from utils.ai_generator import clean_html_response, generation_cache_key, request_completion
+from utils.cache import get_generation_cache, normalize_portfolio_data
+from utils.prompts import build_payload, build_section_prompt, build_skeleton_prompt
+from utils.routing import get_routing_log, resolve_model
+
+SKELETON_MAX_TOKENS = 6000
+SECTION_MAX_TOKENS = 4000
+
+PLACEHOLDER_RE = re.compile(r"<!--\s*SECTION:([a-z_]+)\s*-->")
+SECTION_MARKER_RE = re.compile(r"<!-- section:([a-z_]+) -->.*?<!-- /section:\1 -->", re.S)
+CLASS_SELECTOR_RE = re.compile(r"\.(-?[_a-zA-Z][_a-zA-Z0-9-]*)")
+STYLE_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.S | re.I)
+
+
+def _hero_fields(payload):
+    personal = payload.get("personal", {})
+    return {
+        "personal": {k: v for k, v in personal.items() if k in ("name", "title", "bio", "location")},
+        "social": payload.get("social", {}),
+        "features": [f for f in payload.get("features", []) if f == "resume download button"],
+    }
+
+
+def _contact_fields(payload):
+    personal = payload.get("personal", {})
+    return {
+        "personal": {k: v for k, v in personal.items() if k in ("name", "email", "phone", "location")},
+        "social": payload.get("social", {}),
+        "features": [f for f in payload.get("features", []) if f == "contact form"],
+    }
+
+
+# Ordered section ids and the slice of the compact payload each one needs
+SECTIONS = [
+    ("hero", _hero_fields),
+    ("skills", lambda p: {"skills": p.get("skills", {}), "certifications": p.get("certifications", "")}),
+    ("projects", lambda p: {"projects": p.get("projects", [])}),
+    ("experience", lambda p: {"experience": p.get("experience", [])}),
+    ("education", lambda p: {"education": p.get("education", [])}),
+    ("contact", _contact_fields),
+]
+
+
+# Fingerprinted groups of portfolio_data and the sections each one feeds.
+# A change to "design" restyles the whole shell, so it forces a full rebuild.
+FINGERPRINT_GROUPS = {
+    "personal": (("personal", "social", "options"), ("hero", "contact")),
+    "skills": (("skills", "certifications"), ("skills",)),
+    "projects": (("projects",), ("projects",)),
+    "experience": (("experience",), ("experience",)),
+    "education": (("education",), ("education",)),
+    "design": (("design",), ()),
+}
+
+
+def _has_content(section_id, fields):
+    if section_id in ("hero", "contact"):
+        return True
+    return any(fields.values())
+
+
+def split_sections(data):
+    """Return [(section_id, section_payload)] for sections with data to show"""
+    payload = build_payload(data)
+    split = []
+    for section_id, extract in SECTIONS:
+        fields = extract(payload)
+        if _has_content(section_id, fields):
+            split.append((section_id, fields))
+    return split
+
+
+def fingerprint_sections(data):
+    """Return {group: digest} over the parts of portfolio_data each section group uses"""
+    fingerprints = {}
+    for group, (keys, _) in FINGERPRINT_GROUPS.items():
+        blob = json.dumps(
+            normalize_portfolio_data({key: data.get(key) for key in keys}),
+            sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+        )
+        fingerprints[group] = hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+    return fingerprints
+
+
+def dirty_sections(old_fingerprints, new_fingerprints):
+    """Return the section ids whose inputs changed, or None if a full rebuild is needed"""
+    if not old_fingerprints or old_fingerprints.get("design") != new_fingerprints.get("design"):
+        return None
+    dirty = []
+    for group, (_, section_ids) in FINGERPRINT_GROUPS.items():
+        if old_fingerprints.get(group) != new_fingerprints.get(group):
+            dirty.extend(sid for sid in section_ids if sid not in dirty)
+    return dirty
+
+
+def extract_class_names(html_content):
+    """Return the sorted class names defined in the document's <style> blocks"""
+    names = set()
+    for css in STYLE_RE.findall(html_content):
+        css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+        for selector_block in re.findall(r"([^{}]+)\{", css):
+            names.update(CLASS_SELECTOR_RE.findall(selector_block))
+    return sorted(n for n in names if not re.fullmatch(r"\d.*", n))
+
+
+def clean_section_html(text, section_id):
+    """Strip fences and anything outside the outermost <section> element"""
+    text = clean_html_response(text)
+    start = text.find("<section")
+    end = text.rfind("</section>")
+    if start != -1 and end != -1:
+        text = text[start:end + len("</section>")]
+    else:
+        text = f'<section id="{section_id}">{text}</section>'
+    return text
+
+
+def wrap_section(section_id, section_html):
+    """Surround a section with markers so it can be found and replaced later"""
+    return f"<!-- section:{section_id} -->\n{section_html}\n<!-- /section:{section_id} -->"
+
+
+def stitch_sections(skeleton_html, sections):
+    """Insert {section_id: html} into the skeleton's placeholders
+
+    Sections without a placeholder are appended before </main> (or </body>),
+    and leftover placeholders are removed, so the result is always one
+    valid document.
+    """
+    remaining = dict(sections)
+
+    def replace(match):
+        section_id = match.group(1)
+        if section_id in remaining:
+            return wrap_section(section_id, remaining.pop(section_id))
+        return ""
+
+    html_content = PLACEHOLDER_RE.sub(replace, skeleton_html)
+    if remaining:
+        ordered = [wrap_section(sid, remaining[sid]) for sid, _ in SECTIONS if sid in remaining]
+        extra = "\n".join(ordered)
+        for anchor in ("</main>", "<footer", "</body>"):
+            index = html_content.find(anchor)
+            if index != -1:
+                html_content = html_content[:index] + extra + "\n" + html_content[index:]
+                break
+        else:
+            html_content += extra
+    if "</html>" not in html_content:
+        html_content += "\n</html>"
+    return html_content
+
+
+def splice_sections(html_content, sections, removed=()):
+    """Replace marked sections in an existing document with new HTML
+
+    Sections with no marker yet are inserted like in stitch_sections, and
+    ids in removed are dropped from the document.
+    """
+    remaining = dict(sections)
+
+    def replace(match):
+        section_id = match.group(1)
+        if section_id in removed:
+            return ""
+        if section_id in remaining:
+            return wrap_section(section_id, remaining.pop(section_id))
+        return match.group(0)
+
+    html_content = SECTION_MARKER_RE.sub(replace, html_content)
+    return stitch_sections(html_content, remaining) if remaining else html_content
+
+
+def generate_section(section_id, section_payload, class_names, api_key, provider, model):
+    """Generate the HTML for a single section"""
+    system_prompt, prompt = build_section_prompt(section_id, section_payload, class_names)
+    text = request_completion(system_prompt, prompt, api_key, provider, model, max_tokens=SECTION_MAX_TOKENS)
+    return clean_section_html(text, section_id)
+
+
+def generate_portfolio_html_parallel(data, api_key, provider, model, use_cache=True, refresh_cache=False,
+                                     on_progress=None):
+    """Generate a portfolio as a shared shell plus concurrently generated sections
+
+    on_progress(stage, done, total) is called from the calling thread after the
+    shell and after each section completes, so it is safe to update Streamlit
+    elements from it. model="auto" picks a model from the size of data.
+    """
+    model, route = resolve_model(data, provider, model)
+    cache = get_generation_cache() if use_cache else None
+    cache_key = generation_cache_key(data, provider, model, mode="sections")
+    if cache and not refresh_cache:
+        cached_html = cache.get(cache_key)
+        if cached_html is not None:
+            return cached_html
+
+    split = split_sections(data)
+    total = len(split) + 1
+    started = time.monotonic()
+
+    try:
+        system_prompt, prompt = build_skeleton_prompt(data, [section_id for section_id, _ in split])
+        skeleton_html = clean_html_response(
+            request_completion(system_prompt, prompt, api_key, provider, model, max_tokens=SKELETON_MAX_TOKENS)
+        )
+        if on_progress:
+            on_progress("shell", 1, total)
+
+        class_names = extract_class_names(skeleton_html)
+        sections = {}
+        with ThreadPoolExecutor(max_workers=len(split) or 1) as executor:
+            futures = {
+                # Each section runs in a copy of this context, so the caller's cancel scope applies to it
+                executor.submit(
+                    contextvars.copy_context().run,
+                    generate_section, section_id, fields, class_names, api_key, provider, model
+                ): section_id
+                for section_id, fields in split
+            }
+            for future in as_completed(futures):
+                section_id = futures[future]
+                sections[section_id] = future.result()
+                if on_progress:
+                    on_progress(section_id, len(sections) + 1, total)
+    except Exception as e:
+        if route:
+            get_routing_log().record(route, time.monotonic() - started, "error")
+        raise Exception(f"Error generating portfolio: {str(e)}")
+
+    if route:
+        get_routing_log().record(route, time.monotonic() - started)
+    html_content = stitch_sections(skeleton_html, sections)
+    if cache:
+        cache.set(cache_key, html_content)
+    return html_content
+
+
+def regenerate_changed_sections(html_content, old_fingerprints, data, api_key, provider, model,
+                                use_cache=True, on_progress=None):
+    """Re-request only the sections whose inputs changed and splice them into html_content
+
+    Falls back to a full parallel generation when there is nothing to splice
+    into (no section markers, no previous fingerprints, or a design change).
+    Returns (html, fingerprints, regenerated_section_ids).
+    """
+    new_fingerprints = fingerprint_sections(data)
+    dirty = dirty_sections(old_fingerprints, new_fingerprints)
+    if dirty is None or not html_content or not SECTION_MARKER_RE.search(html_content):
+        split = split_sections(data)
+        html_content = generate_portfolio_html_parallel(
+            data, api_key, provider, model, use_cache=use_cache, on_progress=on_progress
+        )
+        return html_content, new_fingerprints, [section_id for section_id, _ in split]
+    if not dirty:
+        return html_content, new_fingerprints, []
+
+    model, route = resolve_model(data, provider, model)
+
+    present = dict(split_sections(data))
+    to_generate = [(sid, present[sid]) for sid in dirty if sid in present]
+    removed = [sid for sid in dirty if sid not in present]
+    class_names = extract_class_names(html_content)
+    started = time.monotonic()
+
+    try:
+        sections = {}
+        with ThreadPoolExecutor(max_workers=len(to_generate) or 1) as executor:
+            futures = {
+                # Each section runs in a copy of this context, so the caller's cancel scope applies to it
+                executor.submit(
+                    contextvars.copy_context().run,
+                    generate_section, section_id, fields, class_names, api_key, provider, model
+                ): section_id
+                for section_id, fields in to_generate
+            }
+            for future in as_completed(futures):
+                section_id = futures[future]
+                sections[section_id] = future.result()
+                if on_progress:
+                    on_progress(section_id, len(sections), len(to_generate))
+    except Exception as e:
+        if route:
+            get_routing_log().record(route, time.monotonic() - started, "error")
+        raise Exception(f"Error generating portfolio: {str(e)}")
+
+    if route:
+        get_routing_log().record(route, time.monotonic() - started)
+    html_content = splice_sections(html_content, sections, removed)
+    if use_cache:
+        get_generation_cache().set(generation_cache_key(data, provider, model, mode="sections"), html_content)
+    return html_content, new_fingerprints, dirty
@@ -0,0 +1,243 @@
+"""Font Awesome and Google Fonts trimming
+
+Generated pages load the whole Font Awesome stylesheet and icon font to show
+a handful of icons, and every weight of both Google Fonts in the pair. This
+post-processor:
+
+- replaces the Font Awesome stylesheet with an inline SVG sprite holding only
+  the icons the page uses, taken from the bundled set in utils.icon_set. The
+  stylesheet is kept when the page uses an icon the set does not have, sets
+  icons from CSS (content: "\\f09b") or swaps icon classes from a script.
+  On a page trimmed before, icons added since (e.g. by a spliced section)
+  are added to its sprite, or the stylesheet is put back if they cannot be.
+- rewrites Google Fonts URLs to request only the weights the page's CSS
+  uses, with display=swap, and adds preconnect hints for both font origins.
+
+Anything it cannot reason about is left as it is.
+"""
+import re
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+from utils.icon_set import ICONS
+
+FA_STYLESHEET_RE = re.compile(
+    r"""<link\b[^>]*href\s*=\s*["'][^"']*(?:font-?awesome|fontawesome)[^"']*["'][^>]*>\s*""", re.I
+)
+FA_SCRIPT_RE = re.compile(r"""<script\b[^>]*src\s*=\s*["'][^"']*fontawesome[^"']*["'][^>]*>\s*</script>\s*""", re.I)
+ICON_ELEMENT_RE = re.compile(
+    r"""<(i|span)\b([^>]*\bclass\s*=\s*(["'])([^"']*)\3[^>]*)>\s*</\1>""", re.I
+)
+# CSS that draws icons itself, which an SVG sprite cannot serve
+FA_CSS_USAGE_RE = re.compile(r"""font-family\s*:[^;}]*Font\s*Awesome|content\s*:\s*["']\\f[0-9a-f]{3}""", re.I)
+SCRIPT_RE = re.compile(r"<script\b[^>]*>(.*?)</script>", re.S | re.I)
+STYLE_RE = re.compile(r"<style\b[^>]*>(.*?)</style>", re.S | re.I)
+BODY_OPEN_RE = re.compile(r"<body\b[^>]*>", re.I)
+HEAD_CLOSE_RE = re.compile(r"</head\s*>", re.I)
+# The sprite trim_icons inserts, found again when a trimmed page gets new icons
+SPRITE_RE = re.compile(r"""<svg\b[^>]*display:\s*none[^>]*>(?=<symbol id="fa-icon-)(.*?)</svg>""", re.S | re.I)
+SPRITE_SYMBOL_RE = re.compile(r'<symbol id="fa-icon-([\w-]+)"')
+FA_STYLESHEET = '<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css">'
+
+# Classes that style an icon rather than name it
+FA_MODIFIERS = {
+    "fa", "fas", "far", "fab", "fal", "fat", "fad", "fa-solid", "fa-regular", "fa-brands", "fa-light", "fa-thin",
+    "fa-duotone", "fa-xs", "fa-sm", "fa-lg", "fa-xl", "fa-2xl", "fa-fw", "fa-spin", "fa-pulse", "fa-beat",
+    "fa-fade", "fa-bounce", "fa-flip", "fa-shake", "fa-border", "fa-pull-left", "fa-pull-right", "fa-li", "fa-ul",
+    "fa-stack", "fa-stack-1x", "fa-stack-2x", "fa-inverse", "fa-rotate-90", "fa-rotate-180", "fa-rotate-270",
+    "fa-flip-horizontal", "fa-flip-vertical", "fa-flip-both",
+} | {f"fa-{n}x" for n in range(1, 11)}
+ICON_CSS_RULES = (
+    ".fa-svg{display:inline-block;width:1.25em;height:1em;vertical-align:-.125em;fill:currentColor;overflow:visible}",
+    ".fa-xs{font-size:.75em}", ".fa-sm{font-size:.875em}", ".fa-lg{font-size:1.25em}", ".fa-xl{font-size:1.5em}",
+    ".fa-2xl{font-size:2em}",
+    *(f".fa-{n}x{{font-size:{n}em}}" for n in range(1, 11)),
+    ".fa-fw{text-align:center;width:1.25em}",
+    ".fa-spin .fa-svg,.fa-pulse .fa-svg{animation:fa-spin 2s linear infinite}",
+    "@keyframes fa-spin{to{transform:rotate(360deg)}}",
+)
+ICON_CSS = "".join(ICON_CSS_RULES)
+
+GOOGLE_FONTS_URL_RE = re.compile(r"""https?://fonts\.googleapis\.com/css2\?[^"')\s]+""")
+FONT_WEIGHT_RE = re.compile(r"font-weight\s*:\s*([^;}!]+)", re.I)
+FONT_SHORTHAND_WEIGHT_RE = re.compile(r"(?<![-\w])font\s*:\s*(?:[^;}]*?\s)?(bold|[1-9]00)\s", re.I)
+WEIGHT_KEYWORDS = {"normal": 400, "bold": 700, "bolder": 700, "lighter": 300}
+# Elements browsers render bold by default
+BOLD_ELEMENTS_RE = re.compile(r"<(h[1-6]|strong|b|th)\b", re.I)
+PRECONNECT_HREF_RE = re.compile(r"""<link\b[^>]*rel\s*=\s*["']preconnect["'][^>]*href\s*=\s*["']([^"']+?)/?["']""", re.I)
+PRECONNECTS = {
+    "https://fonts.googleapis.com": '<link rel="preconnect" href="https://fonts.googleapis.com">',
+    "https://fonts.gstatic.com": '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>',
+}
+
+
+def icon_names(class_value):
+    """Return the icon names (without the fa- prefix) in a class attribute"""
+    return [
+        name[3:] for name in class_value.split()
+        if name.startswith("fa-") and name not in FA_MODIFIERS
+    ]
+
+
+def _symbol(name):
+    width, path = ICONS[name]
+    return (
+        f'<symbol id="fa-icon-{name}" viewBox="0 -1536 {width} 1792">'
+        f'<path transform="scale(1,-1)" d="{path}"/></symbol>'
+    )
+
+
+def _insert_in_head(html_content, markup):
+    head_close = HEAD_CLOSE_RE.search(html_content)
+    if head_close:
+        return html_content[:head_close.start()] + markup + html_content[head_close.start():]
+    return markup + html_content
+
+
+def trim_icons(html_content):
+    """Replace the Font Awesome stylesheet with an inline sprite; returns (html, icons_inlined)
+
+    On a page that already has a sprite and no stylesheet, only the icons not
+    yet converted are handled: they are added to the sprite, or, if the
+    sprite cannot serve them, the stylesheet is added back.
+    """
+    stylesheet = FA_STYLESHEET_RE.search(html_content)
+    sprite = None if stylesheet else SPRITE_RE.search(html_content)
+    if not stylesheet and not sprite:
+        return html_content, []
+
+    # Icons already converted hold an <svg>, so only empty icon elements are left to do
+    used = []
+    for match in ICON_ELEMENT_RE.finditer(html_content):
+        for name in icon_names(match.group(4)):
+            if name not in used:
+                used.append(name)
+    if not used:
+        return html_content, []
+
+    scripts = "\n".join(SCRIPT_RE.findall(html_content))
+    needs_stylesheet = (
+        bool(FA_SCRIPT_RE.search(html_content))
+        or any(FA_CSS_USAGE_RE.search(css) for css in STYLE_RE.findall(html_content))
+        or any(name not in ICONS for name in used)
+        # A script that adds or swaps icon classes at runtime, which the sprite would not follow
+        or bool(re.search(r"\bfa-(?:%s)\b" % "|".join(re.escape(name) for name in ICONS), scripts))
+    )
+    if needs_stylesheet:
+        if sprite:
+            # The stylesheet was trimmed away earlier; the new icons would render blank without it
+            html_content = _insert_in_head(html_content, FA_STYLESHEET)
+        return html_content, []
+
+    def replace_icon(match):
+        names = icon_names(match.group(4))
+        if not names:
+            return match.group(0)
+        tag, attributes = match.group(1), match.group(2)
+        if "aria-hidden" not in attributes.lower():
+            attributes += ' aria-hidden="true"'
+        return f'<{tag}{attributes}><svg class="fa-svg"><use href="#fa-icon-{names[0]}"></use></svg></{tag}>'
+
+    html_content = ICON_ELEMENT_RE.sub(replace_icon, html_content)
+    if sprite:
+        # Found again, as replacing icons ahead of it moved it
+        sprite = SPRITE_RE.search(html_content)
+        existing = set(SPRITE_SYMBOL_RE.findall(sprite.group(1)))
+        symbols = "".join(_symbol(name) for name in used if name not in existing)
+        html_content = html_content[:sprite.end(1)] + symbols + html_content[sprite.end(1):]
+        # The optimizer drops the modifier rules (.fa-lg, ...) the page did not use at the time
+        missing = "".join(rule for rule in ICON_CSS_RULES if rule not in html_content)
+        return (_insert_in_head(html_content, f"<style>{missing}</style>") if missing else html_content), used
+
+    style = f"<style>{ICON_CSS}</style>"
+    html_content = FA_STYLESHEET_RE.sub("", html_content, count=1)
+    sprite = (
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">'
+        + "".join(_symbol(name) for name in used) + "</svg>"
+    )
+    body = BODY_OPEN_RE.search(html_content)
+    if body:
+        html_content = html_content[:body.end()] + sprite + html_content[body.end():]
+    else:
+        html_content = sprite + html_content
+    return _insert_in_head(html_content, style), used
+
+
+def used_font_weights(html_content):
+    """Return the set of numeric font weights the page's CSS asks for, or None if unknown"""
+    css = "\n".join(STYLE_RE.findall(html_content))
+    css += "\n" + "\n".join(re.findall(r"""\sstyle\s*=\s*["']([^"']*)["']""", html_content, re.I))
+    weights = {400}
+    if BOLD_ELEMENTS_RE.search(html_content):
+        weights.add(700)
+    for value in FONT_WEIGHT_RE.findall(css):
+        value = value.strip().lower()
+        if value in WEIGHT_KEYWORDS:
+            weights.add(WEIGHT_KEYWORDS[value])
+        elif value.isdigit():
+            weights.add(int(value))
+        elif value not in ("inherit", "initial", "unset", "revert"):
+            # e.g. var(--weight): the weight is decided elsewhere
+            return None
+    for value in FONT_SHORTHAND_WEIGHT_RE.findall(css):
+        weights.add(WEIGHT_KEYWORDS.get(value.lower()) or int(value))
+    return weights
+
+
+def _trim_family(family, weights):
+    # "Poppins:wght@300;400;700" -> keep the offered weights closest to each used one
+    name, _, axes = family.partition(":")
+    if not axes.startswith("wght@"):
+        return family, 0
+    offered = [int(w) for w in axes[len("wght@"):].split(";") if w.isdigit()]
+    if not offered:
+        return family, 0
+    kept = sorted({min(offered, key=lambda w: (abs(w - used), w)) for used in weights})
+    return f"{name}:wght@{';'.join(str(w) for w in kept)}", len(offered) - len(kept)
+
+
+def rewrite_font_url(url, weights):
+    """Return (url, weights_removed) for url requesting only weights, with display=swap
+
+    weights=None keeps every weight and only adds display=swap.
+    """
+    parts = urlsplit(url.replace("&amp;", "&"))
+    query, removed = [], 0
+    for key, value in parse_qsl(parts.query, keep_blank_values=True):
+        if key == "family" and weights:
+            value, dropped = _trim_family(value, weights)
+            removed += dropped
+        if key != "display":
+            query.append((key, value))
+    query.append(("display", "swap"))
+    rewritten = urlunsplit(parts._replace(query=urlencode(query, safe=":@;,+", quote_via=quote)))
+    return (rewritten.replace("&", "&amp;") if "&amp;" in url else rewritten), removed
+
+
+def trim_fonts(html_content):
+    """Request only used font weights with display=swap; returns (html, weights_removed)"""
+    urls = GOOGLE_FONTS_URL_RE.findall(html_content)
+    if not urls:
+        return html_content, 0
+    weights = used_font_weights(html_content)
+    removed = 0
+    for url in set(urls):
+        rewritten, dropped = rewrite_font_url(url, weights)
+        removed += dropped
+        html_content = html_content.replace(url, rewritten)
+
+    preconnected = set(PRECONNECT_HREF_RE.findall(html_content))
+    missing = [hint for origin, hint in PRECONNECTS.items() if origin not in preconnected]
+    head_close = HEAD_CLOSE_RE.search(html_content)
+    if missing and head_close:
+        # Hints go before the first font request so both connections open as early as possible
+        first_url = html_content.find("https://fonts.googleapis.com/css2", 0, head_close.start())
+        insert_at = html_content.rfind("<", 0, first_url) if first_url >= 0 else head_close.start()
+        html_content = html_content[:insert_at] + "".join(missing) + html_content[insert_at:]
+    return html_content, removed
+
+
+def trim_assets(html_content):
+    """Apply trim_icons and trim_fonts; returns (html, stats)"""
+    html_content, icons = trim_icons(html_content)
+    html_content, weights_removed = trim_fonts(html_content)
+    return html_content, {"icons_inlined": len(icons), "font_weights_removed": weights_removed}
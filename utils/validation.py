@@ -0,0 +1,104 @@
+"""Cheap, cached API key validation
+
+Each provider is checked with a single model-metadata lookup instead of an
+inference call. Results are cached per hashed key with a TTL in a bounded
+LRU, and checks can run on a background thread so the sidebar never blocks
+on them.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.clients import hash_api_key
+from utils.providers import get_provider
+
+VALID_TTL = 3600
+# Failures expire quickly so a fixed key or restored quota is picked up soon
+INVALID_TTL = 60
+MAX_CACHED_RESULTS = 256
+
+# LRU like utils.cache's memory tier: most recently used at the end
+_results = OrderedDict()
+# Only in-flight checks; each removes itself when done
+_pending = {}
+_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="key-validation")
+
+
+def _check_key(api_key, provider, model):
+    try:
+        get_provider(provider).check_key(api_key, model)
+        return True, "API key is valid"
+    except Exception as e:
+        return False, f"API key validation failed: {str(e)}"
+
+
+def _cache_key(api_key, provider, model):
+    return (provider, hash_api_key(api_key), model)
+
+
+def _expired(result, now):
+    is_valid, _, checked_at = result
+    return now - checked_at > (VALID_TTL if is_valid else INVALID_TTL)
+
+
+def _remember(key, result):
+    # Caller holds the lock
+    _results[key] = result
+    _results.move_to_end(key)
+    now = time.monotonic()
+    for stale in [k for k, r in _results.items() if _expired(r, now)]:
+        del _results[stale]
+    while len(_results) > MAX_CACHED_RESULTS:
+        _results.popitem(last=False)
+
+
+def get_cached_validation(api_key, provider, model):
+    """Return a cached (is_valid, message) that has not expired, or None"""
+    key = _cache_key(api_key, provider, model)
+    with _lock:
+        cached = _results.get(key)
+        if cached is None:
+            return None
+        if _expired(cached, time.monotonic()):
+            del _results[key]
+            return None
+        _results.move_to_end(key)
+    is_valid, message, _ = cached
+    return is_valid, message
+
+
+def validate_api_key(api_key, provider, model, force=False):
+    """Return (is_valid, message), using the cache unless force is set"""
+    if not force:
+        cached = get_cached_validation(api_key, provider, model)
+        if cached is not None:
+            return cached
+    is_valid, message = _check_key(api_key, provider, model)
+    with _lock:
+        _remember(_cache_key(api_key, provider, model), (is_valid, message, time.monotonic()))
+    return is_valid, message
+
+
+def validate_api_key_async(api_key, provider, model, force=False):
+    """Start validation on a background thread and return its Future
+
+    Concurrent requests for the same key share one in-flight check.
+    """
+    key = _cache_key(api_key, provider, model)
+    with _lock:
+        future = _pending.get(key)
+        if future is not None and not future.done():
+            return future
+        future = _executor.submit(validate_api_key, api_key, provider, model, force)
+        _pending[key] = future
+    # Outside the lock: the callback runs right away if the check already finished
+    future.add_done_callback(lambda done: _forget_pending(key, done))
+    return future
+
+
+def _forget_pending(key, future):
+    with _lock:
+        if _pending.get(key) is future:
+            del _pending[key]
@@ -0,0 +1,114 @@
+"""Concurrent design variants
+
+Instead of one generation per click, the same profile is generated in
+several designs at once (other color schemes or other layouts) so they can
+be compared side by side. The prompt payload puts the design last, so all
+variants share the system prompt and the profile JSON as a common prefix.
+The number of variants is capped so their estimated combined input and
+output tokens stay under a total budget.
+"""
+import contextvars
+import copy
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from utils.ai_generator import generate_portfolio_html
+from utils.prompts import build_prompt
+from utils.routing import estimate_output_tokens
+from utils.templates import get_color_schemes, get_layout_styles
+
+MAX_VARIANTS = 4
+VARIANT_TOKEN_BUDGET = int(os.environ.get("PORTFOLIO_VARIANT_TOKEN_BUDGET", "60000"))
+
+VARY_SCHEME = "scheme"
+VARY_LAYOUT = "layout"
+
+
+def variant_designs(data, vary=VARY_SCHEME, count=3):
+    """Return up to count (label, design) pairs, starting with the current design"""
+    design = data.get("design", {})
+    if vary == VARY_LAYOUT:
+        current = design.get("layout")
+        options = [current] + [layout for layout in get_layout_styles() if layout != current]
+        return [(layout, dict(design, layout=layout)) for layout in options[:count]]
+    schemes = get_color_schemes()
+    current = design.get("theme")
+    options = [current] + [theme for theme in schemes if theme != current]
+    return [
+        (theme, dict(design, theme=theme, color_scheme=schemes.get(theme, design.get("color_scheme"))))
+        for theme in options[:count]
+    ]
+
+
+def variant_cost(data):
+    """Estimated tokens (input plus output) for one variant of data"""
+    _, _, report = build_prompt(data)
+    return report["input_tokens"] + estimate_output_tokens(data)
+
+
+def plan_variants(data, vary=VARY_SCHEME, count=3, budget=VARIANT_TOKEN_BUDGET):
+    """Return (variants, plan) where variants is a list of (label, data)
+
+    count is lowered until the estimated total fits budget (at least one
+    variant is always planned). plan reports the requested and planned
+    counts and the estimated tokens.
+    """
+    requested = max(1, min(count, MAX_VARIANTS))
+    variants = []
+    for label, design in variant_designs(data, vary, requested):
+        variant = copy.deepcopy(data)
+        variant["design"] = design
+        variants.append((label, variant))
+    costs = [variant_cost(variant) for _, variant in variants]
+    while len(variants) > 1 and sum(costs) > budget:
+        variants.pop()
+        costs.pop()
+    plan = {
+        "requested": requested,
+        "planned": len(variants),
+        "estimated_tokens": sum(costs),
+        "budget": budget,
+    }
+    return variants, plan
+
+
+def generate_variants(data, api_key, provider, model, vary=VARY_SCHEME, count=3, budget=VARIANT_TOKEN_BUDGET,
+                      refresh_cache=False, on_progress=None):
+    """Generate the planned variants concurrently
+
+    on_progress(label, done, total) is called from the calling thread as each
+    variant finishes. Returns (results, plan); each result is a dict with
+    label, design, html (None on failure), error and seconds, in plan order.
+    Raises only if every variant failed.
+    """
+    variants, plan = plan_variants(data, vary, count, budget)
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+        futures = {
+            # Each variant runs in a copy of this context, so the caller's cancel scope applies to it
+            executor.submit(
+                contextvars.copy_context().run, _generate_one, variant, api_key, provider, model, refresh_cache
+            ): label
+            for label, variant in variants
+        }
+        for future in as_completed(futures):
+            label = futures[future]
+            results[label] = future.result()
+            if on_progress:
+                on_progress(label, len(results), len(variants))
+
+    ordered = [dict(results[label], label=label, design=variant["design"]) for label, variant in variants]
+    if all(result["html"] is None for result in ordered):
+        raise Exception(f"Error generating variants: {'; '.join(result['error'] for result in ordered)}")
+    return ordered, plan
+
+
+def _generate_one(data, api_key, provider, model, refresh_cache):
+    started = time.monotonic()
+    try:
+        html_content = generate_portfolio_html(data, api_key, provider, model, refresh_cache=refresh_cache)
+        error = None
+    except Exception as e:
+        html_content, error = None, str(e)
+    return {"html": html_content, "error": error, "seconds": round(time.monotonic() - started, 3)}